@@ -1,5 +1,5 @@
 from ragas.adaptation import adapt
-from ragas.evaluation import evaluate
+from ragas.evaluation import aevaluate, evaluate
 from ragas.run_config import RunConfig
 
 try:
@@ -8,4 +8,4 @@ except ImportError:
     __version__ = "unknown version"
 
 
-__all__ = ["evaluate", "adapt", "RunConfig", "__version__"]
+__all__ = ["evaluate", "aevaluate", "adapt", "RunConfig", "__version__"]
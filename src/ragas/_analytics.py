@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 import json
 import logging
 import os
@@ -123,6 +124,18 @@ def track_was_completed(func: t.Callable[P, T]) -> t.Callable[P, T]:  # pragma:
     Track if the function was completed. This helps us understand failure cases and improve the user experience. Disable tracking by setting the environment variable RAGAS_DO_NOT_TRACK to True as usual.
     """
 
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> t.Any:
+            track(IsCompleteEvent(event_type=func.__name__, is_completed=False))
+            result = await func(*args, **kwargs)
+            track(IsCompleteEvent(event_type=func.__name__, is_completed=True))
+
+            return result
+
+        return async_wrapper  # type: ignore[return-value]
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> t.Any:
         track(IsCompleteEvent(event_type=func.__name__, is_completed=False))
@@ -1,7 +1,128 @@
 """Async utils."""
 
 import asyncio
-from typing import Any, Coroutine, List
+import atexit
+import os
+import threading
+from typing import Any, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """
+    An event loop running forever in a daemon thread owned by ragas.
+
+    Sync entry points submit their coroutines to this loop instead of creating
+    a new loop per call, so HTTP clients, caches and other loop bound state
+    survive across calls. Since the loop never runs on the caller's thread it
+    also works when the caller already has a running loop (eg. jupyter)
+    without patching it with nest_asyncio.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running background loop, started on first use."""
+        with self._lock:
+            # threads don't survive a fork so child processes start their own
+            if self._loop is None or self._pid != os.getpid():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_forever():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(
+            target=run_forever, name="ragas-event-loop", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        self._loop = loop
+        self._pid = os.getpid()
+
+    def in_loop_thread(self) -> bool:
+        return (
+            self._thread is not None
+            and self._pid == os.getpid()
+            and threading.current_thread() is self._thread
+        )
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run the coroutine on the background loop and block until it is done.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the ragas event loop from inside it, "
+                "await the coroutine instead."
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            # eg. KeyboardInterrupt, don't leave the coroutine running
+            future.cancel()
+            raise
+
+    def stop(self):
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        async def _shutdown():
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout=5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+
+_background_loop = BackgroundEventLoop()
+atexit.register(_background_loop.stop)
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by all sync entry points of ragas."""
+    return _background_loop.loop
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from sync code on the shared ragas event
+    loop. Works both with and without an event loop running in the caller's
+    thread.
+    """
+    return _background_loop.run(coro)
 
 
 def run_async_tasks(
@@ -12,20 +133,6 @@ def run_async_tasks(
     """Run a list of async tasks."""
     tasks_to_execute: List[Any] = tasks
 
-    # if running in notebook, use nest_asyncio to hijack the event loop
-    try:
-        loop = asyncio.get_running_loop()
-        try:
-            import nest_asyncio
-        except ImportError:
-            raise RuntimeError(
-                "nest_asyncio is required to run async tasks in jupyter. Please install it via `pip install nest_asyncio`."  # noqa
-            )
-        else:
-            nest_asyncio.apply()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-
     # gather tasks to run
     if show_progress:
         from tqdm.asyncio import tqdm
@@ -40,7 +147,7 @@ def run_async_tasks(
             return await asyncio.gather(*tasks_to_execute)
 
     try:
-        outputs: List[Any] = loop.run_until_complete(_gather())
+        outputs: List[Any] = run(_gather())
     except Exception as e:
         # run the operation w/o tqdm on hitting a fatal
         # may occur in some environments where tqdm.asyncio
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+from enum import Enum
+
+from ragas.experimental.llms.prompt import PydanticPrompt
+from ragas.llms.prompt import Prompt
+
+if t.TYPE_CHECKING:
+    from ragas.dataset_schema import BaseEvalSample
+    from ragas.metrics.base import Metric
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def get_prompt_content(prompt: t.Any) -> t.Optional[str]:
+    """
+    Return the text a prompt renders to apart from its inputs, ie. its
+    instruction, output format and examples, or None if `prompt` is not one.
+    """
+    if isinstance(prompt, Prompt):
+        return prompt.to_string()
+    if isinstance(prompt, PydanticPrompt):
+        return "\n".join(
+            [
+                prompt.generate_instruction(),
+                prompt.generate_output_signature(),
+                prompt.generate_examples(),
+            ]
+        )
+    return None
+
+
+def get_metric_config(metric: Metric) -> t.Dict[str, t.Any]:
+    """
+    Return the parts of a metric that change its scores: the metric class, its
+    simple config fields, the models it uses and the content of its prompts
+    (eg. after `adapt()`).
+    """
+    config: t.Dict[str, t.Any] = {
+        "class": f"{type(metric).__module__}.{type(metric).__qualname__}",
+        "name": metric.name,
+    }
+    if dataclasses.is_dataclass(metric):
+        for f in dataclasses.fields(metric):
+            value = getattr(metric, f.name, None)
+            if isinstance(value, Enum):
+                value = value.value
+            if isinstance(value, _PRIMITIVES) or (
+                isinstance(value, tuple)
+                and all(isinstance(v, _PRIMITIVES) for v in value)
+            ):
+                config[f.name] = value
+    for attr in ("llm", "embeddings"):
+        model = getattr(metric, attr, None)
+        if model is not None and hasattr(model, "get_model_name"):
+            config[attr] = model.get_model_name()
+    prompts = {}
+    for attr, value in sorted(vars(metric).items()):
+        content = get_prompt_content(value)
+        if content is not None:
+            prompts[attr] = content
+    if prompts:
+        payload = json.dumps(prompts, sort_keys=True)
+        config["prompts"] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return config
+
+
+def get_metric_key(metric: Metric) -> str:
+    """
+    Hash the config of a metric, computed once per metric and combined with
+    each row by `get_checkpoint_key`.
+    """
+    payload = json.dumps(get_metric_config(metric), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_checkpoint_key(sample: BaseEvalSample, metric_key: str) -> str:
+    """
+    Key a (row, metric) pair by the content of the row and the metric key (see
+    `get_metric_key`).
+    """
+    payload = json.dumps(
+        {"sample": sample.dict(), "metric": metric_key},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EvaluationCheckpoint:
+    """
+    SQLite backed store of completed (row, metric) scores so an interrupted
+    `evaluate()` run can be resumed. Scores are committed in batches, every
+    `commit_every` scores or `commit_interval` seconds, and on `close`. A
+    crash loses at most the last batch. Failed jobs (NaN scores) are not
+    stored so they are retried.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, os.PathLike],
+        commit_every: int = 64,
+        commit_interval: float = 1.0,
+    ):
+        self.path = os.fspath(path)
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self._num_uncommitted = 0
+        self._committed_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores "
+                "(key TEXT PRIMARY KEY, metric TEXT NOT NULL, score TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> t.Optional[t.Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT score FROM scores WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save(self, key: str, metric_name: str, score: t.Any):
+        if hasattr(score, "item"):
+            # numpy scalars
+            score = score.item()
+        if score is None or (isinstance(score, float) and math.isnan(score)):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scores (key, metric, score) VALUES (?, ?, ?)",
+                (key, metric_name, json.dumps(score)),
+            )
+            self._num_uncommitted += 1
+            if (
+                self._num_uncommitted >= self.commit_every
+                or time.monotonic() - self._committed_at >= self.commit_interval
+            ):
+                self._commit()
+
+    def flush(self):
+        """Commit the scores saved since the last commit."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self):
+        self._conn.commit()
+        self._num_uncommitted = 0
+        self._committed_at = time.monotonic()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._conn.close()
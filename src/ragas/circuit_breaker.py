@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ragas.exceptions import CircuitOpenError
+
+if t.TYPE_CHECKING:
+    from ragas.run_config import RunConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Circuit breaker for a single LLM or embeddings endpoint.
+
+    The circuit opens after `failure_threshold` consecutive failed calls and
+    every call then fails fast with `CircuitOpenError` instead of being sent.
+    After `recovery_time` seconds it half-opens and lets `half_open_probes`
+    calls through, the circuit closes again if a probe succeeds and re-opens if
+    it fails.
+
+    Parameters
+    ----------
+    endpoint : str
+        Name of the endpoint, used in errors and logs.
+    failure_threshold : int
+        Number of consecutive failures that open the circuit, by default 5.
+    recovery_time : float
+        Seconds the circuit stays open before probing, by default 30.
+    half_open_probes : int
+        Number of concurrent probe calls when half-open, by default 1.
+    """
+
+    endpoint: str
+    failure_threshold: int = 5
+    recovery_time: float = 30.0
+    half_open_probes: int = 1
+    state: CircuitState = field(default=CircuitState.CLOSED, init=False)
+    consecutive_failures: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self._opened_at = float("-inf")
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN
+
+    def allows_request(self) -> bool:
+        """
+        Return whether a call would be let through right now, half-opening the
+        circuit once `recovery_time` has passed. Unlike `before_call` it does
+        not take a probe slot.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self.state == CircuitState.OPEN:
+                return False
+            if self.state == CircuitState.HALF_OPEN:
+                return self._probes_in_flight < self.half_open_probes
+            return True
+
+    def before_call(self):
+        """Raise `CircuitOpenError` if the call should not be sent."""
+        with self._lock:
+            self._maybe_half_open()
+            if self.state == CircuitState.OPEN:
+                raise CircuitOpenError(self.endpoint)
+            if self.state == CircuitState.HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    raise CircuitOpenError(self.endpoint)
+                self._probes_in_flight += 1
+
+    def _maybe_half_open(self):
+        """Half-open an open circuit once `recovery_time` has passed."""
+        if (
+            self.state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_time
+        ):
+            self.state = CircuitState.HALF_OPEN
+            logger.info("circuit for %s is half-open, probing", self.endpoint)
+
+    def _release_probe(self):
+        self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def on_success(self):
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                self._release_probe()
+                logger.info("circuit for %s is closed again", self.endpoint)
+            self.state = CircuitState.CLOSED
+            self.consecutive_failures = 0
+
+    def on_failure(self, exc: t.Optional[BaseException] = None):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == CircuitState.HALF_OPEN:
+                self._release_probe()
+                self._open()
+            elif (
+                self.state == CircuitState.CLOSED
+                and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def on_cancel(self):
+        """The call was cancelled before it finished, eg. by a timeout."""
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                self._release_probe()
+
+    def _open(self):
+        self.state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        logger.warning(
+            "circuit for %s opened after %s consecutive failures",
+            self.endpoint,
+            self.consecutive_failures,
+        )
+
+
+def get_circuit_breaker(
+    endpoint: str, run_config: RunConfig
+) -> t.Optional[CircuitBreaker]:
+    """
+    Return the circuit breaker shared by every caller of `endpoint` within the
+    run, or None if circuit breaking is not enabled in `run_config`.
+    """
+    if run_config.circuit_breaker_threshold is None:
+        return None
+
+    with run_config._circuit_breakers_lock:
+        if endpoint not in run_config.circuit_breakers:
+            run_config.circuit_breakers[endpoint] = CircuitBreaker(
+                endpoint=endpoint,
+                failure_threshold=run_config.circuit_breaker_threshold,
+                recovery_time=run_config.circuit_breaker_recovery_time,
+            )
+        return run_config.circuit_breakers[endpoint]
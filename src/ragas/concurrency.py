@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+from collections import deque
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+OVERLOAD_ERROR_NAMES = {"RateLimitError", "APITimeoutError", "Timeout", "TimeoutError"}
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """
+    Return whether the exception signals that the provider is overloaded, ie.
+    a rate limit (HTTP 429) or a timeout.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return any(cls.__name__ in OVERLOAD_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+@dataclass
+class ConcurrencyAdjustment:
+    timestamp: float
+    limit: float
+    reason: str
+
+
+@dataclass
+class AIMDConcurrencyController:
+    """
+    Additive-increase/multiplicative-decrease controller for the number of
+    concurrent workers.
+
+    The limit grows by roughly one worker for every `limit` successful calls as
+    long as the latency is stable and is multiplied by `decrease_factor` when a
+    rate limit or timeout is observed. Decreases are applied at most once every
+    `cooldown` seconds so a burst of failures only counts once.
+
+    Parameters
+    ----------
+    max_workers : float
+        Upper bound for the limit, by default no bound.
+    min_workers : int
+        Lower bound for the limit, by default 1.
+    initial_workers : float, optional
+        Starting limit, by default half of `max_workers`.
+    decrease_factor : float
+        Factor the limit is multiplied by on overload, by default 0.5.
+    latency_tolerance : float
+        A success only increases the limit if its latency is below
+        `latency_tolerance` times the moving average latency, by default 2.
+    cooldown : float
+        Minimum time in seconds between two decreases, by default 1.
+    """
+
+    max_workers: float = float("inf")
+    min_workers: int = 1
+    initial_workers: t.Optional[float] = None
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    cooldown: float = 1.0
+    history_size: int = 1000
+    history: t.Deque[ConcurrencyAdjustment] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.initial_workers is None:
+            self.initial_workers = (
+                16 if self.max_workers == float("inf") else self.max_workers / 2
+            )
+        self._limit = min(
+            max(float(self.initial_workers), self.min_workers), self.max_workers
+        )
+        self._avg_latency: t.Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self.history = deque(maxlen=self.history_size)
+        self._record("init")
+
+    @property
+    def limit(self) -> int:
+        """Current number of workers allowed to run concurrently."""
+        return max(self.min_workers, int(self._limit))
+
+    def _record(self, reason: str):
+        self.history.append(
+            ConcurrencyAdjustment(
+                timestamp=time.time(), limit=self._limit, reason=reason
+            )
+        )
+
+    def on_success(self, latency: float):
+        with self._lock:
+            stable = (
+                self._avg_latency is None
+                or latency <= self.latency_tolerance * self._avg_latency
+            )
+            self._avg_latency = (
+                latency
+                if self._avg_latency is None
+                else 0.9 * self._avg_latency + 0.1 * latency
+            )
+            if not stable or self._limit >= self.max_workers:
+                return
+            previous = self.limit
+            self._limit = min(self.max_workers, self._limit + 1 / self._limit)
+            if self.limit != previous:
+                self._record("increase")
+
+    def on_overload(self, exc: t.Optional[BaseException] = None):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(self.min_workers, self._limit * self.decrease_factor)
+            reason = "decrease" if exc is None else f"decrease: {type(exc).__name__}"
+            self._record(reason)
+            logger.debug("reducing concurrency to %s (%s)", self.limit, reason)
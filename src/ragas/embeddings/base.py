@@ -4,6 +4,7 @@ import asyncio
 import typing as t
 from abc import ABC
 from dataclasses import field
+from functools import partial
 from typing import List
 
 import numpy as np
@@ -11,13 +12,17 @@ from langchain_core.embeddings import Embeddings
 from langchain_openai.embeddings import OpenAIEmbeddings
 from pydantic.dataclasses import dataclass
 
+from ragas.rate_limiter import estimate_tokens, get_rate_limiter
 from ragas.run_config import RunConfig, add_async_retry, add_retry
+from ragas.single_flight import SingleFlight
 
 if t.TYPE_CHECKING:
     from llama_index.core.base.embeddings.base import BaseEmbedding
 
 DEFAULT_MODEL_NAME = "BAAI/bge-small-en-v1.5"
 
+_in_flight_embeddings = SingleFlight()
+
 
 class BaseRagasEmbeddings(Embeddings, ABC):
     run_config: RunConfig
@@ -29,21 +34,47 @@ class BaseRagasEmbeddings(Embeddings, ABC):
     async def embed_texts(
         self, texts: List[str], is_async: bool = True
     ) -> t.List[t.List[float]]:
+        embed_texts = partial(self._embed_texts, texts, is_async=is_async)
+        if not self.run_config.deduplicate_requests:
+            return await embed_texts()
+        # identical requests in flight share a single call
+        return await _in_flight_embeddings.do((id(self), tuple(texts)), embed_texts)
+
+    async def _embed_texts(
+        self, texts: List[str], is_async: bool
+    ) -> t.List[t.List[float]]:
+        # every attempt waits for the rate limits, see add_async_retry
+        num_tokens = 0
+        if get_rate_limiter(self.get_model_name(), self.run_config) is not None:
+            num_tokens = sum(
+                estimate_tokens(text, self.get_model_name()) for text in texts
+            )
+
         if is_async:
             aembed_documents_with_retry = add_async_retry(
-                self.aembed_documents, self.run_config
+                self.aembed_documents,
+                self.run_config,
+                endpoint=self.get_model_name(),
+                num_tokens=num_tokens,
             )
             return await aembed_documents_with_retry(texts)
         else:
             loop = asyncio.get_event_loop()
             embed_documents_with_retry = add_retry(
-                self.embed_documents, self.run_config
+                self.embed_documents,
+                self.run_config,
+                endpoint=self.get_model_name(),
+                num_tokens=num_tokens,
             )
             return await loop.run_in_executor(None, embed_documents_with_retry, texts)
 
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
 
+    def get_model_name(self) -> str:
+        """Return the name of the model, used to share per model state."""
+        return type(self).__name__
+
 
 class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
     def __init__(
@@ -54,6 +85,12 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
             run_config = RunConfig()
         self.set_run_config(run_config)
 
+    def get_model_name(self) -> str:
+        model_name = getattr(self.embeddings, "model", None)
+        if isinstance(model_name, str) and model_name:
+            return model_name
+        return type(self.embeddings).__name__
+
     def embed_query(self, text: str) -> List[float]:
         return self.embeddings.embed_query(text)
 
@@ -125,6 +162,9 @@ class HuggingfaceEmbeddings(BaseRagasEmbeddings):
         if "convert_to_tensor" not in self.encode_kwargs:
             self.encode_kwargs["convert_to_tensor"] = True
 
+    def get_model_name(self) -> str:
+        return self.model_name
+
     def embed_query(self, text: str) -> List[float]:
         return self.embed_documents([text])[0]
 
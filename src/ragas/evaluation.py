@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
 import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -10,7 +16,13 @@ from langchain_core.embeddings import Embeddings as LangchainEmbeddings
 from langchain_core.language_models import BaseLanguageModel as LangchainLLM
 
 from ragas._analytics import EvaluationEvent, track, track_was_completed
+from ragas.async_utils import run
 from ragas.callbacks import new_group
+from ragas.checkpoint import (
+    EvaluationCheckpoint,
+    get_checkpoint_key,
+    get_metric_key,
+)
 from ragas.cost import TokenUsage
 from ragas.dataset_schema import EvaluationDataset, MultiTurnSample, SingleTurnSample
 from ragas.embeddings.base import (
@@ -23,6 +35,7 @@ from ragas.executor import Executor
 from ragas.integrations.helicone import helicone_config
 from ragas.llms import llm_factory
 from ragas.llms.base import BaseRagasLLM, LangchainLLMWrapper
+from ragas.llms.cache import CachedLLM
 from ragas.metrics._answer_correctness import AnswerCorrectness
 from ragas.metrics.base import (
     Metric,
@@ -30,7 +43,9 @@ from ragas.metrics.base import (
     MetricWithLLM,
     MultiTurnMetric,
     SingleTurnMetric,
+    is_cpu_bound,
     is_reproducable,
+    score_single_turn_samples,
 )
 from ragas.metrics.critique import AspectCritique
 from ragas.run_config import RunConfig
@@ -51,6 +66,8 @@ if t.TYPE_CHECKING:
 
     from ragas.cost import CostCallbackHandler, TokenUsageParser
 
+logger = logging.getLogger(__name__)
+
 RAGAS_EVALUATION_CHAIN_NAME = "ragas evaluation"
 
 
@@ -66,6 +83,9 @@ def evaluate(
     token_usage_parser: t.Optional[TokenUsageParser] = None,
     raise_exceptions: bool = False,
     column_map: t.Optional[t.Dict[str, str]] = None,
+    shard_index: t.Optional[int] = None,
+    num_shards: t.Optional[int] = None,
+    checkpoint: t.Optional[t.Union[str, os.PathLike]] = None,
 ) -> Result:
     """
     Run the evaluation on the dataset with different metrics
@@ -109,6 +129,18 @@ def evaluate(
         the dataset are different from the default ones then you can provide the
         mapping as a dictionary here. Example: If the dataset column name is contexts_v1,
         column_map can be given as {"contexts":"contexts_v1"}
+    shard_index : int, optional
+        The shard of the dataset to evaluate, used together with `num_shards` to
+        split one evaluation across several processes or machines. Every shard
+        gets a contiguous block of rows and the partial results can be combined
+        with `Result.merge`.
+    num_shards : int, optional
+        The total number of shards the dataset is split into.
+    checkpoint : str or os.PathLike, optional
+        Path to a SQLite file where every (row, metric) score is saved as soon as
+        it is computed. Re-running the evaluation with the same checkpoint only
+        scores the rows and metrics that are missing, so an interrupted run can
+        be resumed. Scores are keyed by the row content and the metric config.
 
     Returns
     -------
@@ -141,6 +173,55 @@ def evaluate(
     'answer_relevancy': 0.874}
     ```
     """
+    return run(
+        # the undecorated coroutine, the run is tracked once as evaluate
+        aevaluate.__wrapped__(  # type: ignore[attr-defined]
+            dataset=dataset,
+            metrics=metrics,
+            llm=llm,
+            embeddings=embeddings,
+            callbacks=callbacks,
+            in_ci=in_ci,
+            run_config=run_config,
+            token_usage_parser=token_usage_parser,
+            raise_exceptions=raise_exceptions,
+            column_map=column_map,
+            shard_index=shard_index,
+            num_shards=num_shards,
+            checkpoint=checkpoint,
+        )
+    )
+
+
+@track_was_completed
+async def aevaluate(
+    dataset: t.Union[Dataset, EvaluationDataset],
+    metrics: list[Metric] | None = None,
+    llm: t.Optional[BaseRagasLLM | LangchainLLM] = None,
+    embeddings: t.Optional[BaseRagasEmbeddings | LangchainEmbeddings] = None,
+    callbacks: Callbacks = None,
+    in_ci: bool = False,
+    run_config: RunConfig = RunConfig(),
+    token_usage_parser: t.Optional[TokenUsageParser] = None,
+    raise_exceptions: bool = False,
+    column_map: t.Optional[t.Dict[str, str]] = None,
+    shard_index: t.Optional[int] = None,
+    num_shards: t.Optional[int] = None,
+    checkpoint: t.Optional[t.Union[str, os.PathLike]] = None,
+) -> Result:
+    """
+    Async version of `evaluate` that runs on the caller's event loop, so the
+    evaluation can share the loop (and its HTTP clients) of an async service
+    without blocking it. Takes the same arguments as `evaluate`.
+
+    Examples
+    --------
+    ```
+    from ragas import aevaluate
+
+    >>> result = await aevaluate(dataset)
+    ```
+    """
     column_map = column_map or {}
     callbacks = callbacks or []
 
@@ -177,6 +258,14 @@ def evaluate(
         validate_required_columns(dataset, metrics)
         validate_supported_metrics(dataset, metrics)
 
+    # only evaluate the rows of this shard
+    row_indices: t.Optional[t.List[int]] = None
+    if shard_index is not None or num_shards is not None:
+        if shard_index is None or num_shards is None:
+            raise ValueError("shard_index and num_shards must be provided together")
+        row_indices = get_shard_indices(len(dataset), shard_index, num_shards)
+        dataset = EvaluationDataset(samples=[dataset[i] for i in row_indices])
+
     # set the llm and embeddings
     if isinstance(llm, LangchainLLM):
         llm = LangchainLLMWrapper(llm, run_config=run_config)
@@ -250,6 +339,34 @@ def evaluate(
     )
 
     sample_type = dataset.get_sample_type()
+
+    # CPU-bound metrics are scored in chunks on a process pool, if enabled
+    cpu_bound_metrics: t.List[SingleTurnMetric] = []
+    process_pool: t.Optional[ProcessPoolExecutor] = None
+    if run_config.cpu_workers != 0 and sample_type == SingleTurnSample:
+        cpu_bound_metrics = [
+            t.cast(SingleTurnMetric, m) for m in metrics if is_cpu_bound(m)
+        ]
+    # rows (and their checkpoint keys) still to be scored by each CPU-bound metric
+    cpu_bound_rows: t.List[t.List[t.Tuple[int, t.Optional[str]]]] = [
+        [] for _ in cpu_bound_metrics
+    ]
+
+    # scores of a previous run are restored from the checkpoint
+    evaluation_checkpoint = (
+        EvaluationCheckpoint(checkpoint) if checkpoint is not None else None
+    )
+    # the metric part of the checkpoint keys, the same for every row
+    metric_keys = (
+        [get_metric_key(m) for m in metrics]
+        if evaluation_checkpoint is not None
+        else [None] * len(metrics)
+    )
+    scores = [{m.name: np.nan for m in metrics} for _ in range(len(dataset))]
+    num_restored = 0
+
+    # the (row, metric, checkpoint key) each submitted job is scoring
+    job_slots: t.List[t.List[t.Tuple[int, str, t.Optional[str]]]] = []
     for i, sample in enumerate(dataset):
         row = t.cast(t.Dict[str, t.Any], sample.dict())
         row_rm, row_group_cm = new_group(
@@ -258,46 +375,126 @@ def evaluate(
             callbacks=evaluation_group_cm,
         )
         row_run_managers.append((row_rm, row_group_cm))
-        if sample_type == SingleTurnSample:
-            _ = [
+        if sample_type not in (SingleTurnSample, MultiTurnSample):
+            raise ValueError(f"Unsupported sample type {sample_type}")
+
+        for metric, metric_key in zip(metrics, metric_keys):
+            if sample_type == SingleTurnSample and not isinstance(
+                metric, SingleTurnMetric
+            ):
+                continue
+            if sample_type == MultiTurnSample and not isinstance(
+                metric, MultiTurnMetric
+            ):
+                continue
+
+            key = None
+            if evaluation_checkpoint is not None and metric_key is not None:
+                key = get_checkpoint_key(sample, metric_key)
+                saved_score = evaluation_checkpoint.get(key)
+                if saved_score is not None:
+                    scores[i][metric.name] = saved_score
+                    num_restored += 1
+                    continue
+
+            cpu_bound_index = next(
+                (j for j, m in enumerate(cpu_bound_metrics) if m is metric), None
+            )
+            if cpu_bound_index is not None:
+                cpu_bound_rows[cpu_bound_index].append((i, key))
+            elif isinstance(metric, SingleTurnMetric):
                 executor.submit(
                     metric.single_turn_ascore,
                     sample,
                     row_group_cm,
                     name=f"{metric.name}-{i}",
                     timeout=run_config.timeout,
+                    expected_cost=metric.expected_llm_calls(sample),
                 )
-                for metric in metrics
-                if isinstance(metric, SingleTurnMetric)
-            ]
-        elif sample_type == MultiTurnSample:
-            _ = [
+                job_slots.append([(i, metric.name, key)])
+            else:
                 executor.submit(
-                    metric.multi_turn_ascore,
+                    t.cast(MultiTurnMetric, metric).multi_turn_ascore,
                     sample,
                     row_group_cm,
                     name=f"{metric.name}-{i}",
                     timeout=run_config.timeout,
+                    expected_cost=metric.expected_llm_calls(sample),
                 )
-                for metric in metrics
-                if isinstance(metric, MultiTurnMetric)
-            ]
-        else:
-            raise ValueError(f"Unsupported sample type {sample_type}")
+                job_slots.append([(i, metric.name, key)])
+
+    num_cpu_bound_rows = max((len(rows) for rows in cpu_bound_rows), default=0)
+    if num_cpu_bound_rows > 0:
+        cpu_workers = (
+            run_config.cpu_workers
+            if run_config.cpu_workers > 0
+            else (os.cpu_count() or 1)
+        )
+        # forking would copy the locks held by the event loop, tqdm and sqlite
+        # threads of this process, the workers could deadlock on them
+        process_pool = ProcessPoolExecutor(
+            max_workers=cpu_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        chunk_size = max(1, min(256, math.ceil(num_cpu_bound_rows / (cpu_workers * 4))))
+        try:
+            for metric, pending_rows in zip(cpu_bound_metrics, cpu_bound_rows):
+                for start in range(0, len(pending_rows), chunk_size):
+                    chunk = pending_rows[start : start + chunk_size]
+                    samples = [t.cast(SingleTurnSample, dataset[i]) for i, _ in chunk]
+                    # the chunks start on the pool right away, concurrently with
+                    # the LLM jobs, their executor jobs only collect the scores
+                    future = process_pool.submit(
+                        score_single_turn_samples, metric, samples
+                    )
+                    executor.submit(
+                        _ascore_in_process_pool,
+                        future,
+                        metric,
+                        samples,
+                        [row_run_managers[i][1] for i, _ in chunk],
+                        raise_exceptions,
+                        name=f"{metric.name}-{chunk[0][0]}-{chunk[-1][0]}",
+                    )
+                    job_slots.append([(i, metric.name, key) for i, key in chunk])
+        except BaseException:
+            # otherwise it is shut down once the results are collected
+            process_pool.shutdown(cancel_futures=True)
+            raise
+
+    # responses served from the cache during this run
+    cached_llms = {
+        id(m.llm): m.llm
+        for m in metrics
+        if isinstance(m, MetricWithLLM) and isinstance(m.llm, CachedLLM)
+    }
+    cache_counts = {key: (llm.hits, llm.misses) for key, llm in cached_llms.items()}
 
-    scores = []
     try:
-        # get the results
-        results = executor.results()
-        if results == []:
+        # get the results as they finish so they can be checkpointed
+        num_results = 0
+        async for index, _, result in executor.aiter_results():
+            num_results += 1
+            slots = job_slots[index]
+            # chunked jobs return one score per row, failed jobs return nan
+            values = result if isinstance(result, list) else [result] * len(slots)
+            for (i, metric_name, key), value in zip(slots, values):
+                scores[i][metric_name] = value
+                if evaluation_checkpoint is not None and key is not None:
+                    evaluation_checkpoint.save(key, metric_name, value)
+        # jobs skipped or cancelled because of the time budget are reported
+        # as incomplete, their scores are None instead of nan
+        incomplete: t.Dict[str, t.List[int]] = {}
+        for index, _ in executor.missing_jobs:
+            for i, metric_name, _ in job_slots[index]:
+                scores[i][metric_name] = None
+                incomplete.setdefault(metric_name, []).append(i)
+        for rows in incomplete.values():
+            rows.sort()
+        if num_results == 0 and num_restored == 0 and not incomplete:
             raise ExceptionInRunner()
 
         # convert results to dataset_like
-        for i, _ in enumerate(dataset):
-            s = {}
-            for j, m in enumerate(metrics):
-                s[m.name] = results[len(metrics) * i + j]
-            scores.append(s)
+        for i, s in enumerate(scores):
             # close the row chain
             row_rm, row_group_cm = row_run_managers[i]
             if not row_group_cm.ended:
@@ -318,6 +515,17 @@ def evaluate(
             dataset = convert_v2_to_v1_dataset(dataset)
 
         cost_cb = ragas_callbacks["cost_cb"] if "cost_cb" in ragas_callbacks else None
+        cache_stats = None
+        if cached_llms:
+            cache_stats = {
+                "hits": sum(
+                    llm.hits - cache_counts[key][0] for key, llm in cached_llms.items()
+                ),
+                "misses": sum(
+                    llm.misses - cache_counts[key][1]
+                    for key, llm in cached_llms.items()
+                ),
+            }
         result = Result(
             scores=Dataset.from_list(scores),
             dataset=dataset,
@@ -326,10 +534,18 @@ def evaluate(
                 t.Union["CostCallbackHandler", None],
                 cost_cb,
             ),
+            row_indices=row_indices,
+            incomplete=incomplete,
+            cache_stats=cache_stats,
         )
         if not evaluation_group_cm.ended:
             evaluation_rm.on_chain_end(result)
     finally:
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=True)
+        if evaluation_checkpoint is not None:
+            evaluation_checkpoint.close()
+
         # reset llms and embeddings if changed
         for i in llm_changed:
             t.cast(MetricWithLLM, metrics[i]).llm = None
@@ -360,22 +576,175 @@ def evaluate(
     return result
 
 
+def get_shard_indices(num_rows: int, shard_index: int, num_shards: int) -> t.List[int]:
+    """
+    Return the rows that belong to a shard. Rows are split into `num_shards`
+    contiguous blocks whose sizes differ by at most one.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards should be at least 1")
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(
+            f"shard_index should be in [0, {num_shards}), got {shard_index}"
+        )
+    if num_shards > num_rows:
+        raise ValueError(
+            f"num_shards ({num_shards}) can't be larger than the number of rows ({num_rows})"
+        )
+    start = shard_index * num_rows // num_shards
+    end = (shard_index + 1) * num_rows // num_shards
+    return list(range(start, end))
+
+
+async def _ascore_in_process_pool(
+    future: Future,
+    metric: SingleTurnMetric,
+    samples: t.List[SingleTurnSample],
+    callbacks: t.List[Callbacks],
+    raise_exceptions: bool,
+) -> t.List[float]:
+    """
+    Collect the scores of a chunk of samples scored with a CPU-bound metric in
+    the process pool.
+    """
+    run_managers = [
+        new_group(metric.name, inputs=sample.dict(), callbacks=cb)
+        for sample, cb in zip(samples, callbacks)
+    ]
+    outputs = await asyncio.wrap_future(future)
+
+    scores = []
+    for (rm, group_cm), output in zip(run_managers, outputs):
+        if isinstance(output, Exception):
+            if not group_cm.ended:
+                rm.on_chain_error(output)
+            if raise_exceptions:
+                raise output
+            logger.error(
+                "Exception raised in %s: %s(%s)",
+                metric.name,
+                type(output).__name__,
+                output,
+            )
+            scores.append(np.nan)
+        else:
+            if not group_cm.ended:
+                rm.on_chain_end({"output": output})
+            scores.append(output)
+    return scores
+
+
 @dataclass
 class Result(dict):
     scores: Dataset
     dataset: t.Optional[Dataset] = None
     binary_columns: t.List[str] = field(default_factory=list)
     cost_cb: t.Optional[CostCallbackHandler] = None
+    row_indices: t.Optional[t.List[int]] = None
+    incomplete: t.Dict[str, t.List[int]] = field(default_factory=dict)
+    # number of LLM responses served from (hits) or missing in (misses) the
+    # cache, if the metrics used a CachedLLM
+    cache_stats: t.Optional[t.Dict[str, int]] = None
 
     def __post_init__(self):
         values = []
         for cn in self.scores[0].keys():
-            value = safe_nanmean(self.scores[cn])
+            # scores of incomplete rows are None and don't count
+            value = safe_nanmean([v for v in self.scores[cn] if v is not None])
             self[cn] = value
             if cn not in self.binary_columns:
                 value = t.cast(float, value)
                 values.append(value + 1e-10)
 
+    @classmethod
+    def merge(cls, results: t.Sequence[Result]) -> Result:
+        """
+        Combine the partial results of a sharded evaluation into one `Result`.
+        Rows are ordered by their index in the original dataset if the results
+        come from `evaluate(..., shard_index=i, num_shards=n)` and kept in the
+        given order otherwise.
+        """
+        if len(results) == 0:
+            raise ValueError("Provide at least one Result to merge")
+
+        rows: t.List[t.Tuple[int, t.Dict, t.Optional[t.Dict]]] = []
+        incomplete_indices: t.Dict[str, t.List[int]] = {}
+        offset = 0
+        for result in results:
+            indices = result.row_indices or [
+                offset + i for i in range(len(result.scores))
+            ]
+            offset += len(result.scores)
+            for metric_name, positions in result.incomplete.items():
+                incomplete_indices.setdefault(metric_name, []).extend(
+                    indices[p] for p in positions
+                )
+            dataset_rows = (
+                result.dataset.to_list()
+                if result.dataset is not None
+                else [None] * len(result.scores)
+            )
+            rows.extend(zip(indices, result.scores.to_list(), dataset_rows))
+        rows.sort(key=lambda row: row[0])
+        indices = [row[0] for row in rows]
+        if len(set(indices)) != len(indices):
+            raise ValueError("Results to merge contain overlapping rows")
+        position = {index: p for p, index in enumerate(indices)}
+        incomplete = {
+            metric_name: sorted(position[index] for index in metric_indices)
+            for metric_name, metric_indices in incomplete_indices.items()
+        }
+
+        dataset = None
+        if all(result.dataset is not None for result in results):
+            dataset = Dataset.from_list([t.cast(t.Dict, row[2]) for row in rows])
+
+        binary_columns: t.List[str] = []
+        for result in results:
+            binary_columns.extend(
+                c for c in result.binary_columns if c not in binary_columns
+            )
+
+        cost_cbs = [result.cost_cb for result in results]
+        cost_cb = None
+        if any(cb is not None for cb in cost_cbs):
+            if any(cb is None for cb in cost_cbs):
+                raise ValueError(
+                    "Either all or none of the results to merge should have computed cost"
+                )
+            from ragas.cost import CostCallbackHandler
+
+            cost_cb = CostCallbackHandler(
+                token_usage_parser=t.cast(
+                    CostCallbackHandler, cost_cbs[0]
+                ).token_usage_parser
+            )
+            for cb in cost_cbs:
+                cost_cb.usage_data.extend(t.cast(CostCallbackHandler, cb).usage_data)
+
+        cache_stats = None
+        if any(result.cache_stats is not None for result in results):
+            cache_stats = {"hits": 0, "misses": 0}
+            for result in results:
+                for stat, count in (result.cache_stats or {}).items():
+                    cache_stats[stat] += count
+
+        return cls(
+            scores=Dataset.from_list([row[1] for row in rows]),
+            dataset=dataset,
+            binary_columns=binary_columns,
+            cost_cb=cost_cb,
+            # a complete merge looks exactly like a run that was not sharded
+            row_indices=None if indices == list(range(len(indices))) else indices,
+            incomplete=incomplete,
+            cache_stats=cache_stats,
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every row was scored by every metric."""
+        return not any(self.incomplete.values())
+
     def to_pandas(self, batch_size: int | None = None, batched: bool = False):
         if self.dataset is None:
             raise ValueError("dataset is not provided for the results class")
@@ -35,3 +35,39 @@ class ExceptionInRunner(RagasException):
     def __init__(self):
         msg = "The runner thread which was running the jobs raised an exeception. Read the traceback above to debug it. You can also pass `raise_exceptions=False` incase you want to show only a warning message instead."
         super().__init__(msg)
+
+
+class CircuitOpenError(RagasException):
+    """
+    Exception raised when a call is not sent because the circuit breaker of its
+    endpoint is open.
+    """
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        msg = f"Circuit breaker for {endpoint} is open, the call was not sent."
+        super().__init__(msg)
+
+
+class RetryBudgetExhausted(RagasException):
+    """
+    Exception raised when a failed call is not retried because the run-wide
+    retry budget is used up.
+    """
+
+    def __init__(self, error: BaseException):
+        self.error = error
+        msg = f"Retry budget exhausted, not retrying {type(error).__name__}({error})."
+        super().__init__(msg)
+
+
+class BatchRequestPending(RagasException):
+    """
+    Exception raised when a prompt has no response yet and was queued for the
+    next offline batch.
+    """
+
+    def __init__(self, custom_id: str):
+        self.custom_id = custom_id
+        msg = f"Response for batch request {custom_id} is not available yet."
+        super().__init__(msg)
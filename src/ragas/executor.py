@@ -2,18 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import typing as t
 from dataclasses import dataclass, field
 
 import numpy as np
 from tqdm.auto import tqdm
 
-from ragas.exceptions import MaxRetriesExceeded
+from ragas.async_utils import run
+from ragas.circuit_breaker import CircuitState
+from ragas.concurrency import AIMDConcurrencyController, is_overload_error
+from ragas.exceptions import BatchRequestPending, MaxRetriesExceeded
 from ragas.run_config import RunConfig
+from ragas.utils import deprecated
 
 logger = logging.getLogger(__name__)
 
 
+@deprecated("0.2", removal="0.3", addendum="Jobs run on ragas' own event loop.")
 def is_event_loop_running() -> bool:
     try:
         loop = asyncio.get_running_loop()
@@ -23,6 +29,7 @@ def is_event_loop_running() -> bool:
         return loop.is_running()
 
 
+@deprecated("0.2", removal="0.3", alternative="Executor.aiter_results")
 def as_completed(coros, max_workers):
     if max_workers == -1:
         return asyncio.as_completed(coros)
@@ -38,6 +45,18 @@ def as_completed(coros, max_workers):
     return asyncio.as_completed(sema_coros)
 
 
+@dataclass
+class LazyJobs:
+    """
+    Job specs that are only pulled when the executor has a free worker slot.
+    """
+
+    jobs: t.Iterable[
+        t.Tuple[t.Callable, t.Sequence, t.Dict[str, t.Any], t.Optional[str]]
+    ]
+    total: t.Optional[int] = None
+
+
 @dataclass
 class Executor:
     desc: str = "Evaluating"
@@ -45,7 +64,18 @@ class Executor:
     jobs: t.List[t.Any] = field(default_factory=list, repr=False)
     raise_exceptions: bool = False
     run_config: t.Optional[RunConfig] = field(default=None, repr=False)
-    _nest_asyncio_applied: bool = field(default=False, repr=False)
+    # (index, name) of the jobs that were skipped or cancelled because the
+    # run exceeded `RunConfig.time_budget`
+    missing_jobs: t.List[t.Tuple[int, t.Optional[str]]] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    @property
+    def concurrency_controller(self) -> t.Optional[AIMDConcurrencyController]:
+        """The adaptive concurrency controller, if enabled in the run config."""
+        if self.run_config is None:
+            return None
+        return self.run_config.concurrency_controller
 
     def wrap_callable_with_index(self, callable: t.Callable, counter):
         async def wrapped_callable_async(*args, **kwargs):
@@ -55,7 +85,12 @@ class Executor:
             except MaxRetriesExceeded as e:
                 # this only for testset generation v2
                 logger.warning(f"max retries exceeded for {e.evolution}")
+            except BatchRequestPending:
+                # scored in a later round of the offline batch, see OfflineBatchLLM
+                pass
             except Exception as e:
+                if self.concurrency_controller is not None and is_overload_error(e):
+                    self.concurrency_controller.on_overload(e)
                 if self.raise_exceptions:
                     raise e
                 else:
@@ -73,46 +108,257 @@ class Executor:
 
         return wrapped_callable_async
 
+    def _progress_postfix(self, run_config: RunConfig) -> t.Dict[str, t.Any]:
+        postfix: t.Dict[str, t.Any] = {}
+        if run_config.concurrency_controller is not None:
+            postfix["workers"] = run_config.concurrency_controller.limit
+        # endpoints whose circuit breaker is not closed, eg. "gpt-4o: open"
+        circuits = [
+            f"{endpoint}: {breaker.state.value}"
+            for endpoint, breaker in run_config.circuit_breakers.items()
+            if breaker.state != CircuitState.CLOSED
+        ]
+        if circuits:
+            postfix["circuits"] = ", ".join(circuits)
+        return postfix
+
     def submit(
-        self, callable: t.Callable, *args, name: t.Optional[str] = None, **kwargs
+        self,
+        callable: t.Callable,
+        *args,
+        name: t.Optional[str] = None,
+        expected_cost: float = 0.0,
+        **kwargs,
     ):
-        callable_with_index = self.wrap_callable_with_index(callable, len(self.jobs))
-        self.jobs.append((callable_with_index, args, kwargs, name))
+        """
+        Submit a job. `expected_cost` is an estimate of how long the job takes
+        (eg. the number of sequential LLM calls), jobs with the highest expected
+        cost are started first so that slow jobs don't end up at the tail of
+        the run.
+        """
+        self.jobs.append((callable, args, kwargs, name, expected_cost))
 
-    def results(self) -> t.List[t.Any]:
-        if is_event_loop_running():
-            # an event loop is running so call nested_asyncio to fix this
+    def submit_many(
+        self,
+        jobs: t.Iterable[
+            t.Tuple[t.Callable, t.Sequence, t.Dict[str, t.Any], t.Optional[str]]
+        ],
+        total: t.Optional[int] = None,
+    ):
+        """
+        Submit an iterable (eg. a generator) of `(callable, args, kwargs, name)`
+        job specs. The iterable is consumed lazily while the jobs run so only
+        `max_workers` coroutines are alive at any time.
+        """
+        self.jobs.append(LazyJobs(jobs=jobs, total=total))
+
+    def iter_jobs(
+        self,
+    ) -> t.Iterator[
+        t.Tuple[
+            int, t.Tuple[t.Callable, t.Sequence, t.Dict[str, t.Any], t.Optional[str]]
+        ]
+    ]:
+        """
+        Yield `(index, job)` in the order the jobs should be started. Jobs added
+        with `submit` are started longest expected cost first, the index is
+        always the submission order.
+        """
+        index = 0
+        block: t.List[t.Tuple[float, int, t.Any]] = []
+        for job in [*self.jobs, None]:
+            if isinstance(job, tuple):
+                afunc, args, kwargs, name, expected_cost = job
+                block.append((expected_cost, index, (afunc, args, kwargs, name)))
+                index += 1
+                continue
+
+            # flush the jobs submitted so far, sorted is stable so jobs with
+            # the same cost keep their submission order
+            for _, job_index, spec in sorted(block, key=lambda b: -b[0]):
+                yield job_index, spec
+            block = []
+
+            if isinstance(job, LazyJobs):
+                for spec in job.jobs:
+                    yield index, spec
+                    index += 1
+
+    @property
+    def total_jobs(self) -> t.Optional[int]:
+        """Number of jobs submitted, None if a lazy submission has no total."""
+        total = 0
+        for job in self.jobs:
+            if isinstance(job, LazyJobs):
+                if job.total is None:
+                    return None
+                total += job.total
+            else:
+                total += 1
+        return total
+
+    async def aiter_results(
+        self,
+    ) -> t.AsyncIterator[t.Tuple[int, t.Optional[str], t.Any]]:
+        """
+        Yield `(index, name, result)` for every job in the order they finish.
+
+        Coroutines are only created when a worker slot is free and a slot is
+        only handed back once its result has been consumed, so memory stays
+        bounded by `max_workers` irrespective of the number of jobs. With
+        `RunConfig.adaptive_concurrency` the number of slots follows the
+        concurrency controller instead.
+
+        If `RunConfig.time_budget` is set, jobs that have not started when the
+        budget runs out are skipped and jobs still running after the grace
+        period are cancelled. Both are recorded in `missing_jobs` instead of
+        being yielded.
+        """
+        run_config = self.run_config or RunConfig()
+        controller = run_config.concurrency_controller
+        self.missing_jobs = []
+        deadline = hard_deadline = float("inf")
+        if run_config.time_budget is not None:
+            deadline = time.monotonic() + run_config.time_budget
+            hard_deadline = deadline + run_config.time_budget_grace_period
+
+        def worker_limit() -> float:
+            if controller is not None:
+                return controller.limit
+            if run_config.max_workers == -1:
+                return float("inf")
+            return run_config.max_workers
+
+        slot_freed = asyncio.Event()
+        finished: asyncio.Queue = asyncio.Queue()
+        running: t.Dict[asyncio.Task, t.Tuple[int, t.Optional[str]]] = {}
+        dispatched = 0
+        consumed = 0
+
+        async def run_job(index, afunc, args, kwargs, name):
             try:
-                import nest_asyncio
-            except ImportError:
-                raise ImportError(
-                    "It seems like your running this in a jupyter-like environment. Please install nest_asyncio with `pip install nest_asyncio` to make it work."
+                _, result = await self.wrap_callable_with_index(afunc, index)(
+                    *args, **kwargs
                 )
+            except Exception as e:
+                await finished.put((index, name, None, e))
+            else:
+                await finished.put((index, name, result, None))
 
-            if not self._nest_asyncio_applied:
-                nest_asyncio.apply()
-                self._nest_asyncio_applied = True
+        async def dispatch():
+            nonlocal dispatched
+            try:
+                for index, (afunc, args, kwargs, name) in self.iter_jobs():
+                    while (
+                        dispatched - consumed >= worker_limit()
+                        and time.monotonic() < deadline
+                    ):
+                        slot_freed.clear()
+                        try:
+                            await asyncio.wait_for(
+                                slot_freed.wait(),
+                                timeout=(
+                                    None
+                                    if deadline == float("inf")
+                                    else deadline - time.monotonic()
+                                ),
+                            )
+                        except asyncio.TimeoutError:
+                            pass
+                    if time.monotonic() >= deadline:
+                        # out of time, skip the jobs that have not started
+                        self.missing_jobs.append((index, name))
+                        continue
+                    task = asyncio.ensure_future(
+                        run_job(index, afunc, args, kwargs, name)
+                    )
+                    running[task] = (index, name)
+                    task.add_done_callback(lambda task: running.pop(task, None))
+                    dispatched += 1
+            finally:
+                # sentinel to mark that no more jobs will be dispatched
+                await finished.put(None)
 
-        # create a generator for which returns tasks as they finish
-        futures_as_they_finish = as_completed(
-            coros=[afunc(*args, **kwargs) for afunc, args, kwargs, _ in self.jobs],
-            max_workers=(self.run_config or RunConfig()).max_workers,
+        dispatcher = asyncio.ensure_future(dispatch())
+        pbar = tqdm(
+            desc=self.desc,
+            total=self.total_jobs,
+            # whether you want to keep the progress bar after completion
+            leave=self.keep_progress_bar,
         )
+        all_dispatched = False
+        try:
+            while not all_dispatched or consumed < dispatched:
+                try:
+                    item = await asyncio.wait_for(
+                        finished.get(),
+                        timeout=(
+                            None
+                            if hard_deadline == float("inf")
+                            else max(0, hard_deadline - time.monotonic())
+                        ),
+                    )
+                except asyncio.TimeoutError:
+                    # grace period is over, give up on the jobs still running
+                    self.missing_jobs.extend(sorted(running.values()))
+                    logger.warning(
+                        "Time budget exceeded, %s jobs were not completed",
+                        len(self.missing_jobs),
+                    )
+                    break
+                if item is None:
+                    all_dispatched = True
+                    # surface errors raised while iterating the job specs
+                    dispatcher.result()
+                    continue
 
-        async def _aresults() -> t.List[t.Any]:
-            results = []
-            for future in tqdm(
-                futures_as_they_finish,
-                desc=self.desc,
-                total=len(self.jobs),
-                # whether you want to keep the progress bar after completion
-                leave=self.keep_progress_bar,
-            ):
-                r = await future
-                results.append(r)
-
-            return results
-
-        results = asyncio.run(_aresults())
+                index, name, result, exc = item
+                pbar.set_postfix(self._progress_postfix(run_config), refresh=False)
+                pbar.update(1)
+                if exc is not None:
+                    raise exc
+                yield index, name, result
+                # the loop keeps running while the caller handles the result,
+                # so only hand the slot back once it asks for the next one
+                consumed += 1
+                slot_freed.set()
+        finally:
+            pbar.close()
+            for task in [dispatcher, *running]:
+                task.cancel()
+            self.missing_jobs.sort(key=lambda job: job[0])
+
+    def stream(self) -> t.Iterator[t.Tuple[int, t.Optional[str], t.Any]]:
+        """
+        Run the jobs and yield `(index, name, result)` as soon as each job
+        finishes, without waiting for the rest of the jobs.
+        """
+        aresults = self.aiter_results()
+        try:
+            while True:
+                try:
+                    yield run(aresults.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            # cancels the jobs that are still running if the consumer stopped
+            # early, the shared loop itself keeps running
+            try:
+                run(aresults.aclose())
+            except RuntimeError:
+                # the generator was interrupted mid step and is closing itself
+                pass
+
+    async def aresults(self) -> t.List[t.Any]:
+        """
+        Run the jobs on the caller's event loop and return the results in the
+        order the jobs were submitted.
+        """
+        results = [(index, result) async for index, _, result in self.aiter_results()]
+        # jobs missed because of the time budget show up as nan
+        results.extend((index, np.nan) for index, _ in self.missing_jobs)
         sorted_results = sorted(results, key=lambda x: x[0])
         return [r[1] for r in sorted_results]
+
+    def results(self) -> t.List[t.Any]:
+        return run(self.aresults())
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import threading
 import typing as t
 from abc import ABC, abstractmethod
+from functools import lru_cache, partial
 
 import pydantic
 
@@ -68,6 +72,22 @@ InputModel = t.TypeVar("InputModel", bound=BaseModel)
 OutputModel = t.TypeVar("OutputModel", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def get_output_signature(output_model: t.Type[BaseModel]) -> str:
+    schema = model_to_json_schema(output_model)
+    return (
+        f"Please return the output in a JSON format that complies with the "
+        f"following schema as specified in JSON Schema and OpenAPI specification:\n"
+        f"{schema}"
+    )
+
+
+@lru_cache(maxsize=None)
+def get_output_parser(output_model: t.Type[BaseModel]) -> RagasoutputParser:
+    # parsing doesn't change the parser, so it can be shared
+    return RagasoutputParser(pydantic_object=output_model)
+
+
 class StringIO(BaseModel):
     text: str
 
@@ -78,18 +98,51 @@ class PydanticPrompt(BasePrompt, t.Generic[InputModel, OutputModel]):
     instruction: str
     examples: t.List[t.Tuple[InputModel, OutputModel]] = []
 
+    # rendered examples by (prompt class, instruction, ids of the examples),
+    # with the examples, which keeps them alive so their ids are not reused,
+    # and a snapshot of them to notice examples modified in place
+    _rendered_examples: t.ClassVar[
+        t.Dict[
+            t.Tuple[t.Any, ...],
+            t.Tuple[t.Tuple[t.Any, ...], t.Tuple[t.Any, ...], str],
+        ]
+    ] = {}
+    _rendered_examples_lock: t.ClassVar[threading.Lock] = threading.Lock()
+
     def generate_instruction(self) -> str:
         return self.instruction
 
     def generate_output_signature(self, indent: int = 4) -> str:
-        schema = model_to_json_schema(self.output_model)
-        return (
-            f"Please return the output in a JSON format that complies with the "
-            f"following schema as specified in JSON Schema and OpenAPI specification:\n"
-            f"{schema}"
-        )
+        return get_output_signature(self.output_model)
 
     def generate_examples(self):
+        """
+        Render the examples, cached per prompt class until the instruction or
+        the examples change, including examples modified in place.
+        """
+        examples = tuple(self.examples)
+        key = (
+            type(self),
+            self.instruction,
+            tuple(id(model) for example in examples for model in example),
+        )
+        with self._rendered_examples_lock:
+            cached = self._rendered_examples.get(key)
+        if cached is not None and cached[1] == examples:
+            return cached[2]
+        rendered = self._render_examples()
+        with self._rendered_examples_lock:
+            if len(self._rendered_examples) >= 256:
+                # eg. examples that are built per call
+                self._rendered_examples.clear()
+            self._rendered_examples[key] = (
+                examples,
+                copy.deepcopy(examples),
+                rendered,
+            )
+        return rendered
+
+    def _render_examples(self) -> str:
         if self.examples:
             example_strings = []
             for e in self.examples:
@@ -112,12 +165,12 @@ class PydanticPrompt(BasePrompt, t.Generic[InputModel, OutputModel]):
         else:
             return ""
 
-    def to_string(self, data: InputModel) -> str:
+    def to_string(self, data: InputModel, with_output_signature: bool = True) -> str:
         # this needs a check
         return (
             self.generate_instruction()
             + "\n"
-            + self.generate_output_signature()
+            + (self.generate_output_signature() if with_output_signature else "")
             + "\n"
             + self.generate_examples()
             + "\nNow perform the above instruction with the following input\n"
@@ -130,15 +183,37 @@ class PydanticPrompt(BasePrompt, t.Generic[InputModel, OutputModel]):
     async def generate(
         self, data: InputModel, llm: BaseRagasLLM, callbacks: Callbacks = None
     ) -> OutputModel:
-        prompt_value = PromptValue(prompt_str=self.to_string(data))
+        prompt_value = PromptValue(
+            prompt_str=self.to_string(data),
+            output_model=self.output_model,
+            render_without_format=partial(
+                self.to_string, data, with_output_signature=False
+            ),
+        )
         resp = await llm.generate(prompt_value, callbacks=callbacks)
         resp_text = resp.generations[0][0].text
-        parser = RagasoutputParser(pydantic_object=self.output_model)
+        parser = get_output_parser(self.output_model)
         answer = await parser.aparse(resp_text, prompt_value, llm, max_retries=3)
 
         # TODO: make sure RagasOutputPraser returns the same type as OutputModel
         return answer  # type: ignore
 
+    async def generate_many(
+        self,
+        inputs: t.Sequence[InputModel],
+        llm: BaseRagasLLM,
+        callbacks: Callbacks = None,
+    ) -> t.List[OutputModel]:
+        """
+        Generate the outputs for several inputs concurrently. The instruction,
+        output signature, examples and parser are shared by all of them.
+        """
+        return list(
+            await asyncio.gather(
+                *[self.generate(data, llm, callbacks=callbacks) for data in inputs]
+            )
+        )
+
 
 class StringPrompt(BasePrompt):
     async def generate(
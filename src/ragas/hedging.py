@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from ragas.run_config import RunConfig
+
+logger = logging.getLogger(__name__)
+
+T = t.TypeVar("T")
+
+
+@dataclass
+class RequestHedger:
+    """
+    Sends a duplicate (hedge) of a request that has not returned after the
+    `percentile` latency observed so far and returns whichever finishes first,
+    the other one is cancelled.
+
+    Hedging only starts once `min_samples` latencies were observed and the
+    number of hedges is capped at `max_hedge_fraction` of all requests to bound
+    the extra cost.
+
+    Parameters
+    ----------
+    percentile : float
+        Latency percentile after which a hedge is sent, by default 95.
+    max_hedge_fraction : float
+        Maximum number of hedges as a fraction of all requests, by default 0.05.
+    min_samples : int
+        Number of latencies needed before hedging starts, by default 20.
+    window : int
+        Number of most recent latencies the percentile is computed over, by
+        default 1000.
+    """
+
+    percentile: float = 95
+    max_hedge_fraction: float = 0.05
+    min_samples: int = 20
+    window: int = 1000
+    num_requests: int = field(default=0, init=False)
+    num_hedges: int = field(default=0, init=False)
+    # number of hedges that finished before the original request
+    num_hedge_wins: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self._latencies: t.Deque[float] = deque(maxlen=self.window)
+        self._lock = threading.Lock()
+
+    def record_latency(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hedge_delay(self) -> t.Optional[float]:
+        """
+        Seconds to wait before hedging a request, None if there are not
+        enough samples yet.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            return float(np.percentile(self._latencies, self.percentile))
+
+    def _try_reserve_hedge(self) -> bool:
+        with self._lock:
+            if self.num_hedges + 1 > self.max_hedge_fraction * self.num_requests:
+                return False
+            self.num_hedges += 1
+            return True
+
+    async def run(
+        self,
+        request: t.Callable[[], t.Awaitable[T]],
+        hedge: t.Optional[t.Callable[[], t.Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Await `request()`, hedging it with `hedge()` (by default another
+        `request()`) if it is slow.
+        """
+        with self._lock:
+            self.num_requests += 1
+        delay = self.hedge_delay()
+
+        async def timed(factory: t.Callable[[], t.Awaitable[T]]) -> T:
+            start = time.monotonic()
+            result = await factory()
+            self.record_latency(time.monotonic() - start)
+            return result
+
+        primary = asyncio.ensure_future(timed(request))
+        if delay is None:
+            return await primary
+
+        secondary: t.Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._try_reserve_hedge():
+                return await primary
+
+            logger.debug("request is slower than %.2fs, sending a hedge", delay)
+            secondary = asyncio.ensure_future(timed(hedge or request))
+            pending = {primary, secondary}
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # take the first success, only fail if both requests failed
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary:
+                            with self._lock:
+                                self.num_hedge_wins += 1
+                        return task.result()
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in (primary, secondary):
+                if task is not None and not task.done():
+                    task.cancel()
+
+
+_hedgers: t.Dict[t.Tuple[str, float, float], RequestHedger] = {}
+_hedgers_lock = threading.Lock()
+
+
+def get_request_hedger(model: str, run_config: RunConfig) -> t.Optional[RequestHedger]:
+    """
+    Return the hedger shared by every caller of `model`, or None if hedging is
+    not enabled in `run_config`.
+    """
+    if not run_config.hedge_requests:
+        return None
+
+    key = (model, run_config.hedge_percentile, run_config.max_hedge_fraction)
+    with _hedgers_lock:
+        if key not in _hedgers:
+            _hedgers[key] = RequestHedger(
+                percentile=run_config.hedge_percentile,
+                max_hedge_fraction=run_config.max_hedge_fraction,
+            )
+        return _hedgers[key]
@@ -4,10 +4,17 @@ from ragas.llms.base import (
     LlamaIndexLLMWrapper,
     llm_factory,
 )
+from ragas.llms.cache import CachedLLM, LLMResponseCache
+from ragas.llms.offline_batch import OfflineBatchLLM
+from ragas.llms.router import RoutedLLM
 
 __all__ = [
     "BaseRagasLLM",
+    "CachedLLM",
     "LangchainLLMWrapper",
     "LlamaIndexLLMWrapper",
+    "LLMResponseCache",
+    "OfflineBatchLLM",
+    "RoutedLLM",
     "llm_factory",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import typing as t
 from abc import ABC, abstractmethod
@@ -9,14 +10,24 @@ from functools import partial
 
 from langchain_community.chat_models.vertexai import ChatVertexAI
 from langchain_community.llms import VertexAI
-from langchain_core.language_models import BaseLanguageModel
+from langchain_core.callbacks import AsyncCallbackManager
+from langchain_core.language_models import BaseChatModel, BaseLanguageModel
+from langchain_core.messages import SystemMessage
 from langchain_core.outputs import Generation, LLMResult
+from langchain_core.prompt_values import ChatPromptValue
+from langchain_core.prompt_values import PromptValue as BasePromptValue
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_openai.chat_models import AzureChatOpenAI, ChatOpenAI
+from langchain_openai.chat_models.base import BaseChatOpenAI
 from langchain_openai.llms import AzureOpenAI, OpenAI
 from langchain_openai.llms.base import BaseOpenAI
 
+from ragas.hedging import get_request_hedger
 from ragas.integrations.helicone import helicone_config
+from ragas.llms.batching import MicroBatcher
+from ragas.rate_limiter import estimate_tokens, get_rate_limiter
 from ragas.run_config import RunConfig, add_async_retry, add_retry
+from ragas.single_flight import SingleFlight
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
@@ -36,6 +47,11 @@ MULTIPLE_COMPLETION_SUPPORTED = [
 ]
 
 
+STRUCTURED_OUTPUT_METHODS = ("tool_calling", "json_mode")
+
+_in_flight_generations = SingleFlight()
+
+
 def is_multiple_completion_supported(llm: BaseLanguageModel) -> bool:
     """Return whether the given LLM supports n-completion."""
     for llm_type in MULTIPLE_COMPLETION_SUPPORTED:
@@ -44,6 +60,57 @@ def is_multiple_completion_supported(llm: BaseLanguageModel) -> bool:
     return False
 
 
+def is_root_model(model: t.Type) -> bool:
+    """Return whether the pydantic model is not an object, eg. a `__root__` list."""
+    return bool(
+        getattr(model, "__custom_root_type__", False)
+        or getattr(model, "__pydantic_root_model__", False)
+    )
+
+
+def is_structured_output_supported(llm: BaseLanguageModel, method: str) -> bool:
+    """Return whether the given LLM supports the structured output `method`."""
+    if method == "tool_calling":
+        return (
+            isinstance(llm, BaseChatModel)
+            and type(llm).bind_tools is not BaseChatModel.bind_tools
+        )
+    if method == "json_mode":
+        return isinstance(llm, BaseChatOpenAI)
+    return False
+
+
+def _split_llm_output(
+    llm_output: t.Optional[t.Dict[str, t.Any]],
+    caller_requests: t.List[t.List[t.List[Generation]]],
+) -> t.List[t.Optional[t.Dict[str, t.Any]]]:
+    """
+    Split the `llm_output` of a batch between the callers whose requests it
+    contains, so their token usage adds up to the usage of the batch. The
+    usage of every request is read from its messages (`usage_metadata`), if
+    a request lacks it the first caller gets the usage of the whole batch.
+    """
+    if llm_output is None:
+        return [None] * len(caller_requests)
+
+    usages = []
+    for requests in caller_requests:
+        usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        for generations in requests:
+            message = getattr(generations[0], "message", None) if generations else None
+            usage_metadata = getattr(message, "usage_metadata", None)
+            if usage_metadata is None:
+                without_usage = {
+                    k: v for k, v in llm_output.items() if k != "token_usage"
+                }
+                return [llm_output] + [without_usage] * (len(caller_requests) - 1)
+            usage["prompt_tokens"] += usage_metadata["input_tokens"]
+            usage["completion_tokens"] += usage_metadata["output_tokens"]
+            usage["total_tokens"] += usage_metadata["total_tokens"]
+        usages.append(usage)
+    return [{**llm_output, "token_usage": usage} for usage in usages]
+
+
 @dataclass
 class BaseRagasLLM(ABC):
     run_config: RunConfig = field(default_factory=RunConfig)
@@ -55,6 +122,10 @@ class BaseRagasLLM(ABC):
         """Return the temperature to use for completion based on n."""
         return 0.3 if n > 1 else 1e-8
 
+    def get_model_name(self) -> str:
+        """Return the name of the model, used to share per model state."""
+        return type(self).__name__
+
     @abstractmethod
     def generate_text(
         self,
@@ -91,20 +162,63 @@ class BaseRagasLLM(ABC):
         if temperature is None:
             temperature = 1e-8
 
+        generate = partial(
+            self._generate,
+            prompt=prompt,
+            n=n,
+            temperature=temperature,
+            stop=stop,
+            callbacks=callbacks,
+            is_async=is_async,
+        )
+        if not self.run_config.deduplicate_requests:
+            return await generate()
+        # identical requests in flight share a single call
+        key = (id(self), prompt.to_string(), n, temperature, tuple(stop or ()))
+        return await _in_flight_generations.do(key, generate)
+
+    async def _generate(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+        callbacks: Callbacks,
+        is_async: bool,
+    ) -> LLMResult:
+        # every attempt waits for the rate limits, see add_async_retry
+        num_tokens = 0
+        if get_rate_limiter(self.get_model_name(), self.run_config) is not None:
+            num_tokens = estimate_tokens(prompt.to_string(), self.get_model_name())
+
         if is_async:
             agenerate_text_with_retry = add_async_retry(
-                self.agenerate_text, self.run_config
+                self.agenerate_text,
+                self.run_config,
+                endpoint=self.get_model_name(),
+                num_tokens=num_tokens,
             )
-            return await agenerate_text_with_retry(
+            agenerate_text = partial(
+                agenerate_text_with_retry,
                 prompt=prompt,
                 n=n,
                 temperature=temperature,
                 stop=stop,
                 callbacks=callbacks,
             )
+            hedger = get_request_hedger(self.get_model_name(), self.run_config)
+            if hedger is None:
+                return await agenerate_text()
+            # the hedge goes through the rate limits like any other attempt
+            return await hedger.run(agenerate_text)
         else:
             loop = asyncio.get_event_loop()
-            generate_text_with_retry = add_retry(self.generate_text, self.run_config)
+            generate_text_with_retry = add_retry(
+                self.generate_text,
+                self.run_config,
+                endpoint=self.get_model_name(),
+                num_tokens=num_tokens,
+            )
             generate_text = partial(
                 generate_text_with_retry,
                 prompt=prompt,
@@ -125,12 +239,66 @@ class LangchainLLMWrapper(BaseRagasLLM):
     """
 
     def __init__(
-        self, langchain_llm: BaseLanguageModel, run_config: t.Optional[RunConfig] = None
+        self,
+        langchain_llm: BaseLanguageModel,
+        run_config: t.Optional[RunConfig] = None,
+        batch_size: t.Optional[int] = None,
+        batch_wait: float = 0.01,
+        structured_output: t.Optional[str] = None,
     ):
+        """
+        Set `batch_size` to collect concurrent `agenerate_text` calls with the
+        same n, temperature and stop for up to `batch_wait` seconds or
+        `batch_size` prompts and send them as a single `agenerate_prompt`
+        batch. Useful for servers that batch efficiently, eg. vLLM or TGI.
+
+        Set `structured_output` to have the provider enforce the output format
+        of prompts that expect a pydantic model instead of describing it in
+        the prompt: "tool_calling" forces a call of a tool with the model's
+        schema, "json_mode" turns on OpenAI's JSON mode and sends the schema as
+        a short system message. Prompts whose output is not an object, and
+        LLMs that don't support the method, keep the format instructions.
+        """
+        if (
+            structured_output is not None
+            and structured_output not in STRUCTURED_OUTPUT_METHODS
+        ):
+            raise ValueError(
+                f"structured_output should be one of {STRUCTURED_OUTPUT_METHODS}, "
+                f"got {structured_output!r}"
+            )
+        if structured_output is not None and not is_structured_output_supported(
+            langchain_llm, structured_output
+        ):
+            logger.warning(
+                "%s does not support %s, falling back to format instructions",
+                type(langchain_llm).__name__,
+                structured_output,
+            )
+            structured_output = None
+        self.structured_output = structured_output
         self.langchain_llm = langchain_llm
         if run_config is None:
             run_config = RunConfig()
         self.set_run_config(run_config)
+        self.batcher: t.Optional[
+            MicroBatcher[
+                t.Tuple[int, float, t.Tuple[str, ...]],
+                t.Tuple[PromptValue, Callbacks],
+                LLMResult,
+            ]
+        ] = None
+        if batch_size is not None:
+            self.batcher = MicroBatcher(
+                self._agenerate_batch, max_batch_size=batch_size, max_wait=batch_wait
+            )
+
+    def get_model_name(self) -> str:
+        for attr in ("model_name", "model", "deployment_name"):
+            model_name = getattr(self.langchain_llm, attr, None)
+            if isinstance(model_name, str) and model_name:
+                return model_name
+        return type(self.langchain_llm).__name__
 
     def generate_text(
         self,
@@ -144,26 +312,29 @@ class LangchainLLMWrapper(BaseRagasLLM):
         if temperature is None:
             temperature = self.get_temperature(n=n)
 
+        request, kwargs = self._structured_request(prompt)
         if is_multiple_completion_supported(self.langchain_llm):
-            return self.langchain_llm.generate_prompt(
-                prompts=[prompt],
+            result = self.langchain_llm.generate_prompt(
+                prompts=[request],
                 n=n,
                 temperature=temperature,
                 stop=stop,
                 callbacks=callbacks,
+                **kwargs,
             )
         else:
             result = self.langchain_llm.generate_prompt(
-                prompts=[prompt] * n,
+                prompts=[request] * n,
                 temperature=temperature,
                 stop=stop,
                 callbacks=callbacks,
+                **kwargs,
             )
             # make LLMResult.generation appear as if it was n_completions
             # note that LLMResult.runs is still a list that represents each run
             generations = [[g[0] for g in result.generations]]
             result.generations = generations
-            return result
+        return self._structured_result(result)
 
     async def agenerate_text(
         self,
@@ -176,26 +347,156 @@ class LangchainLLMWrapper(BaseRagasLLM):
         if temperature is None:
             temperature = self.get_temperature(n=n)
 
+        request, kwargs = self._structured_request(prompt)
+        # structured requests differ in their tools, they are sent on their own
+        if self.batcher is not None and not kwargs:
+            return await self.batcher.submit(
+                (n, temperature, tuple(stop or ())), (prompt, callbacks)
+            )
+
         if is_multiple_completion_supported(self.langchain_llm):
-            return await self.langchain_llm.agenerate_prompt(
-                prompts=[prompt],
+            result = await self.langchain_llm.agenerate_prompt(
+                prompts=[request],
                 n=n,
                 temperature=temperature,
                 stop=stop,
                 callbacks=callbacks,
+                **kwargs,
             )
         else:
             result = await self.langchain_llm.agenerate_prompt(
-                prompts=[prompt] * n,
+                prompts=[request] * n,
                 temperature=temperature,
                 stop=stop,
                 callbacks=callbacks,
+                **kwargs,
             )
             # make LLMResult.generation appear as if it was n_completions
             # note that LLMResult.runs is still a list that represents each run
             generations = [[g[0] for g in result.generations]]
             result.generations = generations
+        return self._structured_result(result)
+
+    def _structured_request(
+        self, prompt: PromptValue
+    ) -> t.Tuple[BasePromptValue, t.Dict[str, t.Any]]:
+        """
+        Return the prompt to send and the extra arguments of the request, which
+        are empty unless the output format is left to the provider.
+        """
+        output_model = getattr(prompt, "output_model", None)
+        if (
+            self.structured_output is None
+            or output_model is None
+            or is_root_model(output_model)
+        ):
+            return prompt, {}
+        if self.structured_output == "tool_calling":
+            tool_name = convert_to_openai_tool(output_model)["function"]["name"]
+            bound = self.langchain_llm.bind_tools(  # type: ignore[attr-defined]
+                [output_model], tool_choice=tool_name
+            )
+            return prompt.without_format_instructions(), dict(bound.kwargs)
+        # json_mode
+        schema = (
+            output_model.model_json_schema()
+            if hasattr(output_model, "model_json_schema")
+            else output_model.schema()
+        )
+        system = SystemMessage(
+            content="Return a JSON object that conforms to this JSON schema: "
+            + json.dumps(schema, separators=(",", ":"))
+        )
+        messages = [system, *prompt.without_format_instructions().to_messages()]
+        return ChatPromptValue(messages=messages), {
+            "response_format": {"type": "json_object"}
+        }
+
+    def _structured_result(self, result: LLMResult) -> LLMResult:
+        """Replace the text of forced tool calls with their JSON arguments."""
+        if self.structured_output != "tool_calling":
             return result
+        for generations in result.generations:
+            for i, generation in enumerate(generations):
+                message = getattr(generation, "message", None)
+                tool_calls = getattr(message, "tool_calls", None)
+                if tool_calls:
+                    generations[i] = Generation(
+                        text=json.dumps(tool_calls[0]["args"]),
+                        generation_info=generation.generation_info,
+                    )
+        return result
+
+    async def _agenerate_batch(
+        self,
+        params: t.Tuple[int, float, t.Tuple[str, ...]],
+        requests: t.List[t.Tuple[PromptValue, Callbacks]],
+    ) -> t.List[LLMResult]:
+        """
+        Send the prompts of several `agenerate_text` calls as one batch and
+        split the result back into one `LLMResult` per call.
+        """
+        n, temperature, stop_tuple = params
+        stop = list(stop_tuple) or None
+        prompts = [prompt for prompt, _ in requests]
+        multiple_completion = is_multiple_completion_supported(self.langchain_llm)
+
+        # the batch is not tied to a single caller's callbacks, every caller's
+        # callbacks are notified about its own prompt instead
+        run_managers = []
+        for prompt, callbacks in requests:
+            cm = AsyncCallbackManager.configure(inheritable_callbacks=callbacks)
+            run_managers.append(
+                await cm.on_llm_start(
+                    {"name": type(self.langchain_llm).__name__},
+                    [prompt.to_string()],
+                    invocation_params={"n": n, "temperature": temperature},
+                )
+            )
+
+        try:
+            if multiple_completion:
+                result = await self.langchain_llm.agenerate_prompt(
+                    prompts=prompts, n=n, temperature=temperature, stop=stop
+                )
+            else:
+                result = await self.langchain_llm.agenerate_prompt(
+                    prompts=[p for p in prompts for _ in range(n)],
+                    temperature=temperature,
+                    stop=stop,
+                )
+        except BaseException as e:
+            for rms in run_managers:
+                for rm in rms:
+                    await rm.on_llm_error(e)
+            raise
+
+        # the generations of the requests sent for each caller, without n
+        # completions support every completion was a request of its own
+        caller_requests = [
+            (
+                [result.generations[i]]
+                if multiple_completion
+                else result.generations[i * n : (i + 1) * n]
+            )
+            for i in range(len(requests))
+        ]
+        llm_outputs = _split_llm_output(result.llm_output, caller_requests)
+
+        results = []
+        for rms, caller_generations, llm_output in zip(
+            run_managers, caller_requests, llm_outputs
+        ):
+            if multiple_completion:
+                generations = caller_generations[0]
+            else:
+                # make LLMResult.generation appear as if it was n_completions
+                generations = [g[0] for g in caller_generations]
+            llm_result = LLMResult(generations=[generations], llm_output=llm_output)
+            for rm in rms:
+                await rm.on_llm_end(llm_result)
+            results.append(llm_result)
+        return results
 
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
@@ -233,6 +534,12 @@ class LlamaIndexLLMWrapper(BaseRagasLLM):
             run_config = RunConfig()
         self.set_run_config(run_config)
 
+    def get_model_name(self) -> str:
+        model_name = getattr(self.llm, "model", None)
+        if isinstance(model_name, str) and model_name:
+            return model_name
+        return type(self.llm).__name__
+
     def check_args(
         self,
         n: int,
@@ -294,6 +601,7 @@ def llm_factory(
     run_config: t.Optional[RunConfig] = None,
     default_headers: t.Optional[t.Dict[str, str]] = None,
     base_url: t.Optional[str] = None,
+    structured_output: t.Optional[str] = None,
 ) -> BaseRagasLLM:
     timeout = None
     if run_config is not None:
@@ -307,4 +615,6 @@ def llm_factory(
     openai_model = ChatOpenAI(
         model=model, timeout=timeout, default_headers=default_headers, base_url=base_url
     )
-    return LangchainLLMWrapper(openai_model, run_config)
+    return LangchainLLMWrapper(
+        openai_model, run_config, structured_output=structured_output
+    )
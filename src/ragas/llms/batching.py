@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import typing as t
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+K = t.TypeVar("K", bound=t.Hashable)
+I = t.TypeVar("I")  # noqa: E741
+R = t.TypeVar("R")
+
+
+@dataclass
+class _PendingBatch(t.Generic[I]):
+    items: t.List[I] = field(default_factory=list)
+    futures: t.List[asyncio.Future] = field(default_factory=list)
+    timer: t.Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher(t.Generic[K, I, R]):
+    """
+    Collects concurrent calls with the same key for up to `max_wait` seconds or
+    `max_batch_size` items and processes them with a single call of
+    `process_batch(key, items)`, which returns one result per item. Every
+    caller gets the result for its own item, if the batch fails every caller
+    gets the error.
+    """
+
+    def __init__(
+        self,
+        process_batch: t.Callable[[K, t.List[I]], t.Awaitable[t.List[R]]],
+        max_batch_size: int = 16,
+        max_wait: float = 0.01,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size should be at least 1")
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.num_batches = 0
+        self._pending: t.Dict[
+            t.Tuple[asyncio.AbstractEventLoop, K], _PendingBatch[I]
+        ] = {}
+        self._lock = threading.Lock()
+
+    async def submit(self, key: K, item: I) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # batches can't be shared across event loops
+        batch_key = (loop, key)
+        with self._lock:
+            batch = self._pending.setdefault(batch_key, _PendingBatch())
+            batch.items.append(item)
+            batch.futures.append(future)
+            if len(batch.items) >= self.max_batch_size:
+                self._flush(batch_key)
+            elif batch.timer is None:
+                batch.timer = loop.call_later(
+                    self.max_wait, self._flush_with_lock, batch_key
+                )
+        return await future
+
+    def _flush_with_lock(self, batch_key):
+        with self._lock:
+            self._flush(batch_key)
+
+    def _flush(self, batch_key):
+        batch = self._pending.pop(batch_key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self.num_batches += 1
+        asyncio.ensure_future(self._run(batch_key[1], batch), loop=batch_key[0])
+
+    async def _run(self, key: K, batch: _PendingBatch[I]):
+        try:
+            results = await self.process_batch(key, batch.items)
+            if len(results) != len(batch.items):
+                raise ValueError(
+                    f"expected {len(batch.items)} results for the batch, "
+                    f"got {len(results)}"
+                )
+        except BaseException as e:
+            for future in batch.futures:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+from langchain_core.outputs import Generation, LLMResult
+
+from ragas.llms.base import BaseRagasLLM
+from ragas.run_config import RunConfig
+
+if t.TYPE_CHECKING:
+    from langchain_core.callbacks import Callbacks
+
+    from ragas.llms.prompt import PromptValue
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    SQLite backed store of LLM responses that is safe to share between
+    threads and processes.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to the SQLite file.
+    ttl : float, optional
+        Seconds after which an entry expires, by default entries never expire.
+    max_entries : int, optional
+        Maximum number of entries, the least recently used ones are evicted
+        first. By default the cache is not bounded.
+    touch_interval : float
+        Seconds between updates of the last access time of an entry, by
+        default 60. Hits on an entry touched more recently are read only, so
+        they don't serialize on the write lock. Recency is tracked at this
+        resolution.
+    """
+
+    # how often (in writes) the size of the cache is checked
+    _evict_every = 100
+
+    def __init__(
+        self,
+        path: t.Union[str, os.PathLike],
+        ttl: t.Optional[float] = None,
+        max_entries: t.Optional[int] = None,
+        touch_interval: float = 60.0,
+    ):
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self._writes = 0
+        self._lock = threading.Lock()
+        # wait for the write lock held by other processes instead of failing
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def get(self, key: str) -> t.Optional[t.Any]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created_at, accessed_at FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at, accessed_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            if now - accessed_at >= self.touch_interval:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        return json.loads(response)
+
+    def set(self, key: str, response: t.Any):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(response, default=str), now, now),
+            )
+            self._writes += 1
+            if self._writes % self._evict_every == 0:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        if self.ttl is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)
+            )
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def evict(self):
+        """Remove the expired entries and the ones over `max_entries`."""
+        with self._lock, self._conn:
+            self._evict(time.time())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CachedLLM(BaseRagasLLM):
+    """
+    Wraps a `BaseRagasLLM` and caches its responses on disk, keyed by the
+    prompt, the model, temperature, n and stop. Cache hits are returned without
+    going through the rate limiter or sending a request.
+
+    Examples
+    --------
+    ```
+    >>> llm = CachedLLM(LangchainLLMWrapper(ChatOpenAI()), "ragas_cache.db")
+    >>> result = evaluate(dataset, llm=llm)
+    >>> result.cache_stats
+    {'hits': 120, 'misses': 0}
+    ```
+    """
+
+    def __init__(
+        self,
+        llm: BaseRagasLLM,
+        cache: t.Union[str, os.PathLike, LLMResponseCache],
+        ttl: t.Optional[float] = None,
+        max_entries: t.Optional[int] = None,
+        run_config: t.Optional[RunConfig] = None,
+    ):
+        self.llm = llm
+        self.cache = (
+            cache
+            if isinstance(cache, LLMResponseCache)
+            else LLMResponseCache(cache, ttl=ttl, max_entries=max_entries)
+        )
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self.set_run_config(run_config or llm.run_config)
+
+    def set_run_config(self, run_config: RunConfig):
+        self.run_config = run_config
+        self.llm.set_run_config(run_config)
+
+    def get_model_name(self) -> str:
+        return self.llm.get_model_name()
+
+    def get_temperature(self, n: int) -> float:
+        return self.llm.get_temperature(n)
+
+    def cache_key(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: t.Optional[float],
+        stop: t.Optional[t.List[str]],
+    ) -> str:
+        payload = json.dumps(
+            {
+                "prompt": prompt.to_string(),
+                "llm": type(self.llm).__name__,
+                "model": self.get_model_name(),
+                "temperature": temperature,
+                "n": n,
+                "stop": stop,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> t.Optional[LLMResult]:
+        try:
+            cached = self.cache.get(key)
+        except sqlite3.OperationalError as e:
+            # eg. the database stayed locked by other writers, ask the llm
+            logger.warning("LLM cache lookup failed, treated as a miss: %s", e)
+            cached = None
+        with self._stats_lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return LLMResult(
+            generations=[
+                [Generation(**generation) for generation in generations]
+                for generations in cached
+            ]
+        )
+
+    def _store(self, key: str, result: LLMResult):
+        try:
+            self.cache.set(
+                key,
+                [
+                    [
+                        {"text": g.text, "generation_info": g.generation_info}
+                        for g in generations
+                    ]
+                    for generations in result.generations
+                ],
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning("LLM cache store failed, response not cached: %s", e)
+
+    async def _alookup(self, key: str) -> t.Optional[LLMResult]:
+        # sqlite blocks, eg. for up to 30s waiting for the write lock, keep it
+        # off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._lookup, key)
+
+    async def _astore(self, key: str, result: LLMResult):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._store, key, result)
+
+    def generate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: float = 1e-8,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        key = self.cache_key(prompt, n, temperature, stop)
+        result = self._lookup(key)
+        if result is None:
+            result = self.llm.generate_text(prompt, n, temperature, stop, callbacks)
+            self._store(key, result)
+        return result
+
+    async def agenerate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = None,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        key = self.cache_key(prompt, n, temperature, stop)
+        result = await self._alookup(key)
+        if result is None:
+            result = await self.llm.agenerate_text(
+                prompt, n, temperature, stop, callbacks
+            )
+            await self._astore(key, result)
+        return result
+
+    async def generate(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = None,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+        is_async: bool = True,
+    ) -> LLMResult:
+        if temperature is None:
+            temperature = 1e-8
+
+        key = self.cache_key(prompt, n, temperature, stop)
+        result = await self._alookup(key)
+        if result is None:
+            # rate limits, retries etc. are handled by the wrapped llm
+            result = await self.llm.generate(
+                prompt,
+                n=n,
+                temperature=temperature,
+                stop=stop,
+                callbacks=callbacks,
+                is_async=is_async,
+            )
+            await self._astore(key, result)
+        return result
@@ -3,14 +3,20 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 import typing as t
 from dataclasses import dataclass
 from functools import partial
 
+from ragas.llms.json_repair import load_repaired_json, repair_stats
 from ragas.run_config import RunConfig, add_async_retry, add_retry
 
 logger = logging.getLogger(__name__)
 
+# where a JSON object or array can start
+_JSON_START = re.compile(r"[{\[]")
+_decoder = json.JSONDecoder()
+
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
 
@@ -83,11 +89,11 @@ class JsonLoader:
         retry = 0
         while retry <= self.max_retries:
             try:
-                _json = self._load_all_jsons(text)
-                return _json[0] if len(_json) == 1 else _json
+                return self._load(text)
             except ValueError:
                 from ragas.llms.prompt import PromptValue
 
+                repair_stats.record("llm_fixes")
                 results = llm.generate_text(
                     PromptValue(prompt_str=JSON_PROMPT.format(input=text)),
                     n=1,
@@ -96,6 +102,7 @@ class JsonLoader:
                 text = results.generations[0][0].text
             retry += 1
 
+        repair_stats.record("failed")
         return {}
 
     async def _asafe_load(
@@ -104,11 +111,11 @@ class JsonLoader:
         retry = 0
         while retry <= self.max_retries:
             try:
-                _json = self._load_all_jsons(text)
-                return _json[0] if len(_json) == 1 else _json
+                return self._load(text)
             except ValueError:
                 from ragas.llms.prompt import PromptValue
 
+                repair_stats.record("llm_fixes")
                 results = await llm.agenerate_text(
                     PromptValue(prompt_str=JSON_PROMPT.format(input=text)),
                     n=1,
@@ -117,6 +124,7 @@ class JsonLoader:
                 text = results.generations[0][0].text
             retry += 1
 
+        repair_stats.record("failed")
         return {}
 
     async def safe_load(
@@ -141,41 +149,39 @@ class JsonLoader:
                 safe_load,
             )
 
-    def _load_all_jsons(self, text):
-        start, end = self._find_outermost_json(text)
-        _json = json.loads(text[start:end])
-        text = text.replace(text[start:end], "", 1)
-        start, end = self._find_outermost_json(text)
-        if (start, end) == (-1, -1):
-            return [_json]
+    def _load(self, text: str) -> t.Union[t.Dict, t.List]:
+        try:
+            _json = self._load_all_jsons(text)
+        except ValueError:
+            # raises ValueError if the repair didn't help either
+            _json = [load_repaired_json(text)]
+            repair_stats.record("repaired")
         else:
-            return [_json] + self._load_all_jsons(text)
-
-    def _find_outermost_json(self, text):
-        stack = []
-        start_index = -1
-
-        for i, char in enumerate(text):
-            if char in "{[":
-                if len(stack) == 0:
-                    start_index = i
-                stack.append(char)
-
-            elif char in "}]":
-                if len(stack) > 0:
-                    last = stack.pop()
-                    if (char == "}" and last != "{") or (char == "]" and last != "["):
-                        # Mismatched closing brace/bracket, invalid JSON
-                        break
-
-                if len(stack) == 0 and start_index != -1:
-                    # Found a valid outermost JSON
-                    return (
-                        start_index,
-                        i + 1,
-                    )  # Add 1 to include the closing brace/bracket in the range
-
-        return -1, -1  # No valid JSON found
+            repair_stats.record("parsed")
+        return _json[0] if len(_json) == 1 else _json
+
+    def _load_all_jsons(self, text: str) -> t.List[t.Any]:
+        """
+        Return every top-level JSON object or array in `text`, in a single pass.
+        Raises ValueError if the first one is not valid JSON, scanning stops at
+        the first invalid one after that.
+        """
+        results = []
+        index = 0
+        while True:
+            match = _JSON_START.search(text, index)
+            if match is None:
+                break
+            try:
+                value, index = _decoder.raw_decode(text, match.start())
+            except json.JSONDecodeError:
+                if not results:
+                    raise
+                break
+            results.append(value)
+        if not results:
+            raise ValueError("no json found in the text")
+        return results
 
 
 json_loader = JsonLoader()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import typing as t
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+_MARKDOWN_FENCE = re.compile(r"```[a-zA-Z]*[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+_NEXT_CHAR = re.compile(r"\s*(.?)", re.DOTALL)
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+@dataclass
+class RepairStats:
+    """
+    How the JSON returned by LLMs was parsed. `repaired` counts the outputs
+    that were fixed locally, each of them saved an LLM call.
+    """
+
+    # parsed as is
+    parsed: int = 0
+    # parsed after the local repair
+    repaired: int = 0
+    # LLM calls made to fix the output
+    llm_fixes: int = 0
+    # gave up, the output could not be parsed
+    failed: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record(self, outcome: str):
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def as_dict(self) -> t.Dict[str, int]:
+        with self._lock:
+            return asdict(self)
+
+    def reset(self):
+        with self._lock:
+            self.parsed = self.repaired = self.llm_fixes = self.failed = 0
+
+
+repair_stats = RepairStats()
+
+
+def repair_json(text: str) -> str:
+    """
+    Fix the mechanical mistakes LLMs make in JSON: markdown fences, text around
+    the JSON, single quoted strings, unescaped quotes and newlines in strings,
+    trailing commas, Python's True/False/None and missing closing brackets (eg.
+    a truncated output). Returns the first JSON value in `text`, which is not
+    guaranteed to be valid.
+    """
+    fence = _MARKDOWN_FENCE.search(text)
+    if fence is not None:
+        text = fence.group(1)
+    match = re.search(r"[{\[]", text)
+    if match is None:
+        return text.strip()
+    text = text[match.start() :]
+
+    out: t.List[str] = []
+    closers: t.List[str] = []
+    quote: t.Optional[str] = None
+    escaped = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote is not None:
+            if escaped:
+                # \' is not a valid escape in JSON
+                if char == "'":
+                    out[-1] = char
+                else:
+                    out.append(char)
+                escaped = False
+            elif char == "\\":
+                out.append(char)
+                escaped = True
+            elif char == quote and _closes_string(text, i + 1):
+                out.append('"')
+                quote = None
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            else:
+                out.append(char)
+        elif char in "\"'":
+            out.append('"')
+            quote = char
+        elif char in _CLOSERS:
+            out.append(char)
+            closers.append(_CLOSERS[char])
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            out.append(closers.pop() if closers else char)
+            if not closers:
+                # the rest is text after the JSON
+                break
+        elif char in "TFN":
+            literal = _python_literal(text, i)
+            if literal is not None:
+                out.append(_PYTHON_LITERALS[literal])
+                i += len(literal)
+                continue
+            out.append(char)
+        else:
+            out.append(char)
+        i += 1
+
+    # the output was cut off
+    if quote is not None:
+        if escaped:
+            out.pop()
+        out.append('"')
+    _drop_trailing_comma(out)
+    if "".join(out).rstrip().endswith(":"):
+        out.append(" null")
+    while closers:
+        _drop_trailing_comma(out)
+        out.append(closers.pop())
+    return "".join(out)
+
+
+def _closes_string(text: str, index: int) -> bool:
+    """A quote ends a string if it is followed by what can follow a string."""
+    next_char = _NEXT_CHAR.match(text, index).group(1)  # type: ignore[union-attr]
+    return next_char == "" or next_char in ",:}]"
+
+
+def _python_literal(text: str, index: int) -> t.Optional[str]:
+    if index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_"):
+        return None
+    for literal in _PYTHON_LITERALS:
+        end = index + len(literal)
+        if text.startswith(literal, index) and not (
+            end < len(text) and (text[end].isalnum() or text[end] == "_")
+        ):
+            return literal
+    return None
+
+
+def _drop_trailing_comma(out: t.List[str]):
+    i = len(out) - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i >= 0 and out[i] == ",":
+        del out[i]
+
+
+def load_repaired_json(text: str) -> t.Any:
+    """Parse `text` after `repair_json`, raises ValueError if it is still invalid."""
+    value = json.loads(repair_json(text))
+    if not isinstance(value, (dict, list)):
+        raise ValueError("no json object or array in the text")
+    return value
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import typing as t
+
+from langchain_core.outputs import Generation, LLMResult
+
+from ragas.exceptions import BatchRequestPending
+from ragas.llms.base import BaseRagasLLM
+from ragas.run_config import RunConfig
+
+if t.TYPE_CHECKING:
+    from langchain_core.callbacks import Callbacks
+
+    from ragas.evaluation import Result
+    from ragas.llms.prompt import PromptValue
+
+logger = logging.getLogger(__name__)
+
+# langchain message types to OpenAI chat roles
+_ROLES = {"human": "user", "ai": "assistant", "system": "system"}
+
+
+class OfflineBatchLLM(BaseRagasLLM):
+    """
+    LLM for evaluating through a provider's offline batch API (eg. OpenAI's
+    `/v1/batches`), which is cheaper and has its own quotas.
+
+    Nothing is sent from the evaluation itself. Every prompt that has no
+    response yet is queued as a batch request and the metric is left
+    unscored. The queued requests are written to a JSONL file in OpenAI batch
+    format with `write_requests`, and the output file of the batch is read back
+    with `load_results`. Evaluating again replays the loaded responses and
+    queues the prompts of the next stage, so a metric that makes k dependent
+    LLM calls needs k rounds. `evaluate_offline` runs the rounds for you.
+
+    Parameters
+    ----------
+    model : str
+        Model name written into the requests.
+    url : str
+        Endpoint of the requests, by default "/v1/chat/completions".
+    results : str or os.PathLike, optional
+        Batch output files to load right away, eg. from earlier rounds.
+    run_config : RunConfig, optional
+        Run config of the LLM.
+
+    Examples
+    --------
+    ```
+    >>> llm = OfflineBatchLLM(model="gpt-4o-mini")
+    >>> evaluate(dataset, metrics, llm=llm)  # queues the first stage
+    >>> llm.write_requests("round_1.jsonl")
+    # submit round_1.jsonl to the batch API and download its output, then
+    >>> llm.load_results("round_1_output.jsonl")
+    >>> evaluate(dataset, metrics, llm=llm)  # replays it and queues the next stage
+    ```
+    """
+
+    def __init__(
+        self,
+        model: str,
+        url: str = "/v1/chat/completions",
+        results: t.Optional[
+            t.Union[str, os.PathLike, t.Sequence[t.Union[str, os.PathLike]]]
+        ] = None,
+        run_config: t.Optional[RunConfig] = None,
+    ):
+        self.model = model
+        self.url = url
+        self._responses: t.Dict[str, LLMResult] = {}
+        # custom_id -> request body, in the order the prompts were queued
+        self._pending: t.Dict[str, t.Dict[str, t.Any]] = {}
+        self._lock = threading.Lock()
+        if results is not None:
+            paths = [results] if isinstance(results, (str, os.PathLike)) else results
+            for path in paths:
+                self.load_results(path)
+        self.set_run_config(run_config or RunConfig())
+
+    def get_model_name(self) -> str:
+        return self.model
+
+    @property
+    def num_pending(self) -> int:
+        """Number of requests queued for the next batch."""
+        return len(self._pending)
+
+    @property
+    def num_responses(self) -> int:
+        """Number of responses loaded from batch results."""
+        return len(self._responses)
+
+    def request_body(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+    ) -> t.Dict[str, t.Any]:
+        body: t.Dict[str, t.Any] = {
+            "model": self.model,
+            "messages": [
+                {"role": _ROLES.get(message.type, "user"), "content": message.content}
+                for message in prompt.to_messages()
+            ],
+            "n": n,
+            "temperature": temperature,
+        }
+        if stop:
+            body["stop"] = stop
+        return body
+
+    @staticmethod
+    def custom_id(body: t.Dict[str, t.Any]) -> str:
+        payload = json.dumps(body, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _respond(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: t.Optional[float],
+        stop: t.Optional[t.List[str]],
+    ) -> LLMResult:
+        if temperature is None:
+            temperature = self.get_temperature(n)
+        body = self.request_body(prompt, n, temperature, stop)
+        custom_id = self.custom_id(body)
+        with self._lock:
+            result = self._responses.get(custom_id)
+            if result is None:
+                self._pending.setdefault(custom_id, body)
+        if result is None:
+            raise BatchRequestPending(custom_id)
+        # callers may modify what they get back
+        return copy.deepcopy(result)
+
+    def generate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: float = 1e-8,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        return self._respond(prompt, n, temperature, stop)
+
+    async def agenerate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = None,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        return self._respond(prompt, n, temperature, stop)
+
+    async def generate(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = None,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+        is_async: bool = True,
+    ) -> LLMResult:
+        # no request is sent, so no rate limiting or retries
+        if temperature is None:
+            temperature = 1e-8
+        return self._respond(prompt, n, temperature, stop)
+
+    def write_requests(self, path: t.Union[str, os.PathLike]) -> int:
+        """
+        Write the queued requests to `path` in OpenAI batch format and clear the
+        queue. Returns the number of requests written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        with open(path, "w", encoding="utf-8") as f:
+            for custom_id, body in pending.items():
+                request = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": self.url,
+                    "body": body,
+                }
+                f.write(json.dumps(request) + "\n")
+        return len(pending)
+
+    def load_results(self, path: t.Union[str, os.PathLike]) -> int:
+        """
+        Load the responses from a batch output file. Failed requests are skipped
+        and queued again the next time their prompt comes up. Returns the
+        number of responses loaded.
+        """
+        loaded = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    logger.warning(
+                        "batch request %s failed: %s",
+                        record.get("custom_id"),
+                        record.get("error") or response.get("body"),
+                    )
+                    continue
+                result = self._to_llm_result(response["body"])
+                with self._lock:
+                    self._responses[record["custom_id"]] = result
+                loaded += 1
+        return loaded
+
+    @staticmethod
+    def _to_llm_result(body: t.Dict[str, t.Any]) -> LLMResult:
+        choices = sorted(body["choices"], key=lambda c: c.get("index", 0))
+        generations = [
+            Generation(
+                text=choice["message"].get("content") or "",
+                generation_info={"finish_reason": choice.get("finish_reason")},
+            )
+            for choice in choices
+        ]
+        return LLMResult(
+            generations=[generations],
+            llm_output={
+                "token_usage": body.get("usage", {}),
+                "model_name": body.get("model"),
+            },
+        )
+
+
+BatchProcessor = t.Callable[[str], t.Union[str, os.PathLike]]
+
+
+def openai_batch_processor(
+    client: t.Any = None,
+    completion_window: str = "24h",
+    poll_interval: float = 60.0,
+) -> BatchProcessor:
+    """
+    Return a batch processor for `evaluate_offline` that submits the request
+    file to the OpenAI batch API, waits for the batch to finish and downloads
+    its output next to the request file.
+    """
+    if client is None:
+        from openai import OpenAI
+
+        client = OpenAI()
+
+    def process(requests_path: str) -> str:
+        with open(requests_path, "rb") as f:
+            batch_file = client.files.create(file=f, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,
+        )
+        logger.info("submitted batch %s", batch.id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        if batch.output_file_id is None:
+            raise RuntimeError(f"batch {batch.id} {batch.status} without output")
+
+        output_path = os.path.splitext(requests_path)[0] + "_output.jsonl"
+        with open(output_path, "wb") as f:
+            f.write(client.files.content(batch.output_file_id).content)
+        return output_path
+
+    return process
+
+
+def evaluate_offline(
+    dataset: t.Any,
+    llm: OfflineBatchLLM,
+    process_batch: BatchProcessor,
+    directory: t.Union[str, os.PathLike],
+    max_rounds: int = 10,
+    **evaluate_kwargs: t.Any,
+) -> Result:
+    """
+    Evaluate `dataset` in rounds of offline batches. Every round evaluates the
+    dataset, writes the prompts that have no response yet to
+    `directory/round_<i>.jsonl` and passes that path to `process_batch`, which
+    returns the path of the batch output (see `openai_batch_processor`). Stops
+    once a round queues nothing, or after `max_rounds` rounds.
+
+    The remaining keyword arguments are passed on to `ragas.evaluate`.
+    """
+    from ragas.evaluation import evaluate
+
+    os.makedirs(directory, exist_ok=True)
+    for i in range(1, max_rounds + 1):
+        result = evaluate(dataset, llm=llm, **evaluate_kwargs)
+        if llm.num_pending == 0:
+            return result
+        requests_path = os.path.join(os.fspath(directory), f"round_{i}.jsonl")
+        num_requests = llm.write_requests(requests_path)
+        logger.info("round %s: %s batch requests", i, num_requests)
+        llm.load_results(process_batch(requests_path))
+
+    result = evaluate(dataset, llm=llm, **evaluate_kwargs)
+    if llm.num_pending:
+        logger.warning(
+            "%s requests still pending after %s rounds", llm.num_pending, max_rounds
+        )
+    return result
@@ -7,6 +7,8 @@ from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.pydantic_v1 import BaseModel
 
 from ragas.llms import BaseRagasLLM
+from ragas.llms.base import is_root_model
+from ragas.llms.json_repair import load_repaired_json, repair_stats
 from ragas.llms.prompt import Prompt, PromptValue
 
 logger = logging.getLogger(__name__)
@@ -53,6 +55,21 @@ def get_json_format_instructions(pydantic_object: t.Type[TBaseModel]) -> str:
     return resp
 
 
+def _fit_to_model(value: t.Any, pydantic_object: t.Type) -> t.Any:
+    """
+    Fix the usual shape mismatches: a list wrapped in an object where the model
+    is a list (`__root__`) and a list of one object where it is an object.
+    """
+    if is_root_model(pydantic_object):
+        if isinstance(value, dict) and len(value) == 1:
+            (inner,) = value.values()
+            if isinstance(inner, list):
+                return inner
+    elif isinstance(value, list) and len(value) == 1 and isinstance(value[0], dict):
+        return value[0]
+    return value
+
+
 class RagasoutputParser(PydanticOutputParser):
     async def aparse(  # type: ignore
         self, result: str, prompt: PromptValue, llm: BaseRagasLLM, max_retries: int = 1
@@ -60,7 +77,13 @@ class RagasoutputParser(PydanticOutputParser):
         try:
             output = super().parse(result)
         except OutputParserException:
+            # most mistakes are mechanical, try fixing them before asking the llm
+            output = self._parse_repaired(result)
+            if output is not None:
+                repair_stats.record("repaired")
+                return output
             if max_retries != 0:
+                repair_stats.record("llm_fixes")
                 p_value = FIX_OUTPUT_FORMAT.format(
                     prompt=prompt.to_string(), completion=result
                 )
@@ -68,6 +91,15 @@ class RagasoutputParser(PydanticOutputParser):
                 result = output.generations[0][0].text
                 return await self.aparse(result, prompt, llm, max_retries - 1)
             else:
+                repair_stats.record("failed")
                 logger.warning("Failed to parse output. Returning None.")
                 return None
+        repair_stats.record("parsed")
         return output
+
+    def _parse_repaired(self, result: str) -> t.Optional[t.Any]:
+        try:
+            value = load_repaired_json(result)
+            return self._parse_obj(_fit_to_model(value, self.pydantic_object))
+        except ValueError:
+            return None
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import ast
+import copy
+import functools
 import json
 import logging
 import os
 import typing as t
+from dataclasses import dataclass
+from string import Formatter
 
 from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_core.prompt_values import PromptValue as BasePromptValue
-from langchain_core.pydantic_v1 import BaseModel, root_validator
+from langchain_core.pydantic_v1 import BaseModel, PrivateAttr, root_validator
 
 from ragas.llms import BaseRagasLLM
 from ragas.llms.json_load import json_loader
@@ -21,6 +25,18 @@ logger = logging.getLogger(__name__)
 
 class PromptValue(BasePromptValue):
     prompt_str: str
+    # model of the expected output, lets LLMs that support structured output
+    # enforce it natively (see `LangchainLLMWrapper`)
+    output_model: t.Optional[t.Any] = None
+    # renders the prompt without the output format instructions, sent instead
+    # of `prompt_str` when the output model is enforced natively. Only called
+    # then, most LLMs never need it
+    render_without_format: t.Optional[t.Callable[[], str]] = None
+
+    def without_format_instructions(self) -> PromptValue:
+        if self.render_without_format is None:
+            return PromptValue(prompt_str=self.prompt_str)
+        return PromptValue(prompt_str=self.render_without_format())
 
     def to_messages(self) -> t.List[BaseMessage]:
         """Return prompt as a list of Messages."""
@@ -30,6 +46,40 @@ class PromptValue(BasePromptValue):
         return self.prompt_str
 
 
+@dataclass
+class CompiledTemplate:
+    """
+    A prompt template split into its literal text and the input fields, so it
+    can be filled in without parsing it again.
+    """
+
+    template: str
+    # (literal text, field name, format spec), None if the template uses more
+    # than `{name}` and `{name:spec}` fields and is left to `str.format`
+    parts: t.Optional[t.List[t.Tuple[str, t.Optional[str], str]]]
+
+    @classmethod
+    def compile(cls, template: str) -> CompiledTemplate:
+        parts = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if field is not None and (
+                not field.isidentifier() or conversion or "{" in (spec or "")
+            ):
+                return cls(template=template, parts=None)
+            parts.append((literal, field, spec or ""))
+        return cls(template=template, parts=parts)
+
+    def format(self, **kwargs: t.Any) -> str:
+        if self.parts is None:
+            return self.template.format(**kwargs)
+        chunks = []
+        for literal, field, spec in self.parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(format(kwargs[field], spec))
+        return "".join(chunks)
+
+
 class Prompt(BaseModel):
     """
     Prompt is a class that represents a prompt for the ragas metrics.
@@ -43,6 +93,9 @@ class Prompt(BaseModel):
         output_key (str): The output variable name.
         output_type (Literal["json", "str"]): The type of the output (default: "json").
         language (str): The language of the prompt (default: "english").
+        output_model (Optional[Type[BaseModel]]): The model described by the output
+            format instruction, LLMs that support structured output enforce it
+            natively (default: None).
     """
 
     name: str = ""
@@ -53,6 +106,12 @@ class Prompt(BaseModel):
     output_key: str = ""
     output_type: t.Literal["json", "str"] = "json"
     language: str = "english"
+    output_model: t.Optional[t.Any] = None
+    # rendered templates, with and without the output format instruction, and
+    # the fields they were rendered from (see `_template_fields`)
+    _compiled: t.Dict[bool, t.Tuple[CompiledTemplate, t.Tuple[t.Any, ...]]] = (
+        PrivateAttr(default_factory=dict)
+    )
 
     @root_validator
     def validate_prompt(cls, values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
@@ -90,12 +149,49 @@ class Prompt(BaseModel):
 
         return values
 
+    def compiled_template(
+        self, with_format_instruction: bool = True
+    ) -> CompiledTemplate:
+        """
+        Return the rendered template, it is cached until the fields it is
+        rendered from change, including examples edited in place.
+        """
+        fields = self._template_fields()
+        cached = self._compiled.get(with_format_instruction)
+        if cached is not None and cached[1] == fields:
+            return cached[0]
+        compiled = CompiledTemplate.compile(
+            self._render_template(with_format_instruction)
+        )
+        # copies of the prompt share the dict, it is replaced rather than updated
+        self._compiled = {
+            **self._compiled,
+            # a snapshot, the examples may be edited in place later. The copied
+            # strings are the same objects, comparing them is cheap
+            with_format_instruction: (compiled, copy.deepcopy(fields)),
+        }
+        return compiled
+
+    def _template_fields(self) -> t.Tuple[t.Any, ...]:
+        """The fields the template is rendered from."""
+        return (
+            self.instruction,
+            self.output_format_instruction,
+            self.examples,
+            self.input_keys,
+            self.output_key,
+            self.output_type,
+        )
+
     def to_string(self) -> str:
         """
         Generate the prompt string from the variables.
         """
+        return self.compiled_template().template
+
+    def _render_template(self, with_format_instruction: bool = True) -> str:
         prompt_elements = [self.instruction]
-        if self.output_format_instruction:
+        if self.output_format_instruction and with_format_instruction:
             prompt_elements.append(
                 "\n"
                 + self.output_format_instruction.replace("{", "{{").replace("}", "}}")
@@ -162,8 +258,19 @@ class Prompt(BaseModel):
             if isinstance(value, str):
                 kwargs[key] = json.dumps(value)
 
-        prompt = self.to_string()
-        return PromptValue(prompt_str=prompt.format(**kwargs))
+        prompt_str = self.compiled_template().format(**kwargs)
+        if self.output_model is None:
+            return PromptValue(prompt_str=prompt_str)
+        return PromptValue(
+            prompt_str=prompt_str,
+            output_model=self.output_model,
+            render_without_format=functools.partial(
+                self._format_without_instructions, kwargs
+            ),
+        )
+
+    def _format_without_instructions(self, kwargs: t.Dict[str, t.Any]) -> str:
+        return self.compiled_template(with_format_instruction=False).format(**kwargs)
 
     def adapt(
         self, language: str, llm: BaseRagasLLM, cache_dir: t.Optional[str] = None
@@ -277,7 +384,8 @@ class Prompt(BaseModel):
 
         cache_path = os.path.join(cache_dir, f"{self.name}.json")
         with open(cache_path, "w") as file:
-            json.dump(self.dict(), file, indent=4)
+            # the output model is code, it is set again by the prompt definition
+            json.dump(self.dict(exclude={"output_model"}), file, indent=4)
 
     @classmethod
     def _load(cls, language: str, name: str, cache_dir: str) -> Prompt:
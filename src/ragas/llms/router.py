@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+from dataclasses import asdict, dataclass, field
+from functools import partial
+
+from langchain_core.outputs import LLMResult
+
+from ragas.circuit_breaker import get_circuit_breaker
+from ragas.concurrency import is_overload_error
+from ragas.exceptions import CircuitOpenError
+from ragas.llms.base import BaseRagasLLM
+from ragas.rate_limiter import estimate_tokens, get_rate_limiter
+from ragas.run_config import (
+    RunConfig,
+    add_async_retry,
+    add_retry,
+    async_guard_with_circuit_breaker,
+    get_retry_after,
+    guard_with_circuit_breaker,
+)
+
+if t.TYPE_CHECKING:
+    from langchain_core.callbacks import Callbacks
+
+    from ragas.llms.prompt import PromptValue
+
+logger = logging.getLogger(__name__)
+
+SERVER_ERROR_NAMES = {
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "APIConnectionError",
+}
+
+
+def is_failover_error(exc: BaseException) -> bool:
+    """
+    Return whether the request should be sent to another backend, ie. the
+    backend is rate limited (HTTP 429), timed out, unreachable, returned a 5xx
+    or its circuit is open.
+    """
+    if isinstance(exc, CircuitOpenError) or is_overload_error(exc):
+        return True
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int) and status_code >= 500:
+        return True
+    return any(cls.__name__ in SERVER_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return any(cls.__name__ == "RateLimitError" for cls in type(exc).__mro__)
+
+
+@dataclass
+class BackendStats:
+    """
+    Routing state and counters of a single backend of a `RoutedLLM`.
+
+    `latency` and `error_rate` are exponentially weighted moving averages, the
+    backend's share of the traffic is proportional to `weight` divided by its
+    latency and scaled down by its error rate.
+    """
+
+    name: str
+    weight: float = 1.0
+    outstanding: int = 0
+    num_requests: int = 0
+    # requests that failed on this backend, most of them were failed over
+    num_errors: int = 0
+    latency: t.Optional[float] = None
+    error_rate: float = 0.0
+    cooldown_until: float = field(default=0.0, repr=False)
+
+
+class RoutedLLM(BaseRagasLLM):
+    """
+    Spreads the requests over several backends serving the same model, eg.
+    deployments in different regions, so their quotas add up.
+
+    Every request goes to the backend with the fewest outstanding requests
+    relative to its effective weight, which adapts to the observed latency and
+    error rate. Requests that are rate limited, time out or fail with a 5xx on
+    one backend are sent to the next one, a rate limited backend is skipped
+    until its `Retry-After` passes (or `cooldown` seconds without a hint).
+    Once every backend failed the request is retried as configured in the run
+    config.
+
+    Rate limits (`requests_per_minute`, `tokens_per_minute`) and circuit
+    breakers apply to each backend separately.
+
+    Parameters
+    ----------
+    backends : Sequence[BaseRagasLLM]
+        The LLMs to route between.
+    weights : Sequence[float], optional
+        Relative capacity of the backends, by default equal.
+    names : Sequence[str], optional
+        Names of the backends in stats, logs and per backend limits. By default
+        the model names, numbered if they are not unique.
+    smoothing : float
+        Weight of the newest observation in the latency and error rate
+        averages, by default 0.2.
+    cooldown : float
+        Seconds a rate limited backend is skipped if it did not say how long to
+        wait, by default 5.
+    run_config : RunConfig, optional
+        Run config of the router, also set on the backends.
+
+    Examples
+    --------
+    ```
+    >>> llm = RoutedLLM(
+    ...     [LangchainLLMWrapper(AzureChatOpenAI(...)) for region in regions],
+    ...     names=regions,
+    ... )
+    >>> result = evaluate(dataset, llm=llm)
+    >>> llm.get_stats()["eastus"]["num_requests"]
+    412
+    ```
+    """
+
+    def __init__(
+        self,
+        backends: t.Sequence[BaseRagasLLM],
+        weights: t.Optional[t.Sequence[float]] = None,
+        names: t.Optional[t.Sequence[str]] = None,
+        smoothing: float = 0.2,
+        cooldown: float = 5.0,
+        run_config: t.Optional[RunConfig] = None,
+    ):
+        if not backends:
+            raise ValueError("RoutedLLM needs at least one backend")
+        weights = [1.0] * len(backends) if weights is None else list(weights)
+        if len(weights) != len(backends) or any(w <= 0 for w in weights):
+            raise ValueError("weights should be one positive number per backend")
+        if names is None:
+            model_names = [backend.get_model_name() for backend in backends]
+            names = [
+                name if model_names.count(name) == 1 else f"{name}[{i}]"
+                for i, name in enumerate(model_names)
+            ]
+        if len(set(names)) != len(backends):
+            raise ValueError("names should be one unique name per backend")
+
+        self.backends = list(backends)
+        self.stats = [
+            BackendStats(name=name, weight=weight)
+            for name, weight in zip(names, weights)
+        ]
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.set_run_config(run_config or RunConfig())
+
+    def set_run_config(self, run_config: RunConfig):
+        self.run_config = run_config
+        for backend in self.backends:
+            backend.set_run_config(run_config)
+
+    def get_model_name(self) -> str:
+        return "|".join(sorted({backend.get_model_name() for backend in self.backends}))
+
+    def get_stats(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """Counters and routing state of every backend, by name."""
+        with self._lock:
+            stats = {}
+            for backend_stats in self.stats:
+                backend = asdict(backend_stats)
+                del backend["cooldown_until"]
+                backend["effective_weight"] = self._effective_weight(backend_stats)
+                stats[backend_stats.name] = backend
+            return stats
+
+    def _effective_weight(self, stats: BackendStats) -> float:
+        latencies = [s.latency for s in self.stats if s.latency is not None]
+        # backends without observations look like the average one
+        latency = stats.latency
+        if latency is None:
+            latency = sum(latencies) / len(latencies) if latencies else 1.0
+        health = max(1.0 - stats.error_rate, 0.05)
+        return stats.weight * health / max(latency, 1e-3)
+
+    def _acquire(self, tried: t.Set[int]) -> t.Optional[int]:
+        """Pick the next backend for a request and count it as outstanding."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                i
+                for i in range(len(self.backends))
+                if i not in tried and self._allows_request(i)
+            ]
+            if not candidates:
+                return None
+            ready = [i for i in candidates if self.stats[i].cooldown_until <= now]
+            if ready:
+                index = min(
+                    ready,
+                    key=lambda i: (self.stats[i].outstanding + 1)
+                    / self._effective_weight(self.stats[i]),
+                )
+            elif tried:
+                # everything left is rate limited, let the retry wait it out
+                return None
+            else:
+                index = min(candidates, key=lambda i: self.stats[i].cooldown_until)
+            self.stats[index].outstanding += 1
+            self.stats[index].num_requests += 1
+            return index
+
+    def _next_backend(
+        self, tried: t.Set[int], last_error: t.Optional[Exception]
+    ) -> int:
+        index = self._acquire(tried)
+        if index is None:
+            if last_error is not None:
+                raise last_error
+            raise CircuitOpenError(self.get_model_name())
+        tried.add(index)
+        return index
+
+    def _allows_request(self, index: int) -> bool:
+        # half-opens the circuit once it recovered, so the backend gets probed
+        breaker = get_circuit_breaker(self.stats[index].name, self.run_config)
+        return breaker is None or breaker.allows_request()
+
+    def _release(self, index: int, latency: float):
+        alpha = self.smoothing
+        with self._lock:
+            stats = self.stats[index]
+            stats.outstanding -= 1
+            stats.latency = (
+                latency
+                if stats.latency is None
+                else (1 - alpha) * stats.latency + alpha * latency
+            )
+            stats.error_rate = (1 - alpha) * stats.error_rate
+
+    def _release_failed(self, index: int, error: BaseException) -> bool:
+        """Record a failed request, return whether to fail over."""
+        failover = isinstance(error, Exception) and is_failover_error(error)
+        with self._lock:
+            stats = self.stats[index]
+            stats.outstanding -= 1
+            if not isinstance(error, Exception):
+                # cancelled, says nothing about the backend
+                return False
+            stats.num_errors += 1
+            if failover:
+                stats.error_rate = (
+                    1 - self.smoothing
+                ) * stats.error_rate + self.smoothing
+            if is_rate_limit_error(error):
+                retry_after = get_retry_after(error)
+                stats.cooldown_until = time.monotonic() + (
+                    self.cooldown if retry_after is None else retry_after
+                )
+        if failover:
+            logger.info("backend %s failed, failing over: %r", stats.name, error)
+        return failover
+
+    def _wrap(self, index: int, fn):
+        breaker = get_circuit_breaker(self.stats[index].name, self.run_config)
+        if breaker is None:
+            return fn
+        if asyncio.iscoroutinefunction(fn):
+            return async_guard_with_circuit_breaker(fn, breaker)
+        return guard_with_circuit_breaker(fn, breaker)
+
+    async def agenerate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = None,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        tried: t.Set[int] = set()
+        last_error: t.Optional[Exception] = None
+        while True:
+            index = self._next_backend(tried, last_error)
+            backend = self.backends[index]
+            try:
+                rate_limiter = get_rate_limiter(self.stats[index].name, self.run_config)
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(
+                        estimate_tokens(prompt.to_string(), backend.get_model_name())
+                    )
+                # waiting for the rate limiter is not the backend's latency
+                start = time.monotonic()
+                agenerate_text = self._wrap(index, backend.agenerate_text)
+                result = await agenerate_text(prompt, n, temperature, stop, callbacks)
+            except BaseException as e:
+                if not self._release_failed(index, e):
+                    raise
+                last_error = t.cast(Exception, e)
+                continue
+            self._release(index, time.monotonic() - start)
+            return result
+
+    def generate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: float = 1e-8,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        tried: t.Set[int] = set()
+        last_error: t.Optional[Exception] = None
+        while True:
+            index = self._next_backend(tried, last_error)
+            backend = self.backends[index]
+            try:
+                rate_limiter = get_rate_limiter(self.stats[index].name, self.run_config)
+                if rate_limiter is not None:
+                    rate_limiter.acquire_blocking(
+                        estimate_tokens(prompt.to_string(), backend.get_model_name())
+                    )
+                start = time.monotonic()
+                generate_text = self._wrap(index, backend.generate_text)
+                result = generate_text(prompt, n, temperature, stop, callbacks)
+            except BaseException as e:
+                if not self._release_failed(index, e):
+                    raise
+                last_error = t.cast(Exception, e)
+                continue
+            self._release(index, time.monotonic() - start)
+            return result
+
+    async def _generate(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+        callbacks: Callbacks,
+        is_async: bool,
+    ) -> LLMResult:
+        # rate limits and circuit breakers are per backend, see agenerate_text,
+        # the retries start over once every backend failed
+        if is_async:
+            agenerate_text = add_async_retry(self.agenerate_text, self.run_config)
+            return await agenerate_text(
+                prompt=prompt,
+                n=n,
+                temperature=temperature,
+                stop=stop,
+                callbacks=callbacks,
+            )
+        loop = asyncio.get_event_loop()
+        generate_text = partial(
+            add_retry(self.generate_text, self.run_config),
+            prompt=prompt,
+            n=n,
+            temperature=temperature,
+            stop=stop,
+            callbacks=callbacks,
+        )
+        return await loop.run_in_executor(None, generate_text)
@@ -54,6 +54,7 @@ CORRECTNESS_PROMPT = Prompt(
     name="answer_correctness",
     instruction=CORRECTNESS_INSTRUCTIONS,
     output_format_instruction=_output_instructions,
+    output_model=AnswerCorrectnessClassification,
     examples=[
         {
             "question": """What powers the sun and what is its primary function?""",
@@ -216,6 +217,10 @@ class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings, SingleTurnMetric):
         )
         return prompt_value
 
+    def expected_llm_calls(self, sample: SingleTurnSample) -> int:
+        # statements for the response and the reference, then the classification
+        return 3
+
     async def _single_turn_ascore(
         self: t.Self, sample: SingleTurnSample, callbacks: Callbacks
     ) -> float:
@@ -40,6 +40,7 @@ QUESTION_GEN = Prompt(
     name="question_generation",
     instruction="""Generate a question for the given answer and Identify if answer is noncommittal. Give noncommittal as 1 if the answer is noncommittal and 0 if the answer is committal. A noncommittal answer is one that is evasive, vague, or ambiguous. For example, "I don't know" or "I'm not sure" are noncommittal answers""",
     output_format_instruction=_output_instructions,
+    output_model=AnswerRelevanceClassification,
     examples=[
         {
             "answer": """Albert Einstein was born in Germany.""",
@@ -36,6 +36,7 @@ TEXT_ENTITY_EXTRACTION = Prompt(
     output_key="output",
     output_type="json",
     output_format_instruction=_output_instructions,
+    output_model=ContextEntitiesResponse,
     examples=[
         {
             "text": """The Eiffel Tower, located in Paris, France, is one of the most iconic landmarks globally.
@@ -41,6 +41,7 @@ CONTEXT_PRECISION = Prompt(
     name="context_precision",
     instruction="""Given question, answer and context verify if the context was useful in arriving at the given answer. Give verdict as "1" if useful and "0" if not with json output.""",
     output_format_instruction=_verification_output_instructions,
+    output_model=ContextPrecisionVerification,
     examples=[
         {
             "question": """What can you tell me about albert Albert Einstein?""",
@@ -151,6 +152,10 @@ class LLMContextPrecisionWithReference(MetricWithLLM, SingleTurnMetric):
             )
         return score
 
+    def expected_llm_calls(self, sample: SingleTurnSample) -> int:
+        # one verification per retrieved context, made one after the other
+        return max(1, len(sample.retrieved_contexts or []))
+
     async def _single_turn_ascore(
         self, sample: SingleTurnSample, callbacks: Callbacks
     ) -> float:
@@ -220,6 +225,7 @@ class LLMContextPrecisionWithoutReference(LLMContextPrecisionWithReference):
 @dataclass
 class NonLLMContextPrecisionWithReference(SingleTurnMetric):
     name: str = "non_llm_context_precision_with_reference"  # type: ignore
+    _cpu_bound = True
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {
             MetricType.SINGLE_TURN: {
@@ -46,6 +46,7 @@ CONTEXT_RECALL_RA = Prompt(
     name="context_recall",
     instruction="""Given a context, and an answer, analyze each sentence in the answer and classify if the sentence can be attributed to the given context or not. Use only "Yes" (1) or "No" (0) as a binary classification. Output json with reason.""",
     output_format_instruction=_classification_output_instructions,
+    output_model=ContextRecallClassificationAnswers,
     examples=[
         {
             "question": """What can you tell me about albert Albert Einstein?""",
@@ -235,6 +236,7 @@ class ContextRecall(LLMContextRecall):
 @dataclass
 class NonLLMContextRecall(SingleTurnMetric):
     name: str = "non_llm_context_recall"  # type: ignore
+    _cpu_bound = True
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {
             MetricType.SINGLE_TURN: {
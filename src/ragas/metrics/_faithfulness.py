@@ -54,6 +54,7 @@ _statements_output_parser = RagasoutputParser(pydantic_object=StatementsAnswers)
 LONG_FORM_ANSWER_PROMPT = Prompt(
     name="long_form_answer",
     output_format_instruction=_statements_output_instructions,
+    output_model=StatementsAnswers,
     instruction="Given a question, an answer, and sentences from the answer analyze the complexity of each sentence given under 'sentences' and break down each sentence into one or more fully understandable statements while also ensuring no pronouns are used in each statement. Format the outputs in JSON.",
     examples=[
         {
@@ -113,6 +114,7 @@ NLI_STATEMENTS_MESSAGE = Prompt(
     name="nli_statements",
     instruction="Your task is to judge the faithfulness of a series of statements based on a given context. For each statement you must return verdict as 1 if the statement can be directly inferred based on the context or 0 if the statement can not be directly inferred based on the context.",
     output_format_instruction=_faithfulness_output_instructions,
+    output_model=StatementFaithfulnessAnswers,
     examples=[
         {
             "context": """John is a student at XYZ University. He is pursuing a degree in Computer Science. He is enrolled in several courses this semester, including Data Structures, Algorithms, and Database Management. John is a diligent student and spends a significant amount of time studying and completing assignments. He often stays late in the library to work on his projects.""",
@@ -249,6 +251,10 @@ class Faithfulness(MetricWithLLM, SingleTurnMetric):
 
         return score
 
+    def expected_llm_calls(self, sample: SingleTurnSample) -> int:
+        # statement extraction followed by the NLI verdicts
+        return 2
+
     async def _single_turn_ascore(
         self, sample: SingleTurnSample, callbacks: Callbacks
     ) -> float:
@@ -221,6 +221,11 @@ class NoiseSensitivity(MetricWithLLM, SingleTurnMetric):
 
         return noise_sensitivity_in_relevant
 
+    def expected_llm_calls(self, sample: SingleTurnSample) -> int:
+        # two statement decompositions, two verdicts per context and one
+        # ground truth to answer verdict
+        return 3 + 2 * len(sample.retrieved_contexts or [])
+
     async def _single_turn_ascore(
         self, sample: SingleTurnSample, callbacks: Callbacks
     ) -> float:
@@ -60,6 +60,7 @@ class StringPresent(SingleTurnMetric):
 @dataclass
 class NonLLMStringSimilarity(SingleTurnMetric):
     name: str = "non_llm_string_similarity"  # type: ignore
+    _cpu_bound = True
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {MetricType.SINGLE_TURN: {"reference", "response"}}
     )
@@ -79,6 +80,16 @@ class NonLLMStringSimilarity(SingleTurnMetric):
             DistanceMeasure.JARO: distance.Jaro,
         }
 
+    def __getstate__(self):
+        # rapidfuzz distance modules can't be pickled, rebuild them on load
+        state = self.__dict__.copy()
+        state.pop("distance_measure_map", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__post_init__()
+
     def init(self, run_config: RunConfig):
         pass
 
@@ -54,6 +54,7 @@ TEXT_EXTRACT_KEYPHRASES = Prompt(
     name="text_extract_keyphrases",
     instruction="Extract the keyphrases essential for summarizing the text.",
     output_format_instruction=_output_instructions_keyphrase_extraction,
+    output_model=ExtractKeyphrasesResponse,
     input_keys=["text"],
     output_key="keyphrases",
     output_type="json",
@@ -80,6 +81,7 @@ TEXT_GENERATE_QUESTIONS = Prompt(
     name="text_generate_questions",
     instruction="Based on the given text and keyphrases, generate closed-ended questions that can be answered with '1' if the question can be answered using the text, or '0' if it cannot. The questions should ALWAYS result in a '1' based on the given text.",
     output_format_instruction=_output_instructions_question_generation,
+    output_model=GenerateQuestionsResponse,
     input_keys=["text", "keyphrases"],
     output_key="questions",
     output_type="json",
@@ -116,6 +118,7 @@ TEXT_GENERATE_ANSWERS = Prompt(
     name="text_generate_answers",
     instruction="Based on the list of close-ended '1' or '0' questions, generate a JSON with key 'answers', which is a list of strings that determines whether the provided summary contains sufficient information to answer EACH question. Answers should STRICTLY be either '1' or '0'. Answer '0' if the provided summary does not contain enough information to answer the question and answer '1' if the provided summary can answer the question.",
     output_format_instruction=_output_instructions_answer_generation,
+    output_model=GenerateAnswersResponse,
     input_keys=["summary", "questions"],
     output_key="answers",
     output_type="json",
@@ -165,6 +168,10 @@ class SummarizationScore(MetricWithLLM, SingleTurnMetric):
         default_factory=lambda: TEXT_EXTRACT_KEYPHRASES
     )
 
+    def expected_llm_calls(self, sample: SingleTurnSample) -> int:
+        # keyphrases, questions and answers
+        return 3
+
     async def _single_turn_ascore(
         self, sample: SingleTurnSample, callbacks: Callbacks
     ) -> float:
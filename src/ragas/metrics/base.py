@@ -15,9 +15,9 @@ from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ragas.async_utils import run
 from ragas.callbacks import new_group
 from ragas.dataset_schema import MultiTurnSample, SingleTurnSample
-from ragas.executor import is_event_loop_running
 from ragas.run_config import RunConfig
 from ragas.utils import deprecated
 
@@ -98,22 +98,21 @@ class Metric(ABC):
             "adapt() is not implemented for {} metric".format(self.name)
         )
 
+    def expected_llm_calls(
+        self, sample: t.Union[SingleTurnSample, MultiTurnSample]
+    ) -> int:
+        """
+        Number of sequential LLM calls needed to score the sample. The executor
+        uses it to start the slowest jobs first.
+        """
+        return 0
+
     @deprecated("0.2", removal="0.3", alternative="single_turn_ascore")
     def score(self: t.Self, row: t.Dict, callbacks: Callbacks = None) -> float:
         callbacks = callbacks or []
         rm, group_cm = new_group(self.name, inputs=row, callbacks=callbacks)
         try:
-            if is_event_loop_running():
-                try:
-                    import nest_asyncio
-
-                    nest_asyncio.apply()
-                except ImportError:
-                    raise ImportError(
-                        "It seems like your running this in a jupyter-like environment. Please install nest_asyncio with `pip install nest_asyncio` to make it work."
-                    )
-            loop = asyncio.get_event_loop()
-            score = loop.run_until_complete(self._ascore(row=row, callbacks=group_cm))
+            score = run(self._ascore(row=row, callbacks=group_cm))
         except Exception as e:
             if not group_cm.ended:
                 rm.on_chain_error(e)
@@ -166,6 +165,11 @@ class MetricWithLLM(Metric):
             )
         self.llm.set_run_config(run_config)
 
+    def expected_llm_calls(
+        self, sample: t.Union[SingleTurnSample, MultiTurnSample]
+    ) -> int:
+        return 1
+
     def get_prompts(self) -> t.Dict[str, Prompt]:
         prompts = {}
         for name, value in inspect.getmembers(self):
@@ -205,6 +209,10 @@ class MetricWithEmbeddings(Metric):
 
 
 class SingleTurnMetric(Metric):
+    # metrics that only do CPU work (no LLM or embeddings calls) set this so
+    # evaluate() can score them in a process pool instead of the event loop
+    _cpu_bound: t.ClassVar[bool] = False
+
     def single_turn_score(
         self,
         sample: SingleTurnSample,
@@ -213,10 +221,7 @@ class SingleTurnMetric(Metric):
         callbacks = callbacks or []
         rm, group_cm = new_group(self.name, inputs=sample.dict(), callbacks=callbacks)
         try:
-            loop = asyncio.get_event_loop()
-            score = loop.run_until_complete(
-                self._single_turn_ascore(sample=sample, callbacks=group_cm)
-            )
+            score = run(self._single_turn_ascore(sample=sample, callbacks=group_cm))
         except Exception as e:
             if not group_cm.ended:
                 rm.on_chain_error(e)
@@ -266,10 +271,7 @@ class MultiTurnMetric(Metric):
         callbacks = callbacks or []
         rm, group_cm = new_group(self.name, inputs=sample.dict(), callbacks=callbacks)
         try:
-            loop = asyncio.get_event_loop()
-            score = loop.run_until_complete(
-                self._multi_turn_ascore(sample=sample, callbacks=group_cm)
-            )
+            score = run(self._multi_turn_ascore(sample=sample, callbacks=group_cm))
         except Exception as e:
             if not group_cm.ended:
                 rm.on_chain_error(e)
@@ -365,4 +367,29 @@ def is_reproducable(metric: Metric) -> bool:
     return hasattr(metric, "_reproducibility")
 
 
+def is_cpu_bound(metric: Metric) -> bool:
+    return isinstance(metric, SingleTurnMetric) and metric._cpu_bound
+
+
+def score_single_turn_samples(
+    metric: SingleTurnMetric, samples: t.List[SingleTurnSample]
+) -> t.List[t.Union[float, Exception]]:
+    """
+    Score a chunk of samples on the worker's event loop, this is the entrypoint used
+    by the process pool for CPU-bound metrics. Exceptions are returned in place
+    of the score so that one bad sample does not fail the whole chunk.
+    """
+
+    async def _score_all():
+        scores: t.List[t.Union[float, Exception]] = []
+        for sample in samples:
+            try:
+                scores.append(await metric._single_turn_ascore(sample, callbacks=[]))
+            except Exception as e:
+                scores.append(e)
+        return scores
+
+    return run(_score_all())
+
+
 ensembler = Ensember()
@@ -33,6 +33,7 @@ CRITIQUE_PROMPT = Prompt(
     name="critique",
     instruction="Given a input and submission. Evaluate the submission only using the given criteria. Use only 'Yes' (1) and 'No' (0) as verdict.",
     output_format_instruction=_output_instructions,
+    output_model=CriticClassification,
     examples=[
         {
             "input": "Who was the director of Los Alamos Laboratory?",
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+if t.TYPE_CHECKING:
+    from ragas.run_config import RunConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenBucket:
+    """
+    A token bucket that holds up to `capacity` tokens and refills continuously
+    at `capacity` tokens per `period` seconds.
+    """
+
+    capacity: float
+    period: float = 60.0
+    _tokens: float = field(init=False, repr=False)
+    _updated_at: float = field(init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if self.capacity <= 0:
+            raise ValueError("capacity of a TokenBucket should be greater than 0")
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / self.period
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate
+        )
+        self._updated_at = now
+
+    def try_acquire(self, amount: float) -> float:
+        """
+        Take `amount` tokens if they are available. Returns 0 on success or the
+        number of seconds to wait before the tokens will be available.
+        """
+        # a single request larger than the bucket could never go through
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.refill_rate
+
+    async def acquire(self, amount: float = 1):
+        while True:
+            wait = self.try_acquire(amount)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self, amount: float = 1):
+        while True:
+            wait = self.try_acquire(amount)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+@dataclass
+class RateLimiter:
+    """
+    Rate limiter that enforces requests-per-minute and tokens-per-minute
+    limits for a single model.
+    """
+
+    requests_per_minute: t.Optional[int] = None
+    tokens_per_minute: t.Optional[int] = None
+
+    def __post_init__(self):
+        self.request_bucket = (
+            TokenBucket(capacity=self.requests_per_minute)
+            if self.requests_per_minute is not None
+            else None
+        )
+        self.token_bucket = (
+            TokenBucket(capacity=self.tokens_per_minute)
+            if self.tokens_per_minute is not None
+            else None
+        )
+
+    async def acquire(self, num_tokens: int = 0):
+        """
+        Wait until one request with `num_tokens` tokens can be sent.
+        """
+        if self.request_bucket is not None:
+            await self.request_bucket.acquire(1)
+        if self.token_bucket is not None and num_tokens > 0:
+            await self.token_bucket.acquire(num_tokens)
+
+    def acquire_blocking(self, num_tokens: int = 0):
+        """
+        Same as `acquire`, for synchronous callers (eg. in executor threads).
+        """
+        if self.request_bucket is not None:
+            self.request_bucket.acquire_blocking(1)
+        if self.token_bucket is not None and num_tokens > 0:
+            self.token_bucket.acquire_blocking(num_tokens)
+
+
+_rate_limiters: t.Dict[t.Tuple[str, t.Optional[int], t.Optional[int]], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model: str, run_config: RunConfig) -> t.Optional[RateLimiter]:
+    """
+    Return the rate limiter shared by every caller of `model` with the limits in
+    `run_config`, or None if no limits are configured.
+    """
+    rpm = run_config.requests_per_minute
+    tpm = run_config.tokens_per_minute
+    if rpm is None and tpm is None:
+        return None
+
+    key = (model, rpm, tpm)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(
+                requests_per_minute=rpm, tokens_per_minute=tpm
+            )
+        return _rate_limiters[key]
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    import tiktoken
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # the encoding files could not be loaded (eg. no network access)
+        logger.debug("tiktoken encoding not available, estimating tokens: %s", e)
+        return None
+
+
+def estimate_tokens(text: str, model: str = "") -> int:
+    """
+    Estimate the number of tokens in `text` using tiktoken. Falls back to a
+    rough 4 characters per token estimate if the encoding is not available.
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
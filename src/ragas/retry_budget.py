@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from collections import deque
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryBudget:
+    """
+    Run-wide budget that limits retries to `ratio` times the number of
+    successful calls in the last `window` seconds, plus `min_retries` so a run
+    can retry before anything has succeeded. Once the budget is used up failed
+    calls are not retried, which keeps an outage from multiplying the load on
+    the provider.
+
+    Parameters
+    ----------
+    ratio : float
+        Retries allowed per successful call, by default 0.1.
+    window : float
+        Length (in seconds) of the sliding window, by default 60.
+    min_retries : int
+        Retries allowed per window irrespective of the successes, by default 10.
+    """
+
+    ratio: float = 0.1
+    window: float = 60.0
+    min_retries: int = 10
+    # number of retries that were refused because the budget was used up
+    num_rejected: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self._successes: t.Deque[float] = deque()
+        self._retries: t.Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float):
+        for events in (self._successes, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    @property
+    def available(self) -> float:
+        """Number of retries that can still be made in the current window."""
+        with self._lock:
+            self._evict(time.monotonic())
+            return self._available()
+
+    def _available(self) -> float:
+        return self.min_retries + self.ratio * len(self._successes) - len(self._retries)
+
+    def record_success(self):
+        with self._lock:
+            now = time.monotonic()
+            self._evict(now)
+            self._successes.append(now)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, return False if none are left."""
+        with self._lock:
+            now = time.monotonic()
+            self._evict(now)
+            if self._available() < 1:
+                self.num_rejected += 1
+                return False
+            self._retries.append(now)
+            return True
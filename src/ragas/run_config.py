@@ -1,18 +1,41 @@
 import logging
+import random
+import re
+import threading
+import time
 import typing as t
 from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import wraps
 
 import numpy as np
 from tenacity import (
     AsyncRetrying,
+    Future,
+    RetryCallState,
     Retrying,
     WrappedFn,
     after_log,
+    retry_if_exception,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_random_exponential,
 )
 from tenacity.after import after_nothing
+from tenacity.retry import retry_base
+from tenacity.wait import wait_base
+
+from ragas.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from ragas.concurrency import AIMDConcurrencyController, is_overload_error
+from ragas.exceptions import (
+    BatchRequestPending,
+    CircuitOpenError,
+    RetryBudgetExhausted,
+)
+from ragas.rate_limiter import RateLimiter, get_rate_limiter
+from ragas.retry_budget import RetryBudget
 
 
 @dataclass
@@ -27,7 +50,9 @@ class RunConfig:
     max_retries : int, optional
         Maximum number of retry attempts, by default 10.
     max_wait : int, optional
-        Maximum wait time (in seconds) between retries, by default 60.
+        Maximum wait time (in seconds) between retries, by default 60. If the
+        provider sends a `Retry-After` or `x-ratelimit-reset-*` header, the
+        retry waits as long as the header asks for instead, up to `max_wait`.
     max_workers : int, optional
         Maximum number of concurrent workers, by default 16.
     exception_types : Union[Type[BaseException], Tuple[Type[BaseException], ...]], optional
@@ -36,11 +61,73 @@ class RunConfig:
         Whether to log retry attempts using tenacity, by default False.
     seed : int, optional
         Random seed for reproducibility, by default 42.
+    requests_per_minute : int, optional
+        Maximum number of requests per minute sent to a single model, by default
+        None (no limit).
+    tokens_per_minute : int, optional
+        Maximum number of prompt tokens per minute sent to a single model, by
+        default None (no limit). Tokens are estimated with tiktoken.
+    adaptive_concurrency : bool, optional
+        Whether to adapt the number of concurrent workers, by default False. The
+        concurrency grows additively while calls succeed with stable latency and
+        shrinks multiplicatively on rate limits or timeouts, with `max_workers`
+        as the upper bound.
+    cpu_workers : int, optional
+        Number of processes used by `evaluate()` to score CPU-bound metrics (eg.
+        `BleuScore`, `RougeScore`) in parallel with the LLM calls, by default 0
+        which scores them on the event loop. Use -1 for one process per CPU.
+        The processes are started with the "spawn" method, which imports the
+        `__main__` module again, so a script that sets it must call
+        `evaluate()` under an `if __name__ == "__main__":` guard.
+    time_budget : float, optional
+        Maximum time (in seconds) for a whole run, by default None (no limit).
+        Jobs that have not started when the budget runs out are skipped and
+        reported as missing.
+    time_budget_grace_period : float, optional
+        Extra time (in seconds) given to jobs that are still running when the
+        time budget runs out before they are cancelled, by default 30.
+    hedge_requests : bool, optional
+        Whether to send a duplicate of an LLM request that is slower than the
+        `hedge_percentile` latency observed for the model and use whichever
+        response arrives first, by default False.
+    hedge_percentile : float, optional
+        Latency percentile after which a request is hedged, by default 95.
+    max_hedge_fraction : float, optional
+        Maximum number of hedged requests as a fraction of all requests to a
+        model, by default 0.05.
+    circuit_breaker_threshold : int, optional
+        Number of consecutive failed calls to an LLM or embeddings endpoint
+        after which its circuit breaker opens and calls fail fast with
+        `CircuitOpenError` instead of being retried, by default None (no
+        circuit breaker).
+    circuit_breaker_recovery_time : float, optional
+        Time (in seconds) an open circuit waits before letting a probe call
+        through, by default 30.
+    retry_budget : float, optional
+        Maximum number of retries as a fraction of the successful calls in the
+        last `retry_budget_window` seconds, shared by all calls in the run, by
+        default None (no budget). Once the budget is used up failed calls raise
+        `RetryBudgetExhausted` instead of being retried, so the job scores NaN.
+    retry_budget_window : float, optional
+        Length (in seconds) of the sliding window for `retry_budget`, by
+        default 60.
+    deduplicate_requests : bool, optional
+        Whether identical LLM and embeddings requests that are in flight at the
+        same time share a single call, by default False. Only the callbacks of
+        the caller that makes the call see its LLM events.
 
     Attributes
     ----------
     rng : numpy.random.Generator
         Random number generator initialized with the specified seed.
+    concurrency_controller : AIMDConcurrencyController or None
+        Controller tracking the current concurrency level and its adjustment
+        history if `adaptive_concurrency` is enabled.
+    circuit_breakers : dict[str, CircuitBreaker]
+        Circuit breaker of every endpoint called with this config, if
+        `circuit_breaker_threshold` is set.
+    retry_budget_tracker : RetryBudget or None
+        Shared retry budget of the run if `retry_budget` is set.
 
     Notes
     -----
@@ -58,12 +145,311 @@ class RunConfig:
     ] = (Exception,)
     log_tenacity: bool = False
     seed: int = 42
+    requests_per_minute: t.Optional[int] = None
+    tokens_per_minute: t.Optional[int] = None
+    adaptive_concurrency: bool = False
+    cpu_workers: int = 0
+    time_budget: t.Optional[float] = None
+    time_budget_grace_period: float = 30
+    hedge_requests: bool = False
+    hedge_percentile: float = 95
+    max_hedge_fraction: float = 0.05
+    circuit_breaker_threshold: t.Optional[int] = None
+    circuit_breaker_recovery_time: float = 30
+    retry_budget: t.Optional[float] = None
+    retry_budget_window: float = 60
+    deduplicate_requests: bool = False
 
     def __post_init__(self):
         self.rng = np.random.default_rng(seed=self.seed)
+        self.circuit_breakers: t.Dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
+        self.retry_budget_tracker: t.Optional[RetryBudget] = None
+        if self.retry_budget is not None:
+            self.retry_budget_tracker = RetryBudget(
+                ratio=self.retry_budget, window=self.retry_budget_window
+            )
+        self.concurrency_controller: t.Optional[AIMDConcurrencyController] = None
+        if self.adaptive_concurrency:
+            self.concurrency_controller = AIMDConcurrencyController(
+                max_workers=(
+                    float("inf") if self.max_workers == -1 else self.max_workers
+                )
+            )
+
+
+def report_concurrency_signals(
+    fn: WrappedFn, controller: AIMDConcurrencyController
+) -> WrappedFn:
+    """
+    Report the latency of every successful call and every rate limit or
+    timeout to the concurrency controller.
+    """
+
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if is_overload_error(e):
+                controller.on_overload(e)
+            raise
+        controller.on_success(time.monotonic() - start)
+        return result
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def async_report_concurrency_signals(
+    fn: WrappedFn, controller: AIMDConcurrencyController
+) -> WrappedFn:
+    @wraps(fn)
+    async def wrapped(*args, **kwargs):
+        start = time.monotonic()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if is_overload_error(e):
+                controller.on_overload(e)
+            raise
+        controller.on_success(time.monotonic() - start)
+        return result
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def guard_with_circuit_breaker(fn: WrappedFn, breaker: CircuitBreaker) -> WrappedFn:
+    """
+    Fail fast with `CircuitOpenError` while the breaker is open and report
+    the outcome of every call to it.
+    """
+
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        breaker.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            breaker.on_failure(e)
+            raise
+        except BaseException:
+            breaker.on_cancel()
+            raise
+        breaker.on_success()
+        return result
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def async_guard_with_circuit_breaker(
+    fn: WrappedFn, breaker: CircuitBreaker
+) -> WrappedFn:
+    @wraps(fn)
+    async def wrapped(*args, **kwargs):
+        breaker.before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            breaker.on_failure(e)
+            raise
+        except BaseException:
+            breaker.on_cancel()
+            raise
+        breaker.on_success()
+        return result
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def limit_rate(fn: WrappedFn, rate_limiter: RateLimiter, num_tokens: int) -> WrappedFn:
+    """Wait for the rate limits before every call, ie. every retry too."""
+
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        rate_limiter.acquire_blocking(num_tokens)
+        return fn(*args, **kwargs)
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def async_limit_rate(
+    fn: WrappedFn, rate_limiter: RateLimiter, num_tokens: int
+) -> WrappedFn:
+    @wraps(fn)
+    async def wrapped(*args, **kwargs):
+        await rate_limiter.acquire(num_tokens)
+        return await fn(*args, **kwargs)
+
+    return t.cast(WrappedFn, wrapped)
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_duration(value: str) -> t.Optional[float]:
+    """Parse durations like "20ms", "1.5s" or "6m0s" (OpenAI's reset headers)."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def _parse_retry_after(value: str) -> t.Optional[float]:
+    """Parse a `Retry-After` header, either in seconds or an HTTP date."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return (date - datetime.now(date.tzinfo)).total_seconds()
+
+
+def get_retry_after(exc: BaseException) -> t.Optional[float]:
+    """
+    Return the number of seconds the provider asked us to wait before retrying,
+    read from the `retry-after-ms`, `retry-after` or `x-ratelimit-reset-*`
+    headers of the response attached to the exception (eg. openai's
+    `RateLimitError`). Returns None if there is no hint.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    if not headers:
+        return None
+
+    if headers.get("retry-after-ms") is not None:
+        try:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        except ValueError:
+            pass
+    if headers.get("retry-after") is not None:
+        seconds = _parse_retry_after(headers["retry-after"])
+        if seconds is not None:
+            return max(0.0, seconds)
+
+    # wait for the limits that are used up, or all of them if we can't tell
+    resets = []
+    for limit in ("requests", "tokens"):
+        reset = headers.get(f"x-ratelimit-reset-{limit}")
+        if reset is None:
+            continue
+        seconds = _parse_duration(reset)
+        if seconds is None:
+            continue
+        if headers.get(f"x-ratelimit-remaining-{limit}") not in (None, "0"):
+            continue
+        resets.append(seconds)
+    return max(resets) if resets else None
+
+
+class wait_retry_after(wait_base):
+    """
+    Wait as long as the provider asked for in the response headers of the last
+    error plus up to `jitter` of that time, so concurrent retries don't all fire
+    at the same moment, but at most `max_wait` seconds. Falls back to
+    `fallback` if there is no hint.
+    """
+
+    def __init__(
+        self,
+        fallback: wait_base,
+        jitter: float = 0.1,
+        max_wait: t.Optional[float] = None,
+    ):
+        self.fallback = fallback
+        self.jitter = jitter
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = get_retry_after(exc) if exc is not None else None
+        if retry_after is None:
+            return self.fallback(retry_state)
+        wait = retry_after * (1 + random.uniform(0, self.jitter))
+        # eg. a reset hours away, the retries and the time budget handle the rest
+        return wait if self.max_wait is None else min(wait, self.max_wait)
+
+
+class retry_if_budget_allows(retry_base):
+    """
+    Take one retry from the run's retry budget. If the budget is used up the
+    error is replaced with `RetryBudgetExhausted` and not retried.
+    """
+
+    def __init__(self, budget: RetryBudget, max_attempts: int):
+        self.budget = budget
+        self.max_attempts = max_attempts
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        outcome = retry_state.outcome
+        if outcome is None or not outcome.failed:
+            return True
+        if retry_state.attempt_number >= self.max_attempts:
+            # the stop condition ends it anyway, don't spend the budget
+            return True
+        if self.budget.try_spend():
+            return True
+        error = outcome.exception()
+        exhausted = RetryBudgetExhausted(error)
+        exhausted.__cause__ = error
+        retry_state.outcome = Future.construct(
+            retry_state.attempt_number, exhausted, has_exception=True
+        )
+        return False
 
 
-def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
+def retry_condition(run_config: RunConfig, breaker: t.Optional[CircuitBreaker]):
+    retry = retry_if_exception_type(
+        run_config.exception_types
+    ) & retry_if_not_exception_type((CircuitOpenError, BatchRequestPending))
+    if breaker is not None:
+        # stop retrying as soon as the failures opened the circuit
+        retry = retry & retry_if_exception(lambda _: not breaker.is_open)
+    if run_config.retry_budget_tracker is not None:
+        # checked last so only retries that would happen spend the budget
+        retry = retry & retry_if_budget_allows(
+            run_config.retry_budget_tracker, run_config.max_retries
+        )
+    return retry
+
+
+def record_successes(fn: WrappedFn, budget: RetryBudget) -> WrappedFn:
+    """Report every successful call to the retry budget."""
+
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        result = fn(*args, **kwargs)
+        budget.record_success()
+        return result
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def async_record_successes(fn: WrappedFn, budget: RetryBudget) -> WrappedFn:
+    @wraps(fn)
+    async def wrapped(*args, **kwargs):
+        result = await fn(*args, **kwargs)
+        budget.record_success()
+        return result
+
+    return t.cast(WrappedFn, wrapped)
+
+
+def add_retry(
+    fn: WrappedFn,
+    run_config: RunConfig,
+    endpoint: t.Optional[str] = None,
+    num_tokens: int = 0,
+) -> WrappedFn:
     # configure tenacity's after section wtih logger
     if run_config.log_tenacity is not None:
         logger = logging.getLogger(f"ragas.retry.{fn.__name__}")
@@ -71,19 +457,45 @@ def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
     else:
         tenacity_logger = after_nothing
 
+    if run_config.concurrency_controller is not None:
+        fn = report_concurrency_signals(fn, run_config.concurrency_controller)
+
+    breaker = (
+        get_circuit_breaker(endpoint, run_config) if endpoint is not None else None
+    )
+    if breaker is not None:
+        fn = guard_with_circuit_breaker(fn, breaker)
+    if run_config.retry_budget_tracker is not None:
+        fn = record_successes(fn, run_config.retry_budget_tracker)
+    rate_limiter = (
+        get_rate_limiter(endpoint, run_config) if endpoint is not None else None
+    )
+    if rate_limiter is not None:
+        fn = limit_rate(fn, rate_limiter, num_tokens)
+
     r = Retrying(
-        wait=wait_random_exponential(multiplier=1, max=run_config.max_wait),
+        wait=wait_retry_after(
+            wait_random_exponential(multiplier=1, max=run_config.max_wait),
+            max_wait=run_config.max_wait,
+        ),
         stop=stop_after_attempt(run_config.max_retries),
-        retry=retry_if_exception_type(run_config.exception_types),
+        retry=retry_condition(run_config, breaker),
         reraise=True,
         after=tenacity_logger,
     )
     return r.wraps(fn)
 
 
-def add_async_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
+def add_async_retry(
+    fn: WrappedFn,
+    run_config: RunConfig,
+    endpoint: t.Optional[str] = None,
+    num_tokens: int = 0,
+) -> WrappedFn:
     """
-    Decorator for retrying a function if it fails.
+    Decorator for retrying a function if it fails. If `endpoint` is given the
+    calls also go through the circuit breaker of that endpoint, and every
+    attempt waits for its rate limits, counting `num_tokens` tokens.
     """
     # configure tenacity's after section wtih logger
     if run_config.log_tenacity is not None:
@@ -92,10 +504,29 @@ def add_async_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
     else:
         tenacity_logger = after_nothing
 
+    if run_config.concurrency_controller is not None:
+        fn = async_report_concurrency_signals(fn, run_config.concurrency_controller)
+
+    breaker = (
+        get_circuit_breaker(endpoint, run_config) if endpoint is not None else None
+    )
+    if breaker is not None:
+        fn = async_guard_with_circuit_breaker(fn, breaker)
+    if run_config.retry_budget_tracker is not None:
+        fn = async_record_successes(fn, run_config.retry_budget_tracker)
+    rate_limiter = (
+        get_rate_limiter(endpoint, run_config) if endpoint is not None else None
+    )
+    if rate_limiter is not None:
+        fn = async_limit_rate(fn, rate_limiter, num_tokens)
+
     r = AsyncRetrying(
-        wait=wait_random_exponential(multiplier=1, max=run_config.max_wait),
+        wait=wait_retry_after(
+            wait_random_exponential(multiplier=1, max=run_config.max_wait),
+            max_wait=run_config.max_wait,
+        ),
         stop=stop_after_attempt(run_config.max_retries),
-        retry=retry_if_exception_type(run_config.exception_types),
+        retry=retry_condition(run_config, breaker),
         reraise=True,
         after=tenacity_logger,
     )
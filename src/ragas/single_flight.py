@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import threading
+import typing as t
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+T = t.TypeVar("T")
+
+
+@dataclass
+class _Call:
+    task: asyncio.Future
+    waiters: int = 1
+
+
+@dataclass
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: while a call is in flight,
+    callers with the same key wait for its result instead of making their own
+    call. Every caller gets its own copy of the result.
+
+    The call is only cancelled once every caller waiting for it was cancelled.
+    """
+
+    # number of calls that were served by a call already in flight
+    num_coalesced: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self._calls: t.Dict[t.Tuple[asyncio.AbstractEventLoop, t.Hashable], _Call] = {}
+        self._lock = threading.Lock()
+
+    async def do(self, key: t.Hashable, fn: t.Callable[[], t.Awaitable[T]]) -> T:
+        # futures can't be shared across event loops
+        call_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            call = self._calls.get(call_key)
+            leader = call is None
+            if call is None:
+                call = _Call(task=asyncio.ensure_future(fn()))
+                self._calls[call_key] = call
+                call.task.add_done_callback(
+                    lambda _: self._forget(call_key, t.cast(_Call, call))
+                )
+            else:
+                call.waiters += 1
+                self.num_coalesced += 1
+
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            with self._lock:
+                call.waiters -= 1
+                if call.waiters == 0:
+                    call.task.cancel()
+            raise
+        # callers may modify what they get back
+        return result if leader else copy.deepcopy(result)
+
+    def _forget(self, call_key, call: _Call):
+        with self._lock:
+            if self._calls.get(call_key) is call:
+                del self._calls[call_key]
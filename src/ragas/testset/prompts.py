@@ -144,6 +144,7 @@ question_answer_prompt = Prompt(
     name="answer_formulate",
     instruction="""Answer the question using the information from the given context. Output verdict as '1' if answer is present '-1' if answer is not present in the context.""",
     output_format_instruction=get_json_format_instructions(AnswerFormat),
+    output_model=AnswerFormat,
     examples=[
         {
             "context": """Climate change is significantly influenced by human activities, notably the emission of greenhouse gases from burning fossil fuels. The increased greenhouse gas concentration in the atmosphere traps more heat, leading to global warming and changes in weather patterns.""",
@@ -360,6 +361,7 @@ relevance: Judge the pertinence of the content to the main topic, awarding high
 Structure your JSON output to reflect these criteria as keys with their corresponding scores as values
     """,
     output_format_instruction=get_json_format_instructions(ContextScoring),
+    output_model=ContextScoring,
     examples=[
         {
             "context": "The Pythagorean theorem is a fundamental principle in geometry. It states that in a right-angled triangle, the square of the length of the hypotenuse (the side opposite the right angle) is equal to the sum of the squares of the lengths of the other two sides. This can be written as a^2 + b^2 = c^2 where c represents the length of the hypotenuse, and a and b represent the lengths of the other two sides.",
@@ -397,6 +399,7 @@ Based on these criteria, assign a verdict of "1" if a question is specific, inde
 Provide feedback and a verdict in JSON format, including suggestions for improvement if the question is deemed unclear. Highlight aspects of the question that contribute to its clarity or lack thereof, and offer advice on how it could be reframed or detailed for better understanding and answerability.
 """,
     output_format_instruction=get_json_format_instructions(QuestionFilter),
+    output_model=QuestionFilter,
     examples=[
         {
             "question": "What is the discovery about space?",
@@ -457,6 +460,7 @@ evolution_elimination_prompt = Prompt(
     2. They have same depth and breadth of the inquiry.
     Output verdict as 1 if they are equal and 0 if they are not""",
     output_format_instruction=get_json_format_instructions(EvolutionElimination),
+    output_model=EvolutionElimination,
     examples=[
         {
             "question1": "What are the primary causes of climate change?",
@@ -0,0 +1,64 @@
+import json
+import timeit
+
+from ragas.llms.json_load import json_loader
+
+NUMBER = 200
+
+
+def find_outermost_json(text):
+    stack = []
+    start_index = -1
+    for i, char in enumerate(text):
+        if char in "{[":
+            if len(stack) == 0:
+                start_index = i
+            stack.append(char)
+        elif char in "}]":
+            if len(stack) > 0:
+                last = stack.pop()
+                if (char == "}" and last != "{") or (char == "]" and last != "["):
+                    break
+            if len(stack) == 0 and start_index != -1:
+                return start_index, i + 1
+    return -1, -1
+
+
+def load_all_jsons_recursive(text):
+    # JsonLoader._load_all_jsons before it was made single pass
+    start, end = find_outermost_json(text)
+    _json = json.loads(text[start:end])
+    text = text.replace(text[start:end], "", 1)
+    start, end = find_outermost_json(text)
+    if (start, end) == (-1, -1):
+        return [_json]
+    return [_json] + load_all_jsons_recursive(text)
+
+
+def judge_output(num_verdicts, num_blobs):
+    """An NLI style judge output with `num_blobs` json blocks."""
+    verdicts = [
+        {
+            "statement": f"Statement number {i} about the context.",
+            "reason": "The context explicitly mentions it, see the second paragraph.",
+            "verdict": i % 2,
+        }
+        for i in range(num_verdicts)
+    ]
+    blob = json.dumps(verdicts, indent=4)
+    return "\n\n".join(f"Verdicts:\n```json\n{blob}\n```" for _ in range(num_blobs))
+
+
+if __name__ == "__main__":
+    for num_verdicts, num_blobs in [(20, 1), (20, 5), (50, 10)]:
+        text = judge_output(num_verdicts, num_blobs)
+        assert json_loader._load_all_jsons(text) == load_all_jsons_recursive(text)
+        recursive = timeit.timeit(lambda: load_all_jsons_recursive(text), number=NUMBER)
+        single_pass = timeit.timeit(
+            lambda: json_loader._load_all_jsons(text), number=NUMBER
+        )
+        print(
+            f"{len(text) / 1024:.0f}KB, {num_blobs} json: "
+            f"{recursive / NUMBER * 1e3:.2f}ms -> "
+            f"{single_pass / NUMBER * 1e3:.2f}ms ({recursive / single_pass:.0f}x)"
+        )
@@ -0,0 +1,47 @@
+import json
+import timeit
+
+from ragas.metrics._context_precision import CONTEXT_PRECISION
+from ragas.metrics._faithfulness import NLI_STATEMENTS_MESSAGE
+
+NUMBER = 10_000
+
+# (prompt, inputs) for one row
+cases = {
+    "NLI_STATEMENTS_MESSAGE": (
+        NLI_STATEMENTS_MESSAGE,
+        {
+            "context": "Albert Einstein was a German-born theoretical physicist.",
+            "statements": '["Einstein was born in Germany.", "He was a physicist."]',
+        },
+    ),
+    "CONTEXT_PRECISION": (
+        CONTEXT_PRECISION,
+        {
+            "question": "What can you tell me about Albert Einstein?",
+            "context": "Albert Einstein was a German-born theoretical physicist.",
+            "answer": "Albert Einstein was a theoretical physicist.",
+        },
+    ),
+}
+
+
+def format_uncompiled(prompt, inputs):
+    # what Prompt.format did before the template was compiled
+    return prompt._render_template().format(
+        **{k: json.dumps(v) if isinstance(v, str) else v for k, v in inputs.items()}
+    )
+
+
+if __name__ == "__main__":
+    for name, (prompt, inputs) in cases.items():
+        assert prompt.format(**inputs).to_string() == format_uncompiled(prompt, inputs)
+        uncompiled = timeit.timeit(
+            lambda: format_uncompiled(prompt, inputs), number=NUMBER
+        )
+        compiled = timeit.timeit(lambda: prompt.format(**inputs), number=NUMBER)
+        print(
+            f"{name}: {uncompiled / NUMBER * 1e6:.1f}us -> "
+            f"{compiled / NUMBER * 1e6:.1f}us per format "
+            f"({uncompiled / compiled:.1f}x)"
+        )
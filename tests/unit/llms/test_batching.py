@@ -0,0 +1,183 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation, LLMResult
+
+from ragas.llms.base import LangchainLLMWrapper
+from ragas.llms.batching import MicroBatcher
+from ragas.llms.prompt import PromptValue
+
+
+class FakeBatchLLM:
+    """Echoes every prompt and records the batches it was called with."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def agenerate_prompt(self, prompts, temperature=None, stop=None, **kwargs):
+        self.batches.append([p.to_string() for p in prompts])
+        await asyncio.sleep(0)
+        return LLMResult(
+            generations=[[Generation(text=p.to_string())] for p in prompts]
+        )
+
+
+def test_micro_batcher_groups_by_key():
+    batches = []
+
+    async def process_batch(key, items):
+        batches.append((key, items))
+        return [f"{key}-{item}" for item in items]
+
+    batcher = MicroBatcher(process_batch, max_batch_size=3, max_wait=0.05)
+
+    async def _run():
+        return await asyncio.gather(
+            *[batcher.submit("a", i) for i in range(4)], batcher.submit("b", 0)
+        )
+
+    results = asyncio.run(_run())
+
+    assert results == ["a-0", "a-1", "a-2", "a-3", "b-0"]
+    # the first batch is full, the rest are flushed after max_wait
+    assert sorted(batches) == [("a", [0, 1, 2]), ("a", [3]), ("b", [0])]
+
+
+def test_micro_batcher_shares_errors():
+    async def process_batch(key, items):
+        raise ConnectionError("server is down")
+
+    batcher = MicroBatcher(process_batch, max_batch_size=2)
+
+    async def _run():
+        return await asyncio.gather(
+            batcher.submit("a", 1), batcher.submit("a", 2), return_exceptions=True
+        )
+
+    assert all(isinstance(r, ConnectionError) for r in asyncio.run(_run()))
+
+
+def test_langchain_wrapper_batches_concurrent_calls():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class RecordOutputs(BaseCallbackHandler):
+        def __init__(self):
+            self.outputs = []
+
+        def on_llm_end(self, response, **kwargs):
+            self.outputs.append(response.generations[0][0].text)
+
+    fake = FakeBatchLLM()
+    llm = LangchainLLMWrapper(fake, batch_size=8, batch_wait=0.05)  # type: ignore
+    handler = RecordOutputs()
+
+    async def _run():
+        return await asyncio.gather(
+            *[
+                llm.agenerate_text(
+                    PromptValue(prompt_str=f"prompt {i}"),
+                    n=2,
+                    callbacks=[handler] if i == 1 else None,
+                )
+                for i in range(3)
+            ],
+            llm.agenerate_text(PromptValue(prompt_str="other"), stop=["\n"]),
+        )
+
+    results = asyncio.run(_run())
+
+    # one batch per (n, temperature, stop), prompts are repeated for n
+    assert sorted(len(batch) for batch in fake.batches) == [1, 6]
+    for i, result in enumerate(results[:3]):
+        assert [g.text for g in result.generations[0]] == [f"prompt {i}"] * 2
+    assert results[3].generations[0][0].text == "other"
+    # callbacks only hear about their own prompt
+    assert handler.outputs == ["prompt 1"]
+
+
+def test_langchain_wrapper_without_batching():
+    fake = FakeBatchLLM()
+    llm = LangchainLLMWrapper(fake)  # type: ignore
+
+    async def _run():
+        return await asyncio.gather(
+            *[llm.agenerate_text(PromptValue(prompt_str=f"p{i}")) for i in range(3)]
+        )
+
+    asyncio.run(_run())
+    assert fake.batches == [["p0"], ["p1"], ["p2"]]
+
+
+class FakeUsageLLM:
+    """Reports one input token per character and one output token per prompt."""
+
+    def __init__(self, with_usage_metadata: bool = True):
+        self.with_usage_metadata = with_usage_metadata
+
+    def _generation(self, prompt):
+        if not self.with_usage_metadata:
+            return Generation(text=prompt.to_string())
+        usage = {
+            "input_tokens": len(prompt.to_string()),
+            "output_tokens": 1,
+            "total_tokens": len(prompt.to_string()) + 1,
+        }
+        return ChatGeneration(
+            message=AIMessage(content=prompt.to_string(), usage_metadata=usage)
+        )
+
+    async def agenerate_prompt(
+        self, prompts, temperature=None, stop=None, callbacks=None, **kwargs
+    ):
+        prompt_tokens = sum(len(p.to_string()) for p in prompts)
+        result = LLMResult(
+            generations=[[self._generation(p)] for p in prompts],
+            llm_output={
+                "token_usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(prompts),
+                    "total_tokens": prompt_tokens + len(prompts),
+                },
+                "model_name": "fake",
+            },
+        )
+        for handler in callbacks or []:
+            handler.on_llm_end(result)
+        return result
+
+
+@pytest.mark.parametrize("with_usage_metadata", [True, False])
+def test_batched_token_usage_matches_unbatched(with_usage_metadata):
+    from ragas.cost import CostCallbackHandler, get_token_usage_for_openai
+
+    prompts = [PromptValue(prompt_str="x" * (i + 1)) for i in range(4)]
+
+    def _usage(batch_size):
+        llm = LangchainLLMWrapper(
+            FakeUsageLLM(with_usage_metadata),  # type: ignore
+            batch_size=batch_size,
+            batch_wait=0.05,
+        )
+        handler = CostCallbackHandler(get_token_usage_for_openai)
+
+        async def _run():
+            return await asyncio.gather(
+                *[llm.agenerate_text(p, n=2, callbacks=[handler]) for p in prompts]
+            )
+
+        results = asyncio.run(_run())
+        return handler, results
+
+    unbatched, _ = _usage(None)
+    batched, results = _usage(8)
+
+    assert batched.total_tokens() == unbatched.total_tokens()
+    assert batched.total_cost(cost_per_input_token=1.0) == pytest.approx(
+        unbatched.total_cost(cost_per_input_token=1.0)
+    )
+    if with_usage_metadata:
+        # every caller gets the usage of its own requests
+        assert [get_token_usage_for_openai(r).input_tokens for r in results] == [
+            2 * (i + 1) for i in range(4)
+        ]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing as t
+from dataclasses import dataclass, field
+
+import pytest
+
+from ragas.llms import CachedLLM, LLMResponseCache
+from ragas.llms.prompt import PromptValue
+from ragas.run_config import RunConfig
+
+
+@pytest.fixture
+def counting_llm(fake_llm):
+    fake_llm.calls = 0
+    generate_text = fake_llm.generate_text
+
+    def counted_generate_text(*args, **kwargs):
+        fake_llm.calls += 1
+        return generate_text(*args, **kwargs)
+
+    fake_llm.generate_text = counted_generate_text
+    return fake_llm
+
+
+def test_cached_llm_serves_repeated_prompts(counting_llm, tmp_path):
+    llm = CachedLLM(counting_llm, tmp_path / "cache.db")
+    prompt = PromptValue(prompt_str="hello")
+
+    first = asyncio.run(llm.generate(prompt))
+    second = asyncio.run(llm.generate(prompt))
+
+    assert first.generations[0][0].text == second.generations[0][0].text == "hello"
+    assert counting_llm.calls == 1
+    assert (llm.hits, llm.misses) == (1, 1)
+
+    # n, temperature and stop are part of the key
+    asyncio.run(llm.generate(prompt, n=2))
+    asyncio.run(llm.generate(prompt, stop=["\n"]))
+    assert counting_llm.calls == 3
+
+    # the cache survives a new wrapper
+    reopened = CachedLLM(counting_llm, tmp_path / "cache.db")
+    asyncio.run(reopened.generate(prompt))
+    assert counting_llm.calls == 3
+
+
+def test_cache_hits_bypass_the_rate_limiter(counting_llm, tmp_path):
+    from ragas.rate_limiter import get_rate_limiter
+
+    run_config = RunConfig(requests_per_minute=1)
+    llm = CachedLLM(counting_llm, tmp_path / "cache.db", run_config=run_config)
+    prompt = PromptValue(prompt_str="rate limited")
+
+    async def _run():
+        start = time.monotonic()
+        for _ in range(3):
+            await llm.generate(prompt)
+        return time.monotonic() - start
+
+    limiter = get_rate_limiter(llm.get_model_name(), run_config)
+    assert limiter is not None
+    # a second request would have to wait a minute
+    assert asyncio.run(asyncio.wait_for(_run(), timeout=5)) < 1
+    assert counting_llm.calls == 1
+
+
+def test_cache_ttl_and_size_eviction(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", ttl=0.05)
+    cache.set("a", [[{"text": "a"}]])
+    assert cache.get("a") == [[{"text": "a"}]]
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+    cache = LLMResponseCache(tmp_path / "bounded.db", max_entries=2, touch_interval=0)
+    for key in ["a", "b", "c"]:
+        cache.set(key, key)
+        time.sleep(0.01)
+    cache.get("a")
+    cache.evict()
+    # "b" is the least recently used
+    assert len(cache) == 2 and cache.get("b") is None
+
+
+def test_cache_hits_only_touch_stale_entries(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "cache.db"
+    cache = LLMResponseCache(path, touch_interval=60)
+    cache.set("a", "a")
+
+    def accessed_at():
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT accessed_at FROM responses").fetchone()[0]
+
+    touched = accessed_at()
+    for _ in range(3):
+        assert cache.get("a") == "a"
+    # recently touched, the hits were read only
+    assert accessed_at() == touched
+    assert not cache._conn.in_transaction
+
+    cache.touch_interval = 0
+    time.sleep(0.01)
+    cache.get("a")
+    assert accessed_at() > touched
+
+
+def test_cache_io_runs_off_the_event_loop(counting_llm, tmp_path, monkeypatch):
+    import sqlite3
+
+    llm = CachedLLM(counting_llm, tmp_path / "cache.db")
+    prompt = PromptValue(prompt_str="hello")
+
+    def locked_get(key):
+        # eg. waiting for the write lock held by another process
+        time.sleep(0.2)
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(llm.cache, "get", locked_get)
+
+    async def generate_and_tick():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        result = await llm.generate(prompt)
+        ticker.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(generate_and_tick())
+
+    # a failed lookup is a miss, not a failed job
+    assert result.generations[0][0].text == "hello"
+    assert (llm.hits, llm.misses, counting_llm.calls) == (0, 1, 1)
+    assert ticks > 5
+
+
+def test_evaluate_reports_cache_hits(counting_llm, tmp_path, monkeypatch):
+    from ragas import evaluate
+    from ragas._analytics import do_not_track
+    from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+    from ragas.metrics.base import MetricType, MetricWithLLM, SingleTurnMetric
+
+    monkeypatch.setenv("RAGAS_DO_NOT_TRACK", "true")
+    do_not_track.cache_clear()
+
+    @dataclass
+    class EchoLength(MetricWithLLM, SingleTurnMetric):
+        name: str = "echo_length"  # type: ignore
+        _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+            default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+        )
+
+        def init(self, run_config: RunConfig):
+            pass
+
+        async def _ascore(self, row, callbacks):
+            raise NotImplementedError
+
+        async def _single_turn_ascore(self, sample, callbacks):
+            assert self.llm is not None
+            result = await self.llm.generate(
+                PromptValue(prompt_str=sample.response), callbacks=callbacks
+            )
+            return len(result.generations[0][0].text)
+
+    dataset = EvaluationDataset(
+        samples=[SingleTurnSample(response=r) for r in ["a", "bb", "a"]]
+    )
+    llm = CachedLLM(counting_llm, tmp_path / "cache.db")
+
+    first = evaluate(dataset, metrics=[EchoLength()], llm=llm)
+    second = evaluate(dataset, metrics=[EchoLength()], llm=llm)
+
+    assert first["echo_length"] == second["echo_length"] == pytest.approx(4 / 3)
+    assert sum(first.cache_stats.values()) == 3
+    assert second.cache_stats == {"hits": 3, "misses": 0}
@@ -0,0 +1,27 @@
+import pytest
+
+from ragas.llms.json_load import json_loader
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": 1}', [{"a": 1}]),
+        ("Here you go:\n```json\n[1, 2]\n```", [[1, 2]]),
+        ('{"a": 1} and {"b": [2, {"c": 3}]}', [{"a": 1}, {"b": [2, {"c": 3}]}]),
+        # brackets inside strings
+        ('{"a": "}{ ] ["} {"b": "{"}', [{"a": "}{ ] ["}, {"b": "{"}]),
+        # an unfinished object after the first one is ignored
+        ('{"a": 1}\nNote: {', [{"a": 1}]),
+    ],
+)
+def test_load_all_jsons(text, expected):
+    assert json_loader._load_all_jsons(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["no json here", '{"a": 1,}', "{'a': 1}", '{"a": {"b": 1}']
+)
+def test_load_all_jsons_invalid(text):
+    with pytest.raises(ValueError):
+        json_loader._load_all_jsons(text)
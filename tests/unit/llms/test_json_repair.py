@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import pytest
+from langchain_core.pydantic_v1 import BaseModel
+
+from ragas.llms.json_load import json_loader
+from ragas.llms.json_repair import load_repaired_json, repair_stats
+from ragas.llms.output_parser import RagasoutputParser
+from ragas.llms.prompt import PromptValue
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": [1, 2,],}', {"a": [1, 2]}),
+        ("{'a': 'it\\'s', 'b': 'don't'}", {"a": "it's", "b": "don't"}),
+        (
+            '{"statement": "The Earth is also known as "Terra"."}',
+            {"statement": 'The Earth is also known as "Terra".'},
+        ),
+        ('{"a": [{"b": "cut', {"a": [{"b": "cut"}]}),
+        ('{"a": 1, "b":', {"a": 1, "b": None}),
+        ('{"a": [1, 2}', {"a": [1, 2]}),
+        ('Sure!\n```json\n{"a": True, "b": None}\n```\nDone.', {"a": True, "b": None}),
+        ('[{"text": "line\nbreak"}', [{"text": "line\nbreak"}]),
+    ],
+)
+def test_load_repaired_json(text, expected):
+    assert load_repaired_json(text) == expected
+
+
+@pytest.mark.parametrize("text", ["no json here", "42"])
+def test_load_repaired_json_without_json(text):
+    with pytest.raises(ValueError):
+        load_repaired_json(text)
+
+
+class Verdict(BaseModel):
+    statement: str
+    verdict: int
+
+
+class Verdicts(BaseModel):
+    __root__: t.List[Verdict]
+
+
+class NoLLM:
+    async def generate(self, *args, **kwargs):
+        raise AssertionError("the output should have been repaired locally")
+
+
+@pytest.mark.parametrize(
+    "text, model",
+    [
+        ('{"statement": "a", "verdict": 1,}', Verdict),
+        ('[{"statement": "a", "verdict": 1}]', Verdict),
+        ('{"verdicts": [{"statement": "a", "verdict": 1}]}', Verdicts),
+        ("```\n{'statement': 'a', 'verdict': 1", Verdict),
+    ],
+)
+def test_output_parser_repairs_without_the_llm(text, model):
+    repair_stats.reset()
+    parser = RagasoutputParser(pydantic_object=model)
+    output = asyncio.run(
+        parser.aparse(text, PromptValue(prompt_str=""), NoLLM(), max_retries=1)  # type: ignore
+    )
+    verdict = output.__root__[0] if model is Verdicts else output
+    assert (verdict.statement, verdict.verdict) == ("a", 1)
+    assert repair_stats.as_dict() == {
+        "parsed": 0,
+        "repaired": 1,
+        "llm_fixes": 0,
+        "failed": 0,
+    }
+
+
+def test_json_loader_repairs_without_the_llm():
+    repair_stats.reset()
+    loaded = asyncio.run(json_loader._asafe_load('{"a": 1,', NoLLM()))  # type: ignore
+    assert loaded == {"a": 1}
+    asyncio.run(json_loader._asafe_load('{"a": 1}', NoLLM()))  # type: ignore
+    assert repair_stats.as_dict()["repaired"] == 1
+    assert repair_stats.as_dict()["parsed"] == 1
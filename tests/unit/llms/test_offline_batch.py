@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import typing as t
+from dataclasses import dataclass, field
+
+import pytest
+
+from ragas.exceptions import BatchRequestPending
+from ragas.llms import OfflineBatchLLM
+from ragas.llms.offline_batch import evaluate_offline
+from ragas.llms.prompt import PromptValue
+from ragas.run_config import RunConfig
+
+
+def local_batch(requests_path: str) -> str:
+    """Stand-in for the batch API, answers every request with its prompt reversed."""
+    output_path = requests_path.replace(".jsonl", "_output.jsonl")
+    with open(requests_path) as f, open(output_path, "w") as out:
+        for line in f:
+            request = json.loads(line)
+            body = request["body"]
+            content = body["messages"][-1]["content"][::-1]
+            response = {
+                "id": "batch_req",
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": i,
+                                "message": {"role": "assistant", "content": content},
+                                "finish_reason": "stop",
+                            }
+                            for i in range(body["n"])
+                        ],
+                        "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+                    },
+                },
+                "error": None,
+            }
+            out.write(json.dumps(response) + "\n")
+    return output_path
+
+
+def test_prompts_are_queued_until_their_results_are_loaded(tmp_path):
+    llm = OfflineBatchLLM(model="gpt-4o-mini")
+    prompt = PromptValue(prompt_str="hello")
+
+    with pytest.raises(BatchRequestPending):
+        llm.generate_text(prompt)
+    with pytest.raises(BatchRequestPending):
+        llm.generate_text(prompt)
+    assert llm.num_pending == 1
+
+    requests_path = str(tmp_path / "requests.jsonl")
+    assert llm.write_requests(requests_path) == 1
+    assert llm.num_pending == 0
+    with open(requests_path) as f:
+        request = json.loads(f.readline())
+    assert request["method"] == "POST"
+    assert request["url"] == "/v1/chat/completions"
+    assert request["body"]["messages"] == [{"role": "user", "content": "hello"}]
+
+    assert llm.load_results(local_batch(requests_path)) == 1
+    result = llm.generate_text(prompt)
+    assert result.generations[0][0].text == "olleh"
+    assert result.llm_output["token_usage"]["prompt_tokens"] == 1
+
+    # results can be loaded into a fresh llm, eg. in a new process
+    reloaded = OfflineBatchLLM(
+        model="gpt-4o-mini", results=tmp_path / "requests_output.jsonl"
+    )
+    assert reloaded.generate_text(prompt).generations[0][0].text == "olleh"
+
+
+def test_failed_batch_requests_are_queued_again(tmp_path):
+    llm = OfflineBatchLLM(model="gpt-4o-mini")
+    with pytest.raises(BatchRequestPending) as exc_info:
+        llm.generate_text(PromptValue(prompt_str="hello"))
+    llm.write_requests(tmp_path / "requests.jsonl")
+
+    failed = {
+        "custom_id": exc_info.value.custom_id,
+        "response": {"status_code": 500, "body": {"error": "server error"}},
+        "error": None,
+    }
+    (tmp_path / "output.jsonl").write_text(json.dumps(failed) + "\n")
+    assert llm.load_results(tmp_path / "output.jsonl") == 0
+
+    with pytest.raises(BatchRequestPending):
+        llm.generate_text(PromptValue(prompt_str="hello"))
+    assert llm.num_pending == 1
+
+
+def test_evaluate_offline_runs_one_round_per_stage(tmp_path, monkeypatch):
+    from ragas._analytics import do_not_track
+    from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+    from ragas.metrics.base import MetricType, MetricWithLLM, SingleTurnMetric
+
+    monkeypatch.setenv("RAGAS_DO_NOT_TRACK", "true")
+    do_not_track.cache_clear()
+
+    @dataclass
+    class TwoStages(MetricWithLLM, SingleTurnMetric):
+        name: str = "two_stages"  # type: ignore
+        _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+            default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+        )
+
+        def init(self, run_config: RunConfig):
+            pass
+
+        async def _ascore(self, row, callbacks):
+            raise NotImplementedError
+
+        async def _single_turn_ascore(self, sample, callbacks):
+            assert self.llm is not None
+            first = await self.llm.generate(
+                PromptValue(prompt_str=sample.response + "!"), n=2
+            )
+            texts = [g.text for g in first.generations[0]]
+            # the second prompt depends on the first response
+            second = await self.llm.generate(PromptValue(prompt_str=texts[0] + "?"))
+            return float(second.generations[0][0].text == "?" + sample.response + "!")
+
+    dataset = EvaluationDataset(
+        samples=[SingleTurnSample(response=r) for r in ["a", "bb", "a"]]
+    )
+    llm = OfflineBatchLLM(model="gpt-4o-mini")
+    rounds: t.List[int] = []
+
+    def process_batch(requests_path: str) -> str:
+        with open(requests_path) as f:
+            rounds.append(len(f.readlines()))
+        return local_batch(requests_path)
+
+    result = evaluate_offline(
+        dataset,
+        llm,
+        process_batch,
+        tmp_path / "batches",
+        metrics=[TwoStages()],
+        raise_exceptions=True,
+    )
+
+    # identical prompts are only requested once
+    assert rounds == [2, 2]
+    assert result["two_stages"] == pytest.approx(1.0)
+    assert (tmp_path / "batches" / "round_2.jsonl").exists()
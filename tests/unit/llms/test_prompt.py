@@ -1,4 +1,5 @@
 import importlib
+import json
 import pkgutil
 
 import ragas
@@ -130,3 +131,42 @@ def test_save_and_load(tmp_path):
         loaded_prompt = prompt._load(prompt.language, prompt.name, tmp_path)
 
         assert prompt == loaded_prompt
+
+
+def test_format_matches_the_rendered_template():
+    for testcase in TESTCASES:
+        prompt = Prompt(**testcase)
+        inputs = {key: f"value of {key} {{x}}" for key in prompt.input_keys}
+        expected = prompt._render_template().format(
+            **{k: json.dumps(v) for k, v in inputs.items()}
+        )
+        assert prompt.format(**inputs).to_string() == expected
+        assert prompt.to_string() == prompt._render_template()
+
+
+def test_compiled_template_is_reset_on_changes():
+    prompt = Prompt(**TESTCASES[0])
+    compiled = prompt.compiled_template()
+    assert prompt.compiled_template() is compiled
+
+    prompt.instruction = "A new instruction."
+    assert prompt.to_string().startswith("A new instruction.")
+
+    example = dict(prompt.examples[0], answer="methanol")
+    prompt.examples[0] = example
+    assert "methanol" in prompt.to_string()
+
+    prompt.examples.append(dict(example, answer="ethanol"))
+    assert "ethanol" in prompt.to_string()
+
+    # examples edited in place
+    prompt.examples[-1]["answer"] = "propanol"
+    assert "propanol" in prompt.to_string()
+    assert 'answer: "ethanol"' not in prompt.to_string()
+
+    copy = prompt.copy(update={"instruction": "A copied instruction."})
+    assert copy.to_string().startswith("A copied instruction.")
+    assert prompt.to_string().startswith("A new instruction.")
+
+    prompt.examples = []
+    assert "Examples:" not in prompt.to_string()
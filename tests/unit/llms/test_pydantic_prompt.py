@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+from langchain_core.outputs import Generation, LLMResult
+from pydantic import BaseModel
+
+from ragas.experimental.llms import prompt as prompt_module
+from ragas.experimental.llms.prompt import PydanticPrompt
+from ragas.llms.base import BaseRagasLLM
+
+
+class Question(BaseModel):
+    question: str
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class AnswerPrompt(PydanticPrompt[Question, Answer]):
+    instruction = "Answer the question."
+    input_model = Question
+    output_model = Answer
+    examples = [(Question(question="1 + 1?"), Answer(answer="2"))]
+
+
+class JsonLLM(BaseRagasLLM):
+    def generate_text(self, prompt, n=1, temperature=1e-8, stop=None, callbacks=None):
+        question = prompt.to_string().rsplit('"question": "', 1)[1].split('"')[0]
+        text = Answer(answer=f"answer to {question}").model_dump_json()
+        return LLMResult(generations=[[Generation(text=text)]])
+
+    async def agenerate_text(
+        self, prompt, n=1, temperature=None, stop=None, callbacks=None
+    ):
+        return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+
+def test_rendering_is_cached_per_prompt_class(monkeypatch):
+    schema_calls = []
+    model_to_json_schema = prompt_module.model_to_json_schema
+
+    def counted_model_to_json_schema(model):
+        schema_calls.append(model)
+        return model_to_json_schema(model)
+
+    monkeypatch.setattr(
+        prompt_module, "model_to_json_schema", counted_model_to_json_schema
+    )
+    prompt_module.get_output_signature.cache_clear()
+
+    first, second = AnswerPrompt(), AnswerPrompt()
+    rendered = first.to_string(Question(question="a"))
+    assert second.to_string(Question(question="a")) == rendered
+    assert schema_calls == [Answer]
+    assert first.generate_examples() is second.generate_examples()
+
+    # changing the instruction or the examples renders them again
+    second.instruction = "Answer the question briefly."
+    assert second.generate_examples().startswith("These are some examples")
+    assert "briefly" in second.generate_examples()
+    second.examples = second.examples + [
+        (Question(question="2 + 2?"), Answer(answer="4"))
+    ]
+    assert "2 + 2?" in second.generate_examples()
+    assert "2 + 2?" not in first.generate_examples()
+
+
+def test_examples_modified_in_place_are_rendered_again():
+    prompt = AnswerPrompt()
+    prompt.examples = [(Question(question="3 + 3?"), Answer(answer="old"))]
+    assert '"old"' in prompt.generate_examples()
+
+    prompt.examples[0][1].answer = "new"
+
+    assert '"new"' in prompt.generate_examples()
+    assert '"old"' not in prompt.to_string(Question(question="a"))
+
+
+def test_generate_many():
+    prompt = AnswerPrompt()
+    answers = asyncio.run(
+        prompt.generate_many(
+            [Question(question="a"), Question(question="b")], llm=JsonLLM()
+        )
+    )
+    assert [a.answer for a in answers] == ["answer to a", "answer to b"]
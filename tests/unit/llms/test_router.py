@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import pytest
+from langchain_core.outputs import Generation, LLMResult
+
+from ragas.llms import RoutedLLM
+from ragas.llms.base import BaseRagasLLM
+from ragas.llms.prompt import PromptValue
+from ragas.run_config import RunConfig
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class Backend(BaseRagasLLM):
+    def __init__(self, name: str, latency: float = 0.0, error=None):
+        self.name = name
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+        self.set_run_config(RunConfig())
+
+    def get_model_name(self) -> str:
+        return "judge"
+
+    def generate_text(self, prompt, n=1, temperature=1e-8, stop=None, callbacks=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return LLMResult(generations=[[Generation(text=self.name)]])
+
+    async def agenerate_text(
+        self, prompt, n=1, temperature=None, stop=None, callbacks=None
+    ):
+        await asyncio.sleep(self.latency)
+        return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+
+def _generate_many(llm: RoutedLLM, count: int) -> t.List[str]:
+    async def _run():
+        results = await asyncio.gather(
+            *[llm.generate(PromptValue(prompt_str=str(i))) for i in range(count)]
+        )
+        return [r.generations[0][0].text for r in results]
+
+    return asyncio.run(_run())
+
+
+def test_requests_are_spread_by_weight_and_latency():
+    fast, slow = Backend("fast", latency=0.01), Backend("slow", latency=0.05)
+    llm = RoutedLLM([fast, slow])
+    assert list(llm.get_stats()) == ["judge[0]", "judge[1]"]
+
+    for _ in range(5):
+        _generate_many(llm, 8)
+    stats = llm.get_stats()
+    assert stats["judge[0]"]["num_requests"] > stats["judge[1]"]["num_requests"] > 0
+    assert stats["judge[0]"]["effective_weight"] > stats["judge[1]"]["effective_weight"]
+    assert all(s["outstanding"] == 0 for s in stats.values())
+
+    heavy, light = Backend("heavy"), Backend("light")
+    llm = RoutedLLM([heavy, light], weights=[3, 1], names=["heavy", "light"])
+    _generate_many(llm, 8)
+    assert heavy.calls > light.calls
+
+
+def test_rate_limited_backends_are_failed_over_and_skipped():
+    limited = Backend("limited", error=RateLimitError("slow down"))
+    ok = Backend("ok")
+    llm = RoutedLLM([limited, ok], names=["limited", "ok"], cooldown=60)
+
+    for _ in range(4):
+        result = asyncio.run(llm.generate(PromptValue(prompt_str="hello")))
+        assert result.generations[0][0].text == "ok"
+    # skipped while cooling down after the first 429
+    assert limited.calls == 1
+    stats = llm.get_stats()
+    assert stats["limited"]["num_errors"] == 1
+    assert stats["limited"]["error_rate"] > 0
+    assert stats["ok"]["num_requests"] == 4
+
+
+def test_other_errors_are_not_failed_over():
+    broken = Backend("broken", error=ValueError("bad request"))
+    ok = Backend("ok")
+    llm = RoutedLLM([broken, ok], run_config=RunConfig(max_retries=1))
+
+    with pytest.raises(ValueError):
+        llm.generate_text(PromptValue(prompt_str="hello"))
+    assert ok.calls == 0
+
+
+def test_all_backends_failing_raises_the_last_error():
+    class ServerError(Exception):
+        status_code = 503
+
+    backends = [Backend(str(i), error=ServerError()) for i in range(3)]
+    llm = RoutedLLM(backends, run_config=RunConfig(max_retries=2, max_wait=0))
+
+    with pytest.raises(ServerError):
+        asyncio.run(llm.generate(PromptValue(prompt_str="hello")))
+    # every backend is tried on every attempt
+    assert [b.calls for b in backends] == [2, 2, 2]
+
+
+def test_backends_are_probed_once_their_circuit_recovers(monkeypatch):
+    import time
+
+    from ragas import circuit_breaker
+    from ragas.circuit_breaker import CircuitState
+    from ragas.exceptions import CircuitOpenError
+
+    class ServerError(Exception):
+        status_code = 503
+
+    now = time.monotonic()
+
+    class FakeClock:
+        @staticmethod
+        def monotonic():
+            return now
+
+    monkeypatch.setattr(circuit_breaker, "time", FakeClock)
+    backends = [Backend(str(i), error=ServerError()) for i in range(2)]
+    run_config = RunConfig(
+        max_retries=1,
+        max_wait=0,
+        circuit_breaker_threshold=1,
+        circuit_breaker_recovery_time=30,
+    )
+    llm = RoutedLLM(backends, names=["a", "b"], run_config=run_config)
+
+    with pytest.raises(ServerError):
+        asyncio.run(llm.generate(PromptValue(prompt_str="hello")))
+    assert all(breaker.is_open for breaker in run_config.circuit_breakers.values())
+
+    for backend in backends:
+        backend.error = None
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(llm.generate(PromptValue(prompt_str="hello")))
+
+    now += 31
+    result = asyncio.run(llm.generate(PromptValue(prompt_str="hello")))
+    assert result.generations[0][0].text in ("0", "1")
+    states = [breaker.state for breaker in run_config.circuit_breakers.values()]
+    assert CircuitState.CLOSED in states
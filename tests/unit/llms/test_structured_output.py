@@ -0,0 +1,179 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.pydantic_v1 import BaseModel
+from langchain_core.runnables import RunnableBinding
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from ragas.llms.base import LangchainLLMWrapper
+from ragas.llms.output_parser import RagasoutputParser, get_json_format_instructions
+from ragas.llms.prompt import Prompt
+
+
+class Verdict(BaseModel):
+    reason: str
+    verdict: int
+
+
+class FakeToolChatModel(BaseChatModel):
+    """Calls the first tool it is given, with fixed arguments."""
+
+    args: dict = {"reason": "supported", "verdict": 1}
+    requests: list = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool-chat"
+
+    def bind_tools(self, tools, tool_choice=None, **kwargs):
+        formatted = [convert_to_openai_tool(tool) for tool in tools]
+        return RunnableBinding(
+            bound=self, kwargs={"tools": formatted, "tool_choice": tool_choice}
+        )
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.requests.append((messages, kwargs))
+        if "tools" not in kwargs:
+            message = AIMessage(content=json.dumps(self.args))
+        else:
+            name = kwargs["tools"][0]["function"]["name"]
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": name, "args": self.args, "id": "call_0"}],
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def verdict_prompt():
+    return Prompt(
+        name="verdict",
+        instruction="Judge the statement.",
+        output_format_instruction=get_json_format_instructions(Verdict),
+        output_model=Verdict,
+        examples=[
+            {
+                "statement": "The sky is blue.",
+                "output": {"reason": "it is", "verdict": 1},
+            }
+        ],
+        input_keys=["statement"],
+        output_key="output",
+        output_type="json",
+    )
+
+
+def test_prompt_value_without_format_instructions():
+    prompt_value = verdict_prompt().format(statement="Water is wet.")
+
+    assert prompt_value.output_model is Verdict
+    assert "JSON schema" in prompt_value.to_string()
+    stripped = prompt_value.without_format_instructions().to_string()
+    assert "JSON schema" not in stripped
+    assert "Water is wet." in stripped
+    assert stripped.startswith("Judge the statement.")
+
+
+def test_prompt_value_renders_without_format_instructions_lazily(monkeypatch):
+    prompt = verdict_prompt()
+    rendered = []
+    render = Prompt._render_template
+
+    def counting_render(self, with_format_instruction=True):
+        rendered.append(with_format_instruction)
+        return render(self, with_format_instruction)
+
+    monkeypatch.setattr(Prompt, "_render_template", counting_render)
+
+    prompt_value = prompt.format(statement="Water is wet.")
+    assert rendered == [True]
+    prompt_value.without_format_instructions()
+    assert rendered == [True, False]
+
+
+def test_prompt_without_output_model_is_not_enforced():
+    prompt = verdict_prompt().copy(update={"output_model": None})
+
+    prompt_value = prompt.format(statement="Water is wet.")
+
+    assert prompt_value.output_model is None
+    assert (
+        prompt_value.without_format_instructions().to_string()
+        == prompt_value.to_string()
+    )
+
+
+def test_tool_calling_sends_schema_as_tool():
+    chat_model = FakeToolChatModel(requests=[])
+    llm = LangchainLLMWrapper(chat_model, structured_output="tool_calling")
+    prompt_value = verdict_prompt().format(statement="Water is wet.")
+
+    result = asyncio.run(llm.agenerate_text(prompt_value))
+
+    messages, kwargs = chat_model.requests[0]
+    assert kwargs["tool_choice"] == "Verdict"
+    assert kwargs["tools"][0]["function"]["name"] == "Verdict"
+    assert "JSON schema" not in messages[0].content
+    assert json.loads(result.generations[0][0].text) == chat_model.args
+
+    parser = RagasoutputParser(pydantic_object=Verdict)
+    verdict = asyncio.run(
+        parser.aparse(result.generations[0][0].text, prompt_value, llm)
+    )
+    assert verdict == Verdict(reason="supported", verdict=1)
+
+
+def test_tool_calling_sync():
+    chat_model = FakeToolChatModel(requests=[])
+    llm = LangchainLLMWrapper(chat_model, structured_output="tool_calling")
+
+    result = llm.generate_text(verdict_prompt().format(statement="Water is wet."))
+
+    assert json.loads(result.generations[0][0].text) == chat_model.args
+
+
+def test_prompts_without_output_model_are_sent_as_is():
+    chat_model = FakeToolChatModel(requests=[])
+    llm = LangchainLLMWrapper(chat_model, structured_output="tool_calling")
+    prompt = Prompt(
+        name="summary",
+        instruction="Summarize the text.",
+        input_keys=["text"],
+        output_key="summary",
+        output_type="str",
+    )
+
+    asyncio.run(llm.agenerate_text(prompt.format(text="Some text.")))
+
+    messages, kwargs = chat_model.requests[0]
+    assert "tools" not in kwargs
+
+
+def test_structured_output_validation():
+    with pytest.raises(ValueError):
+        LangchainLLMWrapper(FakeToolChatModel(), structured_output="xml")
+
+    # falls back to the format instructions without json mode support
+    llm = LangchainLLMWrapper(FakeToolChatModel(), structured_output="json_mode")
+    assert llm.structured_output is None
+
+
+def test_json_mode_request():
+    from langchain_openai import ChatOpenAI
+
+    llm = LangchainLLMWrapper(
+        ChatOpenAI(model="gpt-4o-mini", api_key="sk-fake"),
+        structured_output="json_mode",
+    )
+    prompt_value = verdict_prompt().format(statement="Water is wet.")
+
+    request, kwargs = llm._structured_request(prompt_value)
+
+    assert kwargs == {"response_format": {"type": "json_object"}}
+    system, human = request.to_messages()
+    assert system.type == "system" and '"verdict"' in system.content
+    assert "JSON schema" not in human.content
+    assert len(request.to_string()) < len(prompt_value.to_string())
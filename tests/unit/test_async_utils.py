@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+
+def test_run_reuses_the_background_loop():
+    from ragas.async_utils import run
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = run(current_loop())
+    assert run(current_loop()) is first
+    assert first.is_running()
+
+
+@pytest.mark.asyncio
+async def test_run_with_running_loop():
+    from ragas.async_utils import run
+
+    async def echo(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    # no nest_asyncio, the coroutine runs on the ragas loop thread
+    assert run(echo(1)) == 1
+
+
+def test_run_from_inside_the_background_loop():
+    from ragas.async_utils import get_event_loop, run
+
+    async def nested():
+        return run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run_coroutine_threadsafe(nested(), get_event_loop()).result()
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from ragas.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+from ragas.exceptions import CircuitOpenError
+from ragas.run_config import RunConfig, add_async_retry
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(endpoint="model", failure_threshold=3)
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.on_failure()
+    breaker.before_call()
+    breaker.on_success()
+    assert breaker.state == CircuitState.CLOSED
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_circuit_half_opens_with_a_single_probe():
+    breaker = CircuitBreaker(endpoint="model", failure_threshold=1, recovery_time=0.05)
+    breaker.before_call()
+    breaker.on_failure()
+    assert breaker.is_open
+
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+    # only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # a failed probe opens the circuit again, a successful one closes it
+    breaker.on_failure()
+    assert breaker.is_open
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.on_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_open_circuit_stops_retries():
+    run_config = RunConfig(max_wait=0, circuit_breaker_threshold=2)
+    calls = 0
+
+    async def failing_call():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("provider is down")
+
+    call_with_retry = add_async_retry(failing_call, run_config, endpoint="model")
+    with pytest.raises(ConnectionError):
+        asyncio.run(call_with_retry())
+    # the retries stopped once the circuit opened
+    assert calls == 2
+
+    # later calls fail fast without being sent
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(call_with_retry())
+    assert calls == 2
+    assert get_circuit_breaker("model", run_config).is_open
+
+
+def test_circuit_breakers_are_per_endpoint():
+    run_config = RunConfig(circuit_breaker_threshold=5)
+
+    assert get_circuit_breaker("model-a", RunConfig()) is None
+    assert get_circuit_breaker("model-a", run_config) is get_circuit_breaker(
+        "model-a", run_config
+    )
+    assert get_circuit_breaker("model-a", run_config) is not get_circuit_breaker(
+        "model-b", run_config
+    )
+
+
+def test_executor_shows_open_circuits():
+    from ragas.executor import Executor
+
+    run_config = RunConfig(circuit_breaker_threshold=1)
+    breaker = get_circuit_breaker("model", run_config)
+    breaker.on_failure()
+
+    executor = Executor(run_config=run_config)
+    assert executor._progress_postfix(run_config) == {"circuits": "model: open"}
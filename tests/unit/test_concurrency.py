@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from ragas.concurrency import AIMDConcurrencyController, is_overload_error
+from ragas.run_config import RunConfig, add_async_retry
+
+
+class RateLimitError(Exception):
+    pass
+
+
+def test_is_overload_error():
+    assert is_overload_error(RateLimitError())
+    assert is_overload_error(asyncio.TimeoutError())
+    assert not is_overload_error(ValueError())
+
+
+def test_aimd_additive_increase_multiplicative_decrease():
+    controller = AIMDConcurrencyController(max_workers=8, initial_workers=2, cooldown=0)
+
+    for _ in range(10):
+        controller.on_success(latency=0.1)
+    assert 2 < controller.limit <= 8
+
+    limit = controller.limit
+    controller.on_overload(RateLimitError())
+    assert controller.limit == max(1, int(limit * 0.5))
+    assert controller.history[-1].reason == "decrease: RateLimitError"
+
+
+def test_aimd_holds_on_latency_spike():
+    controller = AIMDConcurrencyController(max_workers=8, initial_workers=2)
+    controller.on_success(latency=0.1)
+    limit = controller._limit
+
+    controller.on_success(latency=10)
+    assert controller._limit == limit
+
+
+def test_aimd_decrease_cooldown():
+    controller = AIMDConcurrencyController(max_workers=16, initial_workers=16)
+    controller.on_overload()
+    controller.on_overload()
+    # a burst of failures only counts once
+    assert controller.limit == 8
+
+
+def test_retry_layer_reports_to_controller():
+    run_config = RunConfig(
+        adaptive_concurrency=True, max_workers=16, max_retries=3, max_wait=0
+    )
+    controller = run_config.concurrency_controller
+    assert controller is not None
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RateLimitError()
+        return "ok"
+
+    assert asyncio.run(add_async_retry(flaky, run_config)()) == "ok"
+    assert [h.reason for h in controller.history][:2] == [
+        "init",
+        "decrease: RateLimitError",
+    ]
+    assert controller.limit == 4
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+def test_executor_follows_controller_limit(limit):
+    from ragas.executor import Executor
+
+    run_config = RunConfig(adaptive_concurrency=True)
+    assert run_config.concurrency_controller is not None
+    run_config.concurrency_controller.max_workers = limit
+    run_config.concurrency_controller._limit = limit
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def echo(index: int):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return index
+
+    executor = Executor(run_config=run_config)
+    for i in range(10):
+        executor.submit(echo, i)
+
+    assert executor.results() == list(range(10))
+    assert max_in_flight == limit
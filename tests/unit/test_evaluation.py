@@ -0,0 +1,306 @@
+import asyncio
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+import pytest
+
+from ragas import evaluate
+from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+from ragas.metrics.base import MetricType, SingleTurnMetric
+from ragas.run_config import RunConfig
+
+
+@pytest.fixture(autouse=True)
+def disable_tracking(monkeypatch):
+    from ragas._analytics import do_not_track
+
+    monkeypatch.setenv("RAGAS_DO_NOT_TRACK", "true")
+    do_not_track.cache_clear()
+    yield
+    do_not_track.cache_clear()
+
+
+@pytest.fixture
+def dataset():
+    return EvaluationDataset(
+        samples=[
+            SingleTurnSample(response=f"answer {i}", reference=f"answer {i % 3}")
+            for i in range(10)
+        ]
+    )
+
+
+def test_evaluate_cpu_bound_metrics_in_process_pool(dataset, monkeypatch):
+    pytest.importorskip("rapidfuzz")
+    from ragas import evaluation
+    from ragas.metrics._string import ExactMatch, NonLLMStringSimilarity
+    from ragas.metrics.base import is_cpu_bound
+
+    metrics = [NonLLMStringSimilarity(), ExactMatch()]
+    assert is_cpu_bound(metrics[0]) and not is_cpu_bound(metrics[1])
+
+    pools = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def submit(self, fn, metric, *args):
+            pools.append((self, metric.name))
+            return super().submit(fn, metric, *args)
+
+    monkeypatch.setattr(evaluation, "ProcessPoolExecutor", RecordingPool)
+
+    in_loop = evaluate(dataset, metrics=metrics, run_config=RunConfig())
+    assert pools == []
+    in_pool = evaluate(dataset, metrics=metrics, run_config=RunConfig(cpu_workers=2))
+
+    assert in_loop.scores.to_list() == in_pool.scores.to_list()
+    # only the CPU-bound metric goes to the pool, whose workers are spawned
+    assert {name for _, name in pools} == {"non_llm_string_similarity"}
+    process_pool = pools[0][0]
+    assert process_pool._mp_context.get_start_method() == "spawn"
+    assert process_pool._shutdown_thread
+    assert in_pool["exact_match"] == pytest.approx(0.3)
+
+
+@dataclass
+class WaitingMetric(SingleTurnMetric):
+    """Stands in for an LLM metric, waits for the process pool to finish."""
+
+    name: str = "waiting"  # type: ignore
+    _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+        default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+    )
+    futures: t.List[t.Any] = field(default_factory=list)
+    saw_pool_done: t.List[bool] = field(default_factory=list)
+    deadline: t.Optional[float] = None
+
+    def init(self, run_config: RunConfig):
+        pass
+
+    def expected_llm_calls(self, sample) -> float:
+        return 1.0
+
+    async def _single_turn_ascore(self, sample, callbacks) -> float:
+        if self.deadline is None:
+            self.deadline = time.monotonic() + 30
+        while not (self.futures and all(f.done() for f in self.futures)):
+            if time.monotonic() > self.deadline:
+                break
+            await asyncio.sleep(0.01)
+        self.saw_pool_done.append(
+            bool(self.futures) and all(f.done() for f in self.futures)
+        )
+        return 1.0
+
+    async def _ascore(self, row, callbacks) -> float:
+        return await self._single_turn_ascore(SingleTurnSample(**row), callbacks)
+
+
+def test_process_pool_runs_concurrently_with_llm_jobs(dataset, monkeypatch):
+    pytest.importorskip("rapidfuzz")
+    from ragas import evaluation
+    from ragas.metrics._string import NonLLMStringSimilarity
+
+    waiting = WaitingMetric()
+
+    class RecordingPool(ProcessPoolExecutor):
+        def submit(self, *args):
+            future = super().submit(*args)
+            waiting.futures.append(future)
+            return future
+
+    monkeypatch.setattr(evaluation, "ProcessPoolExecutor", RecordingPool)
+
+    # a single worker slot, taken by the LLM jobs that wait for the pool
+    result = evaluate(
+        dataset,
+        metrics=[NonLLMStringSimilarity(), waiting],
+        run_config=RunConfig(cpu_workers=1, max_workers=1),
+    )
+
+    assert waiting.saw_pool_done and all(waiting.saw_pool_done)
+    assert not np.isnan(result["non_llm_string_similarity"])
+
+
+def test_get_shard_indices():
+    from ragas.evaluation import get_shard_indices
+
+    shards = [get_shard_indices(10, i, 3) for i in range(3)]
+    assert sum(shards, []) == list(range(10))
+    assert [len(s) for s in shards] == [3, 3, 4]
+
+    with pytest.raises(ValueError):
+        get_shard_indices(10, 3, 3)
+
+
+def test_evaluate_shards_and_merge(dataset):
+    from ragas.cost import CostCallbackHandler, TokenUsage
+    from ragas.evaluation import Result
+    from ragas.metrics._string import ExactMatch, StringPresent
+
+    metrics = [ExactMatch(), StringPresent()]
+    full = evaluate(dataset, metrics=metrics)
+    shards = [
+        evaluate(dataset, metrics=metrics, shard_index=i, num_shards=3)
+        for i in range(3)
+    ]
+    assert shards[1].row_indices == [3, 4, 5]
+
+    # attach the token usage that the cost callback would have collected
+    for i, shard in enumerate(shards):
+        shard.cost_cb = CostCallbackHandler(token_usage_parser=lambda r: r)
+        shard.cost_cb.usage_data.append(TokenUsage(input_tokens=i, output_tokens=1))
+
+    # the order in which shards are merged does not matter
+    merged = Result.merge(shards[::-1])
+
+    assert merged.scores.to_list() == full.scores.to_list()
+    assert merged.dataset is not None and full.dataset is not None
+    assert merged.dataset.to_list() == full.dataset.to_list()
+    assert dict(merged) == dict(full)
+    assert merged.row_indices is None
+    assert merged.total_tokens() == TokenUsage(input_tokens=3, output_tokens=3)
+
+    with pytest.raises(ValueError):
+        Result.merge([shards[0], shards[0]])
+
+
+def test_evaluate_resumes_from_checkpoint(dataset, tmp_path):
+    import typing as t
+    from dataclasses import dataclass, field
+
+    from ragas.metrics.base import MetricType, SingleTurnMetric
+
+    @dataclass
+    class FlakyMetric(SingleTurnMetric):
+        name: str = "flaky"  # type: ignore
+        _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+            default_factory=lambda: {MetricType.SINGLE_TURN: {"reference", "response"}}
+        )
+        calls: t.List[str] = field(default_factory=list)
+
+        def init(self, run_config):
+            pass
+
+        async def _ascore(self, row, callbacks) -> float:
+            return 0.0
+
+        async def _single_turn_ascore(self, sample, callbacks) -> float:
+            self.calls.append(sample.response)
+            if fail and sample.response.endswith(("7", "8")):
+                raise ValueError("flaky failure")
+            return float(sample.response[-1])
+
+    fail = True
+    checkpoint = tmp_path / "checkpoint.db"
+    metric = FlakyMetric()
+    first = evaluate(dataset, metrics=[metric], checkpoint=checkpoint)
+    assert len(metric.calls) == 10
+    assert np.isnan(first.scores["flaky"][7])
+
+    metric.calls.clear()
+    fail = False
+    second = evaluate(dataset, metrics=[metric], checkpoint=checkpoint)
+    # only the failed rows are scored again
+    assert sorted(metric.calls) == ["answer 7", "answer 8"]
+    assert second.scores["flaky"] == [float(i) for i in range(10)]
+
+
+def test_checkpoint_key_depends_on_prompts(dataset):
+    from ragas.checkpoint import get_checkpoint_key, get_metric_key
+    from ragas.metrics import Faithfulness
+
+    sample = dataset[0]
+    metric = Faithfulness()
+    key = get_checkpoint_key(sample, get_metric_key(metric))
+    assert get_checkpoint_key(sample, get_metric_key(Faithfulness())) == key
+    assert get_checkpoint_key(dataset[1], get_metric_key(metric)) != key
+
+    # eg. adapt() replaces the prompts with translated ones
+    metric.statement_prompt = metric.statement_prompt.copy(
+        update={"instruction": "Translated instruction."}
+    )
+    assert get_checkpoint_key(sample, get_metric_key(metric)) != key
+
+
+def test_checkpoint_commits_in_batches(tmp_path):
+    import sqlite3
+
+    from ragas.checkpoint import EvaluationCheckpoint
+
+    path = tmp_path / "checkpoint.db"
+    checkpoint = EvaluationCheckpoint(path, commit_every=3, commit_interval=60)
+
+    def committed():
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    checkpoint.save("a", "metric", 1.0)
+    checkpoint.save("b", "metric", 0.5)
+    assert committed() == 0
+    # saved but uncommitted scores are still restored by this run
+    assert checkpoint.get("b") == 0.5
+    checkpoint.save("c", "metric", 0.0)
+    assert committed() == 3
+
+    checkpoint.save("d", "metric", 1.0)
+    checkpoint.close()
+    assert committed() == 4
+
+
+def test_evaluate_time_budget_reports_incomplete(dataset):
+    import asyncio
+    import typing as t
+    from dataclasses import dataclass, field
+
+    from ragas.metrics._string import ExactMatch
+    from ragas.metrics.base import MetricType, SingleTurnMetric
+
+    @dataclass
+    class SlowMetric(SingleTurnMetric):
+        name: str = "slow"  # type: ignore
+        _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+            default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+        )
+
+        def init(self, run_config):
+            pass
+
+        async def _ascore(self, row, callbacks) -> float:
+            return 0.0
+
+        async def _single_turn_ascore(self, sample, callbacks) -> float:
+            if sample.response.endswith("9"):
+                await asyncio.sleep(5)
+            return 1.0
+
+    run_config = RunConfig(time_budget=0.2, time_budget_grace_period=0)
+    result = evaluate(
+        dataset, metrics=[ExactMatch(), SlowMetric()], run_config=run_config
+    )
+
+    assert not result.is_complete
+    assert result.incomplete == {"slow": [9]}
+    assert result.scores["slow"][9] is None
+    assert result["slow"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_aevaluate_runs_on_the_callers_loop(dataset):
+    import asyncio
+
+    from ragas import aevaluate
+    from ragas.metrics._string import ExactMatch
+
+    class LoopRecordingExactMatch(ExactMatch):
+        async def _single_turn_ascore(self, sample, callbacks):
+            loops.add(asyncio.get_running_loop())
+            return await super()._single_turn_ascore(sample, callbacks)
+
+    loops = set()
+    result = await aevaluate(dataset, metrics=[LoopRecordingExactMatch()])
+
+    assert loops == {asyncio.get_running_loop()}
+    assert result["exact_match"] == pytest.approx(0.3)
@@ -49,7 +49,8 @@ async def test_executor_with_running_loop():
     from ragas.executor import Executor
 
     loop = asyncio.new_event_loop()
-    loop.run_until_complete(asyncio.sleep(0.1))
+    # loops can't be nested without nest_asyncio, run it next to this one
+    await asyncio.to_thread(loop.run_until_complete, asyncio.sleep(0.1))
 
     async def echo_order(index: int):
         await asyncio.sleep(0.1)
@@ -67,10 +68,30 @@ async def test_executor_with_running_loop():
     assert results == list(range(1, 4))
 
 
+@pytest.mark.asyncio
+async def test_executor_results_inside_running_loop():
+    from ragas.executor import Executor
+
+    # pytest-asyncio runs this test inside an event loop, the jobs run on the
+    # executor's background loop instead of blocking this one
+    assert asyncio.get_running_loop().is_running()
+
+    async def echo_order(index: int):
+        await asyncio.sleep(0.01)
+        return index
+
+    executor = Executor()
+    for i in range(1, 4):
+        executor.submit(echo_order, i, name=f"echo_order_{i}")
+
+    assert executor.results() == list(range(1, 4))
+
+
 def test_is_event_loop_running_in_script():
     from ragas.executor import is_event_loop_running
 
-    assert is_event_loop_running() is False
+    with pytest.deprecated_call():
+        assert is_event_loop_running() is False
 
 
 def test_as_completed_in_script():
@@ -87,6 +108,143 @@ def test_as_completed_in_script():
             results.append(r)
         return results
 
-    results = asyncio.run(_run())
+    with pytest.deprecated_call():
+        results = asyncio.run(_run())
 
     assert results == [1, 2, 3]
+
+
+def test_executor_stream_yields_as_completed():
+    from ragas.executor import Executor
+
+    async def sleep_and_echo(index: int):
+        await asyncio.sleep(index / 10)
+        return index
+
+    executor = Executor()
+    for i in [3, 1, 2]:
+        executor.submit(sleep_and_echo, i, name=f"echo_{i}")
+
+    results = list(executor.stream())
+
+    # results arrive in the order they finish, tagged with job index and name
+    assert results == [(1, "echo_1", 1), (2, "echo_2", 2), (0, "echo_3", 3)]
+
+
+def test_executor_stream_stops_early():
+    from ragas.executor import Executor
+
+    async def sleep_and_echo(index: int):
+        await asyncio.sleep(index / 10)
+        return index
+
+    executor = Executor()
+    for i in range(1, 6):
+        executor.submit(sleep_and_echo, i, name=f"echo_{i}")
+
+    stream = executor.stream()
+    assert next(stream) == (0, "echo_1", 1)
+    stream.close()
+
+
+def test_executor_submit_many_is_lazy():
+    from ragas.executor import Executor
+    from ragas.run_config import RunConfig
+
+    max_workers = 2
+    in_flight = 0
+    max_in_flight = 0
+    pulled = 0
+
+    async def echo(index: int):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return index
+
+    def jobs():
+        nonlocal pulled
+        for i in range(20):
+            pulled += 1
+            # never more than max_workers jobs pulled ahead of consumption
+            assert pulled - consumed <= max_workers
+            yield echo, (i,), {}, f"echo_{i}"
+
+    executor = Executor(run_config=RunConfig(max_workers=max_workers))
+    executor.submit(echo, -1, name="first")
+    executor.submit_many(jobs(), total=20)
+    assert executor.total_jobs == 21
+
+    consumed = 0
+    results = []
+    for index, name, result in executor.stream():
+        consumed += 1
+        results.append((index, result))
+
+    assert max_in_flight <= max_workers
+    assert sorted(results) == [(0, -1)] + [(i + 1, i) for i in range(20)]
+
+
+def test_executor_time_budget():
+    import numpy as np
+
+    from ragas.executor import Executor
+    from ragas.run_config import RunConfig
+
+    async def sleep_and_echo(seconds: float):
+        await asyncio.sleep(seconds)
+        return seconds
+
+    run_config = RunConfig(max_workers=2, time_budget=0.2, time_budget_grace_period=0.1)
+    executor = Executor(run_config=run_config)
+    # job 1 outlives the grace period and job 3 never gets a free slot
+    for i, seconds in enumerate([0.01, 5, 0.25, 0.01]):
+        executor.submit(sleep_and_echo, seconds, name=f"job_{i}")
+
+    results = executor.results()
+
+    assert executor.missing_jobs == [(1, "job_1"), (3, "job_3")]
+    assert results[0] == 0.01 and results[2] == 0.25
+    assert np.isnan(results[1]) and np.isnan(results[3])
+
+
+def test_executor_starts_expensive_jobs_first():
+    from ragas.executor import Executor
+    from ragas.run_config import RunConfig
+
+    started = []
+
+    async def echo(index: int):
+        started.append(index)
+        await asyncio.sleep(0.01)
+        return index
+
+    executor = Executor(run_config=RunConfig(max_workers=1))
+    for i, cost in enumerate([1, 3, 0, 3, 2]):
+        executor.submit(echo, i, name=f"echo_{i}", expected_cost=cost)
+
+    results = executor.results()
+
+    # ties keep their submission order and results keep the submission order
+    assert started == [1, 3, 4, 0, 2]
+    assert results == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_executor_aresults_runs_on_the_callers_loop():
+    from ragas.executor import Executor
+
+    loop = asyncio.get_running_loop()
+
+    async def echo(index: int):
+        assert asyncio.get_running_loop() is loop
+        await asyncio.sleep(0.01 * (3 - index))
+        return index
+
+    executor = Executor()
+    for i in range(3):
+        executor.submit(echo, i, name=f"echo_{i}")
+
+    assert await executor.aresults() == [0, 1, 2]
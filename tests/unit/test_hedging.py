@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+from ragas.hedging import RequestHedger, get_request_hedger
+from ragas.run_config import RunConfig
+
+
+def warm_up(hedger: RequestHedger, latency: float, n: int = 20):
+    for _ in range(n):
+        hedger.record_latency(latency)
+    hedger.num_requests += n
+
+
+def test_hedge_delay_needs_enough_samples():
+    hedger = RequestHedger(min_samples=5)
+    assert hedger.hedge_delay() is None
+
+    for latency in [0.1, 0.1, 0.1, 0.1, 1.0]:
+        hedger.record_latency(latency)
+    assert 0.1 < hedger.hedge_delay() < 1.0
+
+
+def test_slow_request_is_hedged():
+    hedger = RequestHedger(max_hedge_fraction=0.5)
+    warm_up(hedger, 0.01)
+    cancelled = []
+    calls = 0
+
+    async def request():
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        try:
+            # only the first request is slow
+            await asyncio.sleep(5 if attempt == 1 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    start = time.monotonic()
+    result = asyncio.run(hedger.run(request))
+
+    assert result == 2
+    assert time.monotonic() - start < 1
+    assert cancelled == [1]
+    assert hedger.num_hedges == 1 and hedger.num_hedge_wins == 1
+
+
+def test_hedges_are_capped():
+    hedger = RequestHedger(max_hedge_fraction=0.1)
+    warm_up(hedger, 0.01)
+
+    async def request():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def _run():
+        return [await hedger.run(request) for _ in range(20)]
+
+    assert asyncio.run(_run()) == ["done"] * 20
+    assert hedger.num_hedges <= 0.1 * hedger.num_requests
+
+
+def test_failed_hedge_waits_for_the_request():
+    hedger = RequestHedger(max_hedge_fraction=0.5)
+    warm_up(hedger, 0.01)
+
+    async def request():
+        await asyncio.sleep(0.1)
+        return "slow"
+
+    async def hedge():
+        raise ValueError("hedge failed")
+
+    assert asyncio.run(hedger.run(request, hedge)) == "slow"
+
+
+def test_generate_uses_the_hedger(fake_llm):
+    from ragas.llms.prompt import PromptValue
+
+    assert get_request_hedger(fake_llm.get_model_name(), RunConfig()) is None
+    fake_llm.set_run_config(RunConfig(hedge_requests=True))
+    hedger = get_request_hedger(fake_llm.get_model_name(), fake_llm.run_config)
+    assert hedger is not None
+
+    result = asyncio.run(fake_llm.generate(PromptValue(prompt_str="hello")))
+
+    assert result.generations[0][0].text == "hello"
+    assert hedger.num_requests == 1
+
+
+def test_no_hedges_without_budget():
+    hedger = RequestHedger(max_hedge_fraction=0)
+    warm_up(hedger, 0.001)
+
+    async def request():
+        await asyncio.sleep(0.02)
+        return 1
+
+    assert asyncio.run(hedger.run(request)) == 1
+    assert hedger.num_hedges == 0
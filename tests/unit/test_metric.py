@@ -60,3 +60,20 @@ def test_single_turn_metric():
         fm.single_turn_score(SingleTurnSample(**{"user_input": "a", "response": "b"}))
         == 0
     )
+
+
+def test_expected_llm_calls():
+    from ragas.metrics import (
+        context_precision,
+        faithfulness,
+        noise_sensitivity_relevant,
+    )
+    from ragas.metrics._bleu_score import BleuScore
+
+    sample = SingleTurnSample(
+        user_input="q", response="a", reference="r", retrieved_contexts=["c1", "c2"]
+    )
+    assert BleuScore().expected_llm_calls(sample) == 0
+    assert faithfulness.expected_llm_calls(sample) == 2
+    assert context_precision.expected_llm_calls(sample) == 2
+    assert noise_sensitivity_relevant.expected_llm_calls(sample) == 7
@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.outputs import Generation, LLMResult
+
+from ragas.llms.base import BaseRagasLLM
+from ragas.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    get_rate_limiter,
+)
+from ragas.run_config import RunConfig
+
+
+def test_token_bucket_refill():
+    bucket = TokenBucket(capacity=10, period=1)
+
+    assert bucket.try_acquire(10) == 0
+    # bucket is empty so we have to wait for 5 tokens to refill
+    assert bucket.try_acquire(5) == pytest.approx(0.5, abs=0.05)
+
+
+def test_rate_limiter_waits_for_capacity():
+    limiter = RateLimiter(requests_per_minute=10)
+    # make the refill fast enough for a test: 10 requests per second
+    limiter.request_bucket = TokenBucket(capacity=10, period=1)
+
+    async def _run():
+        start = time.monotonic()
+        for _ in range(15):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(_run())
+    # first 10 pass immediately, the remaining 5 need ~0.5s
+    assert 0.4 < elapsed < 1.0
+
+
+def test_get_rate_limiter_is_shared_per_model():
+    run_config = RunConfig(requests_per_minute=100, tokens_per_minute=1000)
+
+    assert get_rate_limiter("model-a", RunConfig()) is None
+    assert get_rate_limiter("model-a", run_config) is get_rate_limiter(
+        "model-a", run_config
+    )
+    assert get_rate_limiter("model-a", run_config) is not get_rate_limiter(
+        "model-b", run_config
+    )
+
+
+def test_generate_acquires_from_rate_limiter(fake_llm):
+    from ragas.llms.prompt import PromptValue
+
+    fake_llm.set_run_config(RunConfig(requests_per_minute=60, tokens_per_minute=1000))
+    limiter = get_rate_limiter(fake_llm.get_model_name(), fake_llm.run_config)
+    assert limiter is not None and limiter.request_bucket is not None
+
+    asyncio.run(fake_llm.generate(PromptValue(prompt_str="hello world")))
+
+    assert limiter.request_bucket._tokens < 60
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FlakyLLM(BaseRagasLLM):
+    """Fails with a 429 `failures` times before answering."""
+
+    def __init__(self, model: str, failures: int):
+        self.model = model
+        self.failures = failures
+        self.calls = 0
+        self.set_run_config(RunConfig())
+
+    def get_model_name(self) -> str:
+        return self.model
+
+    def generate_text(self, prompt, n=1, temperature=1e-8, stop=None, callbacks=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RateLimitError("slow down")
+        return LLMResult(generations=[[Generation(text=prompt.to_string())]])
+
+    async def agenerate_text(
+        self, prompt, n=1, temperature=None, stop=None, callbacks=None
+    ):
+        return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+
+@pytest.mark.parametrize("is_async", [True, False])
+def test_every_retry_acquires_from_rate_limiter(is_async):
+    from ragas.llms.prompt import PromptValue
+
+    llm = FlakyLLM(f"flaky-{is_async}", failures=3)
+    llm.set_run_config(
+        RunConfig(requests_per_minute=60, tokens_per_minute=6000, max_wait=0)
+    )
+    limiter = get_rate_limiter(llm.get_model_name(), llm.run_config)
+    assert limiter is not None
+    assert limiter.request_bucket is not None and limiter.token_bucket is not None
+
+    prompt = PromptValue(prompt_str="hello world " * 200)
+    asyncio.run(llm.generate(prompt, is_async=is_async))
+
+    assert llm.calls == 4
+    # one request and its tokens per attempt, the refill is ~1 request/second
+    assert 60 - limiter.request_bucket._tokens == pytest.approx(4, abs=0.5)
+    num_tokens = estimate_tokens(prompt.to_string(), llm.get_model_name())
+    assert 6000 - limiter.token_bucket._tokens == pytest.approx(
+        4 * num_tokens, abs=num_tokens / 2
+    )
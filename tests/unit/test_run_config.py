@@ -82,3 +82,101 @@ def test_random_num_generator(
                 )
             )
         )
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = type("Response", (), {"headers": headers})()
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after": "7"}, 7),
+        ({"retry-after-ms": "250", "retry-after": "7"}, 0.25),
+        (
+            {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "1m30s",
+                "x-ratelimit-remaining-tokens": "1000",
+                "x-ratelimit-reset-tokens": "20ms",
+            },
+            90,
+        ),
+        ({"x-ratelimit-reset-tokens": "1.5s"}, 1.5),
+        ({}, None),
+        ({"retry-after": "soon"}, None),
+    ],
+)
+def test_get_retry_after(headers, expected):
+    from ragas.run_config import get_retry_after
+
+    assert get_retry_after(FakeRateLimitError(headers)) == expected
+    assert get_retry_after(ValueError()) is None
+
+
+def test_retry_waits_as_long_as_the_provider_asks():
+    from tenacity import RetryCallState, Retrying, wait_fixed
+
+    from ragas.run_config import wait_retry_after
+
+    wait = wait_retry_after(fallback=wait_fixed(3), jitter=0.1)
+
+    def wait_for(exc):
+        state = RetryCallState(Retrying(), fn=None, args=(), kwargs={})
+        state.set_exception((type(exc), exc, None))
+        return wait(state)
+
+    assert 2 <= wait_for(FakeRateLimitError({"retry-after": "2"})) <= 2.2
+    assert wait_for(FakeRateLimitError({})) == 3
+
+    # long waits are capped at max_wait
+    capped = wait_retry_after(fallback=wait_fixed(3), max_wait=60)
+    state = RetryCallState(Retrying(), fn=None, args=(), kwargs={})
+    exc = FakeRateLimitError({"retry-after": "3600"})
+    state.set_exception((type(exc), exc, None))
+    assert capped(state) == 60
+
+
+def test_retry_budget_limits_retries():
+    from ragas.retry_budget import RetryBudget
+
+    budget = RetryBudget(ratio=0.5, window=60, min_retries=1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    for _ in range(4):
+        budget.record_success()
+    assert budget.available == 2
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.num_rejected == 2
+
+
+def test_exhausted_retry_budget_fails_fast():
+    import asyncio
+
+    from ragas.exceptions import RetryBudgetExhausted
+    from ragas.run_config import add_async_retry
+
+    run_config = RunConfig(max_wait=0, max_retries=5, retry_budget=0.1)
+    assert run_config.retry_budget_tracker is not None
+    run_config.retry_budget_tracker.min_retries = 2
+    calls = 0
+
+    async def failing_call():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("provider is down")
+
+    call_with_retry = add_async_retry(failing_call, run_config)
+    with pytest.raises(RetryBudgetExhausted) as exc_info:
+        asyncio.run(call_with_retry())
+
+    # the first call and the two retries in the budget
+    assert calls == 3
+    assert isinstance(exc_info.value.error, ConnectionError)
+    with pytest.raises(RetryBudgetExhausted):
+        asyncio.run(call_with_retry())
+    assert calls == 4
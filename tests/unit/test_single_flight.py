@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from ragas.run_config import RunConfig
+from ragas.single_flight import SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        await asyncio.sleep(0.05)
+        return {"attempt": attempt}
+
+    async def _run():
+        return await asyncio.gather(
+            single_flight.do("a", fetch),
+            single_flight.do("a", fetch),
+            single_flight.do("b", fetch),
+        )
+
+    first, second, other = asyncio.run(_run())
+
+    assert calls == 2
+    assert first == second and first is not second
+    assert other["attempt"] != first["attempt"]
+    assert single_flight.num_coalesced == 1
+
+    # nothing is in flight anymore so the next call is made
+    asyncio.run(single_flight.do("a", fetch))
+    assert calls == 3
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def _run():
+        leader = asyncio.ensure_future(single_flight.do("a", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("a", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(_run()) == "done"
+
+
+def test_errors_are_shared():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    async def _run():
+        return await asyncio.gather(
+            single_flight.do("a", fail),
+            single_flight.do("a", fail),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, ValueError) for r in asyncio.run(_run()))
+
+
+@pytest.mark.parametrize(
+    "deduplicate_requests, expected_calls", [(True, 1), (False, 3)]
+)
+def test_generate_coalesces_identical_prompts(
+    fake_llm, deduplicate_requests, expected_calls
+):
+    from ragas.llms.prompt import PromptValue
+
+    calls = 0
+    generate_text = fake_llm.generate_text
+
+    async def slow_agenerate_text(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return generate_text(*args, **kwargs)
+
+    fake_llm.agenerate_text = slow_agenerate_text
+    fake_llm.set_run_config(RunConfig(deduplicate_requests=deduplicate_requests))
+    prompt = PromptValue(prompt_str="same prompt")
+
+    async def _run():
+        return await asyncio.gather(*[fake_llm.generate(prompt) for _ in range(3)])
+
+    results = asyncio.run(_run())
+
+    assert calls == expected_calls
+    assert [r.generations[0][0].text for r in results] == ["same prompt"] * 3